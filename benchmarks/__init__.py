@@ -0,0 +1 @@
+"""Performance benchmarks for the MCP Prompt Server (run with `python -m benchmarks`)."""
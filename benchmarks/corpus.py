@@ -0,0 +1,115 @@
+"""
+Synthetic Catalog Generator
+
+Writes a prompts/ and resources/ tree of markdown documents with valid
+frontmatter, so loading, rendering and listing can be measured at catalog
+scale without a real catalog.
+"""
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+RESOURCE_NAME_SHAPES = ["flat", "slashed", "namespaced"]
+
+# Repeated to build bodies of the requested size
+FILLER_PARAGRAPH = (
+    "## Guidelines\n\n"
+    "Review the change carefully and explain the reasoning behind each "
+    "suggestion. Prefer small, focused edits and keep the existing style.\n\n"
+    "- Check error handling paths\n"
+    "- Verify inputs are validated\n"
+    "- Confirm the tests cover the change\n\n"
+)
+
+
+@dataclass
+class CorpusSpec:
+    """Shape of a generated catalog."""
+    prompts: int = 1000
+    resources: int = 200
+    body_bytes: int = 4096
+    arguments: int = 3
+    resource_name_shape: str = "flat"
+    seed: int = 0
+
+
+def make_body(size: int, argument_names: list[str], rng: random.Random) -> str:
+    """Build a markdown body of roughly size bytes with argument placeholders spread through it."""
+    paragraphs = []
+    total = 0
+    while total < size:
+        paragraphs.append(FILLER_PARAGRAPH)
+        total += len(FILLER_PARAGRAPH)
+        if argument_names:
+            placeholder = f"Context: {{{rng.choice(argument_names)}}}\n\n"
+            paragraphs.append(placeholder)
+            total += len(placeholder)
+    return ''.join(paragraphs)[:max(size, 0)] + '\n'
+
+
+def make_prompt(index: int, spec: CorpusSpec, rng: random.Random) -> str:
+    """Render one prompt file (frontmatter and body)."""
+    argument_names = [f"arg_{i}" for i in range(spec.arguments)]
+    lines = [
+        "---",
+        f"name: bench-prompt-{index}",
+        f"description: Synthetic benchmark prompt number {index}",
+    ]
+    if argument_names:
+        lines.append("arguments:")
+        for i, arg_name in enumerate(argument_names):
+            lines.append(f"  - name: {arg_name}")
+            lines.append(f"    description: Synthetic argument {arg_name}")
+            lines.append(f"    required: {'true' if i == 0 else 'false'}")
+    lines.append("---")
+    return '\n'.join(lines) + '\n' + make_body(spec.body_bytes, argument_names, rng)
+
+
+def resource_name(index: int, shape: str) -> str:
+    """Build a resource name in the requested shape."""
+    if shape == "slashed":
+        return f"docs/section-{index % 10}/item-{index}"
+    if shape == "namespaced":
+        return f"ref-area-{index % 10}-item-{index}"
+    return f"ref-item-{index}"
+
+
+def make_resource(index: int, spec: CorpusSpec, rng: random.Random) -> str:
+    """Render one resource file (frontmatter and body)."""
+    return (
+        "---\n"
+        f"name: {resource_name(index, spec.resource_name_shape)}\n"
+        f"description: Synthetic benchmark resource number {index}\n"
+        "---\n"
+        + make_body(spec.body_bytes, [], rng)
+    )
+
+
+def generate_corpus(root: Path, spec: CorpusSpec) -> tuple[Path, Path]:
+    """
+    Write a synthetic catalog under root.
+
+    Args:
+        root: Directory to create prompts/ and resources/ in
+        spec: Corpus shape
+
+    Returns:
+        Tuple of (prompts_dir, resources_dir)
+    """
+    if spec.resource_name_shape not in RESOURCE_NAME_SHAPES:
+        raise ValueError(f"Unknown resource name shape: {spec.resource_name_shape}")
+
+    rng = random.Random(spec.seed)
+    prompts_dir = root / "prompts"
+    resources_dir = root / "resources"
+    prompts_dir.mkdir(parents=True, exist_ok=True)
+    resources_dir.mkdir(parents=True, exist_ok=True)
+
+    for index in range(spec.prompts):
+        (prompts_dir / f"bench-prompt-{index}.md").write_text(make_prompt(index, spec, rng), encoding='utf-8')
+
+    for index in range(spec.resources):
+        (resources_dir / f"ref-{index}.md").write_text(make_resource(index, spec, rng), encoding='utf-8')
+
+    return prompts_dir, resources_dir
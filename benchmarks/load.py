@@ -0,0 +1,512 @@
+"""
+End-to-End Load Generator
+
+Launches the real server through main() and drives concurrent simulated
+client sessions against it, to see how the whole stack (transport, MCP
+request handling, handlers) behaves under concurrency:
+
+- stdio: every session spawns its own server process, as MCP clients do
+- streamable-http: one server process on a free localhost port, shared by
+  every session
+
+Each session picks operations from a weighted mix of list_prompts,
+get_prompt (with values for every declared argument), read_resource and
+ping until the run duration elapses. The server serves a synthetic catalog
+(see corpus.py) mounted with --catalog next to its own prompts and
+resources, so targets come from its real list results.
+
+The report gives, per transport: throughput, p50/p95/p99 latency per
+operation and overall, error counts and rates, session start-up time, and
+a timeline of requests, errors and the server processes' RSS sampled while
+the load runs:
+
+    uv run python -m benchmarks.load --sessions 16 --duration 30 --output load.json
+    uv run python -m benchmarks.load --transport streamable-http --server-args="--workers 4"
+
+Everything runs locally; no external services are needed.
+"""
+
+import os
+import sys
+import json
+import time
+import shlex
+import random
+import signal
+import socket
+import asyncio
+import logging
+import argparse
+import platform
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import anyio
+from mcp import ClientSession
+from mcp.client.stdio import stdio_client, StdioServerParameters
+from mcp.client.streamable_http import streamablehttp_client
+
+from .corpus import CorpusSpec, generate_corpus, RESOURCE_NAME_SHAPES
+from .run import summarize, argument_values, package_version
+
+RESULT_FORMAT_VERSION = 1
+
+TRANSPORTS = ["stdio", "streamable-http"]
+OPERATIONS = ["list_prompts", "get_prompt", "read_resource", "ping"]
+DEFAULT_MIX = "list_prompts=1,get_prompt=6,read_resource=3,ping=1"
+
+# Namespace the synthetic catalog is mounted under
+CATALOG_NAMESPACE = "load"
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Runs main() from the repository checkout, whatever is installed
+SERVER_BOOTSTRAP = "import sys; from src.server import main; sys.exit(main(sys.argv[1:]))"
+
+SERVER_START_TIMEOUT = 60.0
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """
+    Parse an operation mix such as "get_prompt=6,ping=1" into weights.
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is invalid
+    """
+    mix = {}
+    for item in spec.split(','):
+        operation, separator, weight = item.strip().partition('=')
+        if operation not in OPERATIONS:
+            raise ValueError(f"unknown operation '{operation}' (expected one of {', '.join(OPERATIONS)})")
+        try:
+            mix[operation] = float(weight) if separator else 1.0
+        except ValueError:
+            raise ValueError(f"invalid weight for '{operation}': {weight}")
+        if mix[operation] < 0:
+            raise ValueError(f"negative weight for '{operation}'")
+    if not any(mix.values()):
+        raise ValueError("the mix needs at least one operation with a positive weight")
+    return mix
+
+
+def process_tree(root_pid: int) -> list[int]:
+    """Return the pids of every descendant of root_pid."""
+    children: dict[int, list[int]] = {}
+    if Path("/proc").is_dir():
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            try:
+                stat = Path(entry.path, "stat").read_text()
+            except OSError:
+                continue
+            # The command name may contain spaces, so split after its closing paren
+            ppid = int(stat.rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry.name))
+    else:
+        output = subprocess.run(["ps", "-A", "-o", "pid=,ppid="], capture_output=True, text=True).stdout
+        for line in output.splitlines():
+            pid, ppid = line.split()
+            children.setdefault(int(ppid), []).append(int(pid))
+
+    pids = []
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    return pids
+
+
+def rss_bytes(pid: int) -> int:
+    """Return the resident set size of a process (0 if it has exited)."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+        return 0
+    except FileNotFoundError:
+        if Path("/proc").is_dir():
+            return 0
+    output = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True).stdout.strip()
+    return int(output) * 1024 if output else 0
+
+
+def describe(error: BaseException) -> str:
+    """Describe an error for the report, looking inside task group exception groups."""
+    while isinstance(error, BaseExceptionGroup) and error.exceptions:
+        error = error.exceptions[0]
+    return f"{type(error).__name__}: {error}"[:200]
+
+
+@dataclass
+class LoadStats:
+    """Request outcomes collected from every session of one run."""
+    samples: dict[str, list[int]] = field(default_factory=lambda: {op: [] for op in OPERATIONS})
+    errors: dict[str, int] = field(default_factory=lambda: {op: 0 for op in OPERATIONS})
+    error_messages: dict[str, int] = field(default_factory=dict)
+    session_start: list[int] = field(default_factory=list)
+    sessions_failed: int = 0
+    completed: int = 0
+    failed: int = 0
+
+    def record(self, operation: str, elapsed_ns: int, error: Exception | None) -> None:
+        if error is None:
+            self.samples[operation].append(elapsed_ns)
+            self.completed += 1
+            return
+        self.errors[operation] += 1
+        self.failed += 1
+        message = describe(error)
+        self.error_messages[message] = self.error_messages.get(message, 0) + 1
+
+
+class LoadRun:
+    """
+    One load run against one transport.
+
+    Sessions connect and warm up first; the measured window starts once every
+    session is ready (or has failed), so slow process start-up does not
+    count against throughput.
+    """
+
+    def __init__(self, args: argparse.Namespace, mix: dict[str, float]):
+        self.args = args
+        self.operations = [op for op, weight in mix.items() if weight > 0]
+        self.weights = [mix[op] for op in self.operations]
+        self.stats = LoadStats()
+        self.timeline: list[dict] = []
+        self._pending = args.sessions
+        self._ready = asyncio.Event()
+        self._start = 0.0
+        self._deadline = 0.0
+
+    def _session_ready(self) -> None:
+        self._pending -= 1
+        if self._pending == 0:
+            self._start = time.perf_counter()
+            self._deadline = self._start + self.args.duration
+            self._ready.set()
+
+    async def _targets(self, client: ClientSession) -> tuple[list, list[str]]:
+        """List the catalog once, returning the prompt calls and resource URIs to request."""
+        prompts = (await client.list_prompts()).prompts
+        prompt_calls = [(prompt.name, argument_values(prompt.arguments)) for prompt in prompts]
+        resource_uris = [str(resource.uri) for resource in (await client.list_resources()).resources]
+        return prompt_calls, resource_uris
+
+    async def _drive(self, client: ClientSession, index: int, prompt_calls: list, resource_uris: list[str]) -> None:
+        """Issue requests from the mix until the deadline."""
+        rng = random.Random(self.args.seed + index)
+        requests = {
+            "list_prompts": lambda: client.list_prompts(),
+            "get_prompt": lambda: client.get_prompt(*rng.choice(prompt_calls)),
+            "read_resource": lambda: client.read_resource(rng.choice(resource_uris)),
+            "ping": lambda: client.send_ping(),
+        }
+        if not prompt_calls:
+            requests["get_prompt"] = requests["list_prompts"]
+        if not resource_uris:
+            requests["read_resource"] = requests["list_prompts"]
+
+        while time.perf_counter() < self._deadline:
+            operation = rng.choices(self.operations, self.weights)[0]
+            error = None
+            start = time.perf_counter_ns()
+            try:
+                with anyio.fail_after(self.args.request_timeout):
+                    await requests[operation]()
+            except Exception as e:
+                error = e
+            self.stats.record(operation, time.perf_counter_ns() - start, error)
+
+    async def _session(self, index: int, connect) -> None:
+        start = time.perf_counter_ns()
+        ready = False
+        try:
+            async with connect() as streams:
+                async with ClientSession(streams[0], streams[1]) as client:
+                    await client.initialize()
+                    targets = await self._targets(client)
+                    self.stats.session_start.append(time.perf_counter_ns() - start)
+                    self._session_ready()
+                    ready = True
+                    await self._ready.wait()
+                    await self._drive(client, index, *targets)
+        except Exception as e:
+            self.stats.sessions_failed += 1
+            message = f"session: {describe(e)}"
+            self.stats.error_messages[message] = self.stats.error_messages.get(message, 0) + 1
+            if not ready:
+                self._session_ready()
+
+    async def _sample(self) -> None:
+        """Record requests, errors and server RSS every sample interval."""
+        own_pid = os.getpid()
+        while True:
+            pids = process_tree(own_pid)
+            now = time.perf_counter()
+            self.timeline.append({
+                "t": round(now - self._start, 3) if self._ready.is_set() else None,
+                "requests": self.stats.completed,
+                "errors": self.stats.failed,
+                "server_processes": len(pids),
+                "rss_bytes": sum(rss_bytes(pid) for pid in pids),
+            })
+            await asyncio.sleep(self.args.sample_interval)
+
+    async def run(self, connect) -> dict:
+        sampler = asyncio.create_task(self._sample())
+        try:
+            await asyncio.gather(*(self._session(i, connect) for i in range(self.args.sessions)))
+        finally:
+            sampler.cancel()
+        elapsed = (time.perf_counter() - self._start) if self._ready.is_set() else 0.0
+        return self.report(elapsed)
+
+    def report(self, elapsed: float) -> dict:
+        stats = self.stats
+        total = stats.completed + stats.failed
+
+        def measured(samples: list[int]) -> dict | None:
+            if not samples:
+                return None
+            summary = summarize(samples)
+            # Requests overlap, so the rate is over wall-clock time, not summed latency
+            summary["ops_per_sec"] = len(samples) / elapsed if elapsed else None
+            return summary
+
+        operations = {}
+        for operation in self.operations:
+            count = len(stats.samples[operation]) + stats.errors[operation]
+            operations[operation] = {
+                "requests": count,
+                "errors": stats.errors[operation],
+                "error_rate": stats.errors[operation] / count if count else 0.0,
+                "latency": measured(stats.samples[operation]),
+            }
+
+        # Per-interval rates from the cumulative counters
+        timeline = []
+        previous = None
+        for point in self.timeline:
+            entry = dict(point)
+            if previous is not None and point["t"] is not None and previous["t"] is not None:
+                interval = point["t"] - previous["t"]
+                entry["requests_per_sec"] = round((point["requests"] - previous["requests"]) / interval, 1) if interval else None
+                entry["errors_per_sec"] = round((point["errors"] - previous["errors"]) / interval, 1) if interval else None
+            timeline.append(entry)
+            previous = point
+
+        rss = [point["rss_bytes"] for point in self.timeline if point["t"] is not None]
+        return {
+            "sessions": self.args.sessions,
+            "sessions_failed": stats.sessions_failed,
+            "duration_s": round(elapsed, 3),
+            "requests": total,
+            "errors": stats.failed,
+            "error_rate": stats.failed / total if total else 0.0,
+            "throughput_rps": total / elapsed if elapsed else None,
+            "latency": measured([s for samples in stats.samples.values() for s in samples]),
+            "operations": operations,
+            "session_start": summarize(stats.session_start) if stats.session_start else None,
+            "rss_peak_bytes": max(rss, default=None),
+            "rss_final_bytes": rss[-1] if rss else None,
+            "error_messages": dict(sorted(stats.error_messages.items(), key=lambda item: -item[1])),
+            "timeline": timeline,
+        }
+
+
+def free_port(host: str) -> int:
+    """Ask the OS for a free TCP port on host."""
+    with socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(host: str, port: int, process: subprocess.Popen, timeout: float) -> None:
+    """
+    Wait until the server accepts connections.
+
+    Raises:
+        RuntimeError: If the server exits or does not start listening in time
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before listening")
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server did not listen on {host}:{port} within {timeout:.0f}s")
+
+
+def run_stdio(args: argparse.Namespace, mix: dict[str, float], server_args: list[str]) -> dict:
+    """Drive sessions that each spawn their own stdio server."""
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-c", SERVER_BOOTSTRAP, *server_args],
+        cwd=REPO_ROOT
+    )
+
+    with open(os.devnull, 'w') as errlog:
+        load = LoadRun(args, mix)
+        return asyncio.run(load.run(lambda: stdio_client(params, errlog=errlog)))
+
+
+def run_http(args: argparse.Namespace, mix: dict[str, float], server_args: list[str]) -> dict:
+    """Drive sessions against one streamable HTTP server."""
+    host = "127.0.0.1"
+    port = free_port(host)
+    command = [
+        sys.executable, "-c", SERVER_BOOTSTRAP,
+        "--transport", "streamable-http", "--host", host, "--port", str(port),
+        *server_args
+    ]
+    process = subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(host, port, process, SERVER_START_TIMEOUT)
+        url = f"http://{host}:{port}/mcp"
+        load = LoadRun(args, mix)
+        return asyncio.run(load.run(lambda: streamablehttp_client(url)))
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def print_summary(transport: str, result: dict) -> None:
+    """Print a one-screen summary of a run to stderr."""
+    out = sys.stderr
+    latency = result["latency"] or {}
+    print(
+        f"{transport}: {result['sessions']} sessions, {result['requests']} requests in {result['duration_s']}s, "
+        f"{result['throughput_rps'] or 0:.0f} req/s, errors {result['errors']} ({result['error_rate']:.2%}), "
+        f"p50 {latency.get('p50_us', 0) / 1000:.2f}ms p99 {latency.get('p99_us', 0) / 1000:.2f}ms, "
+        f"peak RSS {(result['rss_peak_bytes'] or 0) / 2**20:.1f}MB",
+        file=out
+    )
+    for operation, entry in result["operations"].items():
+        latency = entry["latency"] or {}
+        print(
+            f"  {operation:<14} {entry['requests']:8} requests  errors {entry['errors']:5}  "
+            f"p50 {latency.get('p50_us', 0) / 1000:8.2f}ms  p99 {latency.get('p99_us', 0) / 1000:8.2f}ms",
+            file=out
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    defaults = CorpusSpec(prompts=500, resources=100)
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        description="Drive concurrent MCP sessions against the server and report throughput, latency and RSS"
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS + ["all"],
+        default="all",
+        help="Transport to load (default: all)"
+    )
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent client sessions")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per transport")
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"Weighted operation mix (default: {DEFAULT_MIX})"
+    )
+    parser.add_argument("--request-timeout", type=float, default=30.0, help="Seconds before a request counts as failed")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Seconds between timeline samples")
+    parser.add_argument(
+        "--server-args",
+        default="",
+        help='Extra server options, e.g. --server-args="--lazy-bodies --workers 4"'
+    )
+    parser.add_argument("--prompts", type=int, default=defaults.prompts, help="Prompts in the synthetic catalog")
+    parser.add_argument("--resources", type=int, default=defaults.resources, help="Resources in the synthetic catalog")
+    parser.add_argument("--body-bytes", type=int, default=defaults.body_bytes, help="Body size per document")
+    parser.add_argument("--arguments", type=int, default=defaults.arguments, help="Arguments per prompt")
+    parser.add_argument(
+        "--resource-name-shape",
+        choices=RESOURCE_NAME_SHAPES,
+        default=defaults.resource_name_shape,
+        help="Shape of resource names"
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed for the corpus and the mix")
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    if args.duration <= 0 or args.sample_interval <= 0 or args.request_timeout <= 0:
+        parser.error("--duration, --sample-interval and --request-timeout must be positive")
+    try:
+        args.mix_weights = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(f"invalid --mix: {e}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load generator and emit JSON results."""
+    args = parse_args(argv)
+
+    # Client-side request logs would dominate the output
+    logging.getLogger().setLevel(logging.WARNING)
+
+    spec = CorpusSpec(
+        prompts=args.prompts,
+        resources=args.resources,
+        body_bytes=args.body_bytes,
+        arguments=args.arguments,
+        resource_name_shape=args.resource_name_shape,
+        seed=args.seed
+    )
+    transports = TRANSPORTS if args.transport == "all" else [args.transport]
+    runners = {"stdio": run_stdio, "streamable-http": run_http}
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="mcp-prompt-load-") as workdir:
+        generate_corpus(Path(workdir), spec)
+        server_args = ["--catalog", f"{CATALOG_NAMESPACE}={workdir}", *shlex.split(args.server_args)]
+        for transport in transports:
+            try:
+                results[transport] = runners[transport](args, args.mix_weights, server_args)
+            except RuntimeError as e:
+                print(f"{transport}: {e}", file=sys.stderr)
+                return 1
+            print_summary(transport, results[transport])
+
+    report = {
+        "format_version": RESULT_FORMAT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "package_version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": vars(spec),
+        "sessions": args.sessions,
+        "duration_s": args.duration,
+        "mix": args.mix_weights,
+        "server_args": args.server_args,
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + '\n', encoding='utf-8')
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
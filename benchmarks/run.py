@@ -0,0 +1,273 @@
+"""
+Benchmark Runner
+
+Generates a synthetic catalog and measures the server's hot paths:
+
+- parse_frontmatter per document
+- load_documents for the whole prompts/ directory (eager and header-only)
+- memory retained per loaded document (eager and header-only)
+- startup registration, as done by main()
+- prompt rendering through create_prompt_handler handlers
+- list_prompts / get_prompt / read_resource through an in-process FastMCP
+  server and client session (full MCP request handling, no transport)
+
+Results are written as JSON so runs can be compared between releases:
+
+    uv run python -m benchmarks --prompts 5000 --body-bytes 16384 --output bench.json
+"""
+
+import json
+import time
+import asyncio
+import logging
+import argparse
+import platform
+import statistics
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import Callable
+
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from src.utils import parse_frontmatter, load_documents
+from src.prompts import load_markdown_prompts
+from src.resources import load_resource_documents
+from src.server import create_prompt_handler, register_prompt, register_resource, resource_uri_for
+from .corpus import CorpusSpec, generate_corpus, RESOURCE_NAME_SHAPES
+
+RESULT_FORMAT_VERSION = 1
+
+
+def summarize(samples_ns: list[int]) -> dict:
+    """Summarize timing samples (nanoseconds) into comparable statistics."""
+    samples = sorted(samples_ns)
+    count = len(samples)
+
+    def percentile(p: float) -> float:
+        index = min(count - 1, max(0, round(p / 100 * count) - 1))
+        return samples[index] / 1000
+
+    total_ns = sum(samples)
+    return {
+        "count": count,
+        "total_s": total_ns / 1e9,
+        "mean_us": statistics.fmean(samples) / 1000,
+        "min_us": samples[0] / 1000,
+        "p50_us": percentile(50),
+        "p95_us": percentile(95),
+        "p99_us": percentile(99),
+        "max_us": samples[-1] / 1000,
+        "ops_per_sec": count / (total_ns / 1e9) if total_ns else None,
+    }
+
+
+def time_each(fn: Callable[[], object], iterations: int) -> list[int]:
+    """Call fn iterations times and return per-call durations in nanoseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def argument_values(arguments) -> dict[str, str]:
+    """Build argument values for a prompt's declared arguments."""
+    return {arg.name: f"value for {arg.name}" for arg in arguments or []}
+
+
+def register_catalog(prompts_data: dict, resources_data: dict) -> FastMCP:
+    """Register a loaded catalog on a fresh server, as main() does."""
+    mcp = FastMCP("file-prompts")
+    for name, (parsed_doc, _) in prompts_data.items():
+        register_prompt(mcp, name, parsed_doc)
+    for name, (parsed_doc, _) in resources_data.items():
+        register_resource(mcp, name, parsed_doc)
+    return mcp
+
+
+def bench_parse(prompts_dir: Path, rounds: int) -> dict:
+    contents = [path.read_text(encoding='utf-8') for path in sorted(prompts_dir.glob('*.md'))]
+    samples = []
+    for _ in range(rounds):
+        for content in contents:
+            start = time.perf_counter_ns()
+            parse_frontmatter(content, parse_arguments=True)
+            samples.append(time.perf_counter_ns() - start)
+    return summarize(samples)
+
+
+def bench_load(prompts_dir: Path, rounds: int, **options) -> dict:
+    return summarize(time_each(
+        lambda: load_documents(prompts_dir, ['.md'], document_type="prompt", parse_arguments=True, **options),
+        rounds
+    ))
+
+
+def measure_memory(prompts_dir: Path, **options) -> dict:
+    """Measure memory retained by load_documents() per loaded document."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        documents = load_documents(prompts_dir, ['.md'], document_type="prompt", parse_arguments=True, **options)
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    count = len(documents)
+    return {
+        "documents": count,
+        "retained_bytes": retained,
+        "bytes_per_document": retained / count if count else None,
+    }
+
+
+def bench_register(prompts_data: dict, resources_data: dict, rounds: int) -> dict:
+    return summarize(time_each(lambda: register_catalog(prompts_data, resources_data), rounds))
+
+
+def bench_render(prompts_data: dict, iterations: int) -> dict:
+    calls = []
+    for parsed_doc, _ in prompts_data.values():
+        handler = create_prompt_handler(
+            content=parsed_doc.content,
+            description=parsed_doc.description,
+            arguments=parsed_doc.arguments
+        )
+        calls.append((handler, argument_values(parsed_doc.arguments)))
+
+    samples = []
+    for i in range(iterations):
+        handler, values = calls[i % len(calls)]
+        start = time.perf_counter_ns()
+        handler(**values)
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples)
+
+
+async def bench_server(mcp: FastMCP, prompts_data: dict, resources_data: dict, rounds: int, iterations: int) -> dict:
+    """Measure MCP requests through an in-memory client session."""
+    prompt_calls = [(name, argument_values(doc.arguments)) for name, (doc, _) in prompts_data.items()]
+    resource_uris = [resource_uri_for(name) for name in resources_data]
+    results = {}
+
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter_ns()
+            await client.list_prompts()
+            samples.append(time.perf_counter_ns() - start)
+        results["list_prompts"] = summarize(samples)
+
+        samples = []
+        for i in range(iterations):
+            name, values = prompt_calls[i % len(prompt_calls)]
+            start = time.perf_counter_ns()
+            await client.get_prompt(name, values)
+            samples.append(time.perf_counter_ns() - start)
+        results["get_prompt"] = summarize(samples)
+
+        if resource_uris:
+            samples = []
+            for i in range(iterations):
+                start = time.perf_counter_ns()
+                await client.read_resource(resource_uris[i % len(resource_uris)])
+                samples.append(time.perf_counter_ns() - start)
+            results["read_resource"] = summarize(samples)
+
+    return results
+
+
+def run_benchmarks(spec: CorpusSpec, rounds: int, iterations: int, workdir: Path) -> dict:
+    """Generate the corpus in workdir and run every benchmark."""
+    prompts_dir, resources_dir = generate_corpus(workdir, spec)
+
+    results = {}
+    results["parse_frontmatter"] = bench_parse(prompts_dir, rounds)
+    results["load_documents"] = bench_load(prompts_dir, rounds)
+    results["load_documents_header_only"] = bench_load(prompts_dir, rounds, header_only=True)
+    results["memory"] = measure_memory(prompts_dir)
+    results["memory_header_only"] = measure_memory(prompts_dir, header_only=True)
+
+    prompts_data = load_markdown_prompts(prompts_dir)
+    resources_data = load_resource_documents(resources_dir)
+
+    results["register_catalog"] = bench_register(prompts_data, resources_data, rounds)
+    results["render_prompt"] = bench_render(prompts_data, iterations)
+
+    mcp = register_catalog(prompts_data, resources_data)
+    results.update(asyncio.run(bench_server(mcp, prompts_data, resources_data, rounds, iterations)))
+
+    return results
+
+
+def package_version() -> str:
+    try:
+        return version("mcp-prompt-server")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the MCP Prompt Server")
+    parser.add_argument("--prompts", type=int, default=defaults.prompts, help="Number of prompt files")
+    parser.add_argument("--resources", type=int, default=defaults.resources, help="Number of resource files")
+    parser.add_argument("--body-bytes", type=int, default=defaults.body_bytes, help="Body size per document")
+    parser.add_argument("--arguments", type=int, default=defaults.arguments, help="Arguments per prompt")
+    parser.add_argument(
+        "--resource-name-shape",
+        choices=RESOURCE_NAME_SHAPES,
+        default=defaults.resource_name_shape,
+        help="Shape of resource names"
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed for the corpus")
+    parser.add_argument("--rounds", type=int, default=3, help="Repeats for whole-catalog benchmarks")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls for per-request benchmarks")
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite and emit JSON results."""
+    args = parse_args(argv)
+
+    # Loader warnings and per-request INFO logs would dominate the output
+    logging.getLogger().setLevel(logging.WARNING)
+
+    spec = CorpusSpec(
+        prompts=args.prompts,
+        resources=args.resources,
+        body_bytes=args.body_bytes,
+        arguments=args.arguments,
+        resource_name_shape=args.resource_name_shape,
+        seed=args.seed
+    )
+
+    with tempfile.TemporaryDirectory(prefix="mcp-prompt-bench-") as workdir:
+        results = run_benchmarks(spec, args.rounds, args.iterations, Path(workdir))
+
+    report = {
+        "format_version": RESULT_FORMAT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "package_version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": vars(spec),
+        "rounds": args.rounds,
+        "iterations": args.iterations,
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + '\n', encoding='utf-8')
+    else:
+        print(output)
+
+    return 0
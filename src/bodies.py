@@ -0,0 +1,150 @@
+"""
+Lazy Body Loading Module
+
+Fetches document bodies from disk on first use and keeps the most recently
+used ones in an LRU cache bounded by a byte budget, so resident memory
+tracks the hot set instead of the whole catalog.
+
+Bodies are read with a bounded read at the offset recorded when the
+frontmatter was indexed. If the file changed since it was indexed, the body
+is re-extracted from the current file content instead.
+
+SECURITY:
+- Files are opened with O_NOFOLLOW where available, so a file swapped for a
+  symlink after indexing is not followed.
+- Reads are bounded by the indexed body length (or the size limit on fallback).
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from .utils import BodyRef, split_frontmatter, DEFAULT_MAX_FILE_SIZE_BYTES
+from .compression import CompressedBody
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_BODY_CACHE_BYTES = 64 * 1024 * 1024  # 64MB of hot bodies
+
+
+def _decode(data: bytes) -> str:
+    """Decode body bytes the same way Path.read_text() does (universal newlines)."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def read_body(ref: BodyRef, max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES) -> str:
+    """
+    Read a document body from disk (or decompress an in-memory body).
+
+    Args:
+        ref: The body location recorded at index time
+        max_file_size: Size limit applied if the whole file must be re-read
+
+    Returns:
+        The body text
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is no longer valid UTF-8 or lost its frontmatter
+    """
+    if isinstance(ref, CompressedBody):
+        return ref.read()
+
+    fd = os.open(ref.path, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    with os.fdopen(fd, 'rb') as f:
+        stat = os.fstat(f.fileno())
+
+        if stat.st_size == ref.file_size and stat.st_mtime_ns == ref.mtime_ns:
+            f.seek(ref.offset)
+            return _decode(f.read(ref.length))
+
+        # File changed since it was indexed: the offset may be stale
+        if stat.st_size > max_file_size:
+            raise ValueError(f"file exceeds size limit ({stat.st_size} > {max_file_size} bytes)")
+        _, body = split_frontmatter(_decode(f.read()))
+        return body
+
+
+class BodyStore:
+    """
+    LRU cache of document bodies with a byte budget.
+
+    Values are cached after an optional build step (e.g. template
+    compilation), so the work of turning a body into its served form is
+    also only done once while the body stays hot.
+
+    Args:
+        max_bytes: Budget for cached bodies, measured by on-disk body size
+        max_file_size: Size limit applied when re-reading a changed file
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_BODY_CACHE_BYTES, max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES):
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[BodyRef, str], tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        ref: BodyRef,
+        build: Callable[[str], Any] | None = None,
+        kind: str = "text",
+        text: str | None = None,
+        weigh: Callable[[Any], int] | None = None
+    ) -> Any:
+        """
+        Return the (built) body for ref, reading it from disk on a miss.
+
+        Args:
+            ref: The body location
+            build: Optional function applied to the body text before caching
+            kind: Cache namespace for the built value (e.g. "template"), so
+                the same body can be cached in more than one form
+            text: The body text if the caller already has it, built on a
+                miss instead of reading the body again
+            weigh: Bytes charged against the budget for the built value,
+                for values that do not hold the body (default: body size)
+
+        Returns:
+            The body text, or build(body) if build is given
+        """
+        key = (ref, kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        if text is None:
+            text = read_body(ref, max_file_size=self.max_file_size)
+        value = build(text) if build is not None else text
+
+        # Bodies larger than the whole budget are served but never cached
+        size = weigh(value) if weigh is not None else ref.length
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+        return value
+
+    def discard(self, path: str) -> None:
+        """Drop all cached bodies read from path (e.g. after a reload)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0].path == path]:
+                _, size = self._entries.pop(key)
+                self.current_bytes -= size
@@ -0,0 +1,382 @@
+"""
+Compiled Catalog Bundle Module
+
+`mcp-prompt-server compile` validates the whole catalog and writes it to one
+binary bundle file. Starting the server with `--bundle` memory-maps that
+file and builds the documents straight from its tables: no directory
+listing, no per-file reads and no YAML parsing at startup.
+
+Layout (little-endian):
+
+    header     magic, version, record/argument counts, section offsets
+    records    one fixed-size record per document (kind, name, description,
+               source path, body location, argument range)
+    arguments  one fixed-size record per prompt argument
+    data       UTF-8 strings and bodies referenced by (offset, length)
+
+Bodies are stored with normalized line endings, exactly as the loader
+returns them, so with --lazy-bodies they are read straight from the bundle
+through the regular BodyStore.
+
+SECURITY:
+- The catalog is validated at compile time with the same loader and limits
+  as a normal start; any skipped file fails the build.
+- Names, descriptions and prompt arguments read back from a bundle are
+  validated again, and every offset is bounds-checked against the file, so
+  a corrupt bundle is rejected.
+"""
+
+import os
+import sys
+import mmap
+import struct
+import logging
+import tempfile
+from pathlib import Path
+
+from .utils import (
+    ParsedDocument,
+    BodyRef,
+    intern_path,
+    parse_prompt_arguments,
+    scan_document_files,
+    validate_safe_name,
+    MAX_DESCRIPTION_LENGTH
+)
+from .prompts import load_markdown_prompts
+from .resources import load_resource_documents
+from .includes import IncludeResolver
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+BUNDLE_MAGIC = b"MCPPBNDL"
+BUNDLE_FORMAT_VERSION = 2
+
+# magic, version, prompt count, resource count, argument count,
+# records offset, arguments offset, data offset, data length
+HEADER = struct.Struct('<8sIIII4xQQQQ')
+
+# kind, argument count, first argument, name (offset, length),
+# description (offset, length), source (offset, length), body (offset, length)
+RECORD = struct.Struct('<BxHIQIQIQIQQ')
+
+# required, name (offset, length), description (offset, length),
+# suggestions (offset, length; newline-separated)
+ARGUMENT = struct.Struct('<B3xQIQIQI')
+
+KIND_PROMPT = 0
+KIND_RESOURCE = 1
+
+# Marks an argument without a description (or without suggestions)
+NO_DESCRIPTION = 0xFFFFFFFF
+
+
+class _WarningCounter(logging.Handler):
+    """Count warnings logged while the catalog is loaded for compilation."""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+class _DataWriter:
+    """Append strings and bodies to the data section, deduplicating strings."""
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.length = 0
+        self._offsets: dict[bytes, int] = {}
+
+    def add(self, text: str, dedupe: bool = True) -> tuple[int, int]:
+        data = text.encode('utf-8')
+        if dedupe and data in self._offsets:
+            return self._offsets[data], len(data)
+        offset = self.length
+        self.chunks.append(data)
+        self.length += len(data)
+        if dedupe:
+            self._offsets[data] = offset
+        return offset, len(data)
+
+
+def compile_bundle(
+    prompts_dir: Path,
+    resources_dir: Path,
+    output: Path,
+    recursive: bool = False,
+    includes: bool = False
+) -> int:
+    """
+    Validate the catalog and write it to a bundle file.
+
+    Args:
+        prompts_dir: Directory of prompt files
+        resources_dir: Directory of resource files (may be missing)
+        output: Bundle file to write (replaced atomically)
+        recursive: Load subdirectories as namespaces
+        includes: Store bodies with include directives expanded; an
+            include that does not resolve fails the build
+
+    Returns:
+        Number of validation problems; the bundle is only written if 0
+    """
+    counter = _WarningCounter()
+    package_logger = logging.getLogger(__package__)
+    package_logger.addHandler(counter)
+
+    try:
+        try:
+            prompts = load_markdown_prompts(prompts_dir, recursive=recursive)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load prompts: {e}")
+            return 1
+
+        resources = {}
+        if resources_dir.is_dir():
+            resources = load_resource_documents(resources_dir, recursive=recursive)
+
+        if includes:
+            resolver = IncludeResolver()
+            expanded_prompts, expanded_resources = resolver.resolve_all(prompts, resources)
+    finally:
+        package_logger.removeHandler(counter)
+
+    # Files that were skipped, or lost to a duplicate name, fail the build
+    problems = 0
+    for directory, documents in ((prompts_dir, prompts), (resources_dir, resources)):
+        if not directory.is_dir():
+            continue
+        file_count = len(scan_document_files(directory.resolve(), ['.md'], recursive=recursive))
+        if file_count != len(documents):
+            logger.error(f"{directory.name}: {file_count - len(documents)} file(s) invalid or with duplicate names")
+            problems += file_count - len(documents)
+
+    problems = max(problems, counter.count)
+    if problems:
+        logger.error(f"Catalog has {problems} problem(s); bundle not written")
+        return problems
+
+    # Record source paths relative to the catalog, not the build machine
+    def relative(documents: dict, directory: Path) -> dict:
+        base = directory.resolve().parent
+        return {name: (parsed, str(Path(path).relative_to(base))) for name, (parsed, path) in documents.items()}
+
+    if includes:
+        prompts, resources = expanded_prompts, expanded_resources
+
+    write_bundle(output, relative(prompts, prompts_dir), relative(resources, resources_dir))
+    logger.info(f"Compiled {len(prompts)} prompts and {len(resources)} resources into {output}")
+    return 0
+
+
+def write_bundle(
+    output: Path,
+    prompts: dict[str, tuple[ParsedDocument, str]],
+    resources: dict[str, tuple[ParsedDocument, str]]
+) -> None:
+    """
+    Write loaded documents to a bundle file atomically.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    data = _DataWriter()
+    records = []
+    arguments = []
+
+    for kind, documents in ((KIND_PROMPT, prompts), (KIND_RESOURCE, resources)):
+        for name, (parsed, source_path) in documents.items():
+            first_argument = len(arguments)
+            for arg in parsed.arguments or []:
+                if arg.description is None:
+                    description = (0, NO_DESCRIPTION)
+                else:
+                    description = data.add(arg.description)
+                if arg.suggestions is None:
+                    suggestions = (0, NO_DESCRIPTION)
+                else:
+                    suggestions = data.add('\n'.join(arg.suggestions))
+                arguments.append(ARGUMENT.pack(
+                    int(arg.required), *data.add(arg.name), *description, *suggestions
+                ))
+
+            records.append(RECORD.pack(
+                kind,
+                len(arguments) - first_argument,
+                first_argument,
+                *data.add(name),
+                *data.add(parsed.description),
+                *data.add(source_path),
+                *data.add(parsed.content, dedupe=False)
+            ))
+
+    records_offset = HEADER.size
+    arguments_offset = records_offset + RECORD.size * len(records)
+    data_offset = arguments_offset + ARGUMENT.size * len(arguments)
+
+    header = HEADER.pack(
+        BUNDLE_MAGIC,
+        BUNDLE_FORMAT_VERSION,
+        len(prompts),
+        len(resources),
+        len(arguments),
+        records_offset,
+        arguments_offset,
+        data_offset,
+        data.length
+    )
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.writelines(records)
+            f.writelines(arguments)
+            f.writelines(data.chunks)
+        os.replace(tmp_path, output)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_bundle(
+    bundle_file: Path,
+    header_only: bool = False
+) -> tuple[dict[str, tuple[ParsedDocument, str]], dict[str, tuple[ParsedDocument, str]]]:
+    """
+    Load prompts and resources from a compiled bundle.
+
+    Args:
+        bundle_file: Bundle written by compile_bundle()
+        header_only: Leave bodies in the bundle and reference them through
+            ParsedDocument.body_ref (see BodyStore)
+
+    Returns:
+        Tuple of (prompts, resources), each mapping name to
+        (ParsedDocument, source_path) like load_documents()
+
+    Raises:
+        OSError: If the bundle cannot be read
+        ValueError: If the bundle is corrupt or has an unsupported version
+    """
+    with open(bundle_file, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        if stat.st_size < HEADER.size:
+            raise ValueError("Bundle is truncated")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return _read_bundle(view, stat, intern_path(Path(bundle_file).resolve()), header_only)
+            finally:
+                view.release()
+
+
+def _read_bundle(
+    view: memoryview,
+    stat: os.stat_result,
+    bundle_path: str,
+    header_only: bool
+) -> tuple[dict[str, tuple[ParsedDocument, str]], dict[str, tuple[ParsedDocument, str]]]:
+    (
+        magic, version, prompt_count, resource_count, argument_count,
+        records_offset, arguments_offset, data_offset, data_length
+    ) = HEADER.unpack_from(view, 0)
+
+    if magic != BUNDLE_MAGIC:
+        raise ValueError("Not a catalog bundle")
+    if version != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle version {version}")
+
+    record_count = prompt_count + resource_count
+    if (
+        records_offset + RECORD.size * record_count > arguments_offset
+        or arguments_offset + ARGUMENT.size * argument_count > data_offset
+        or data_offset + data_length != len(view)
+    ):
+        raise ValueError("Bundle is corrupt (bad section offsets)")
+
+    def text(offset: int, length: int) -> str:
+        if offset + length > data_length:
+            raise ValueError("Bundle is corrupt (string out of range)")
+        start = data_offset + offset
+        return str(view[start:start + length], 'utf-8')
+
+    prompts = {}
+    resources = {}
+
+    for index in range(record_count):
+        (
+            kind, arg_count, first_argument,
+            name_offset, name_length,
+            description_offset, description_length,
+            source_offset, source_length,
+            body_offset, body_length
+        ) = RECORD.unpack_from(view, records_offset + index * RECORD.size)
+
+        if kind not in (KIND_PROMPT, KIND_RESOURCE) or first_argument + arg_count > argument_count:
+            raise ValueError("Bundle is corrupt (bad record)")
+
+        name = text(name_offset, name_length)
+        description = text(description_offset, description_length)
+        validate_safe_name(name, allow_slashes=kind == KIND_RESOURCE)
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            raise ValueError("Bundle is corrupt (description too long)")
+
+        arguments = None
+        if kind == KIND_PROMPT:
+            arguments_raw = []
+            for arg_index in range(first_argument, first_argument + arg_count):
+                (
+                    required, arg_name_offset, arg_name_length, arg_desc_offset, arg_desc_length,
+                    suggestions_offset, suggestions_length
+                ) = ARGUMENT.unpack_from(view, arguments_offset + arg_index * ARGUMENT.size)
+                arguments_raw.append({
+                    'name': sys.intern(text(arg_name_offset, arg_name_length)),
+                    'description': None if arg_desc_length == NO_DESCRIPTION else text(arg_desc_offset, arg_desc_length),
+                    'required': bool(required),
+                    'suggestions': (
+                        None if suggestions_length == NO_DESCRIPTION
+                        else text(suggestions_offset, suggestions_length).split('\n')
+                    )
+                })
+            # Same checks as parsed frontmatter: the names become handler parameters
+            try:
+                arguments = parse_prompt_arguments(arguments_raw) or None
+            except ValueError as e:
+                raise ValueError(f"Bundle is corrupt (bad argument: {str(e)})")
+
+        if body_offset + body_length > data_length:
+            raise ValueError("Bundle is corrupt (body out of range)")
+
+        if header_only:
+            parsed = ParsedDocument(
+                name=sys.intern(name),
+                description=description,
+                content="",
+                arguments=arguments,
+                body_ref=BodyRef(
+                    path=bundle_path,
+                    offset=data_offset + body_offset,
+                    length=body_length,
+                    file_size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns
+                )
+            )
+        else:
+            parsed = ParsedDocument(
+                name=sys.intern(name),
+                description=description,
+                content=text(body_offset, body_length),
+                arguments=arguments
+            )
+
+        documents = prompts if kind == KIND_PROMPT else resources
+        documents[parsed.name] = (parsed, intern_path(text(source_offset, source_length)))
+
+    return prompts, resources
+
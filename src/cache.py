@@ -0,0 +1,212 @@
+"""
+Persistent Parse Cache Module
+
+Stores already-parsed document metadata on disk so a warm start can skip
+YAML parsing and validation for files that have not changed.
+
+Entries are keyed by resolved file path and validated against the file's
+size, mtime and a SHA-256 hash of its content. The body itself is not
+cached: it is sliced from the freshly read file at the cached offset, so a
+cache hit can never serve stale content.
+
+The cache is plain JSON (never pickle) and is written atomically. A missing,
+corrupt or incompatible cache file is ignored and every file is parsed.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+from .utils import ParsedDocument, parse_prompt_arguments, validate_safe_name, MAX_DESCRIPTION_LENGTH
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+
+
+def hash_content(content: str) -> str:
+    """Return the hex SHA-256 digest of document content."""
+    return hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+class DocumentCache:
+    """
+    On-disk cache of parsed document metadata.
+
+    Args:
+        cache_file: Path of the JSON cache file (created on save)
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._seen: set[str] = set()
+        self._dirty = False
+        # Guards counters when documents are loaded from a thread pool
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load entries from disk, discarding the cache if it is unreadable."""
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_FORMAT_VERSION:
+            logger.info("Ignoring parse cache with incompatible format")
+            return
+
+        entries = data.get('entries')
+        if not isinstance(entries, dict):
+            logger.warning("Ignoring corrupt parse cache")
+            return
+
+        self.entries = entries
+
+    def lookup(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        content: str,
+        options: list
+    ) -> ParsedDocument | None:
+        """
+        Return the cached ParsedDocument for a file if it is still valid.
+
+        Args:
+            path: The resolved file path
+            stat: The file's stat result
+            content: The file content that was just read
+            options: Loader options the entry must have been parsed with
+                ([allow_slashes_in_name, parse_arguments, namespace,
+                header_only]); header-only reads hash and slice just the
+                frontmatter, so their entries never match full reads
+
+        Returns:
+            ParsedDocument built from the cache, or None on a miss
+        """
+        key = str(path)
+        self._seen.add(key)
+        entry = self.entries.get(key)
+
+        try:
+            if (
+                entry is None
+                or entry['size'] != stat.st_size
+                or entry['mtime_ns'] != stat.st_mtime_ns
+                or entry['options'] != options
+                or entry['sha256'] != hash_content(content)
+            ):
+                with self._lock:
+                    self.misses += 1
+                return None
+
+            # Defense in depth: cached metadata must still pass validation
+            validate_safe_name(entry['name'], allow_slashes=options[0])
+            description = entry['description']
+            if not isinstance(description, str) or not description or len(description) > MAX_DESCRIPTION_LENGTH:
+                raise ValueError("Invalid cached description")
+            body_offset = entry['body_offset']
+            if type(body_offset) is not int or not 0 <= body_offset <= len(content):
+                raise ValueError("Invalid cached body offset")
+
+            arguments = None
+            if entry['arguments'] is not None:
+                arguments = parse_prompt_arguments([
+                    {'name': name, 'description': arg_description, 'required': required, 'suggestions': suggestions}
+                    for name, arg_description, required, suggestions in entry['arguments']
+                ])
+
+            parsed = ParsedDocument(
+                name=entry['name'],
+                description=description,
+                content=content[body_offset:],
+                arguments=arguments
+            )
+        except (KeyError, TypeError, ValueError):
+            # Malformed entry: treat as a miss and overwrite on store()
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return parsed
+
+    def store(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        content: str,
+        options: list,
+        parsed: ParsedDocument
+    ) -> None:
+        """Record a freshly parsed document."""
+        key = str(path)
+        self._seen.add(key)
+
+        arguments = None
+        if parsed.arguments is not None:
+            arguments = [
+                [arg.name, arg.description, arg.required, list(arg.suggestions) if arg.suggestions else None]
+                for arg in parsed.arguments
+            ]
+
+        self.entries[key] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': hash_content(content),
+            'options': options,
+            'name': parsed.name,
+            'description': parsed.description,
+            'arguments': arguments,
+            # parse_frontmatter's body is always a suffix of the file content
+            'body_offset': len(content) - len(parsed.content),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """
+        Atomically write the cache, dropping entries for files not seen this run.
+        """
+        logger.info(f"Parse cache: {self.hits} hits, {self.misses} misses")
+
+        stale = set(self.entries) - self._seen
+        if not self._dirty and not stale:
+            return
+
+        for key in stale:
+            del self.entries[key]
+
+        data = {'version': CACHE_FORMAT_VERSION, 'entries': self.entries}
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_file.parent,
+                prefix=f".{self.cache_file.name}.",
+                suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write parse cache: {e}")
+            return
+
+        self._dirty = False
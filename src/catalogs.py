@@ -0,0 +1,134 @@
+"""
+Catalog Mounting Module
+
+Serves several catalogs from one process. Besides the server's own prompts
+and resources directories, each `--catalog NAMESPACE=DIR` mounts DIR's
+`prompts/` and `resources/` subdirectories under NAMESPACE: the prompt
+`git:assistant` of catalog `team-a` is served as `team-a:git:assistant`,
+and the resource `prompt:template` as `resource://team-a/prompt/template`.
+
+Mounted catalogs are loaded with the same loader, limits and options as the
+server's own catalog. Identical bodies across catalogs are stored once (see
+ContentStore).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .utils import ParsedDocument, validate_safe_name, MAX_NAME_LENGTH
+from .prompts import load_markdown_prompts
+from .resources import load_resource_documents
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Catalog:
+    """A prompts/resources directory pair served under an optional namespace."""
+    namespace: str | None
+    prompts_dir: Path
+    resources_dir: Path
+    prompts: dict[str, tuple[ParsedDocument, str]] = field(default_factory=dict)
+    resources: dict[str, tuple[ParsedDocument, str]] = field(default_factory=dict)
+
+
+def parse_catalog_spec(spec: str) -> tuple[str, Path]:
+    """
+    Parse a --catalog NAMESPACE=DIR argument.
+
+    Raises:
+        ValueError: If the namespace is invalid
+    """
+    namespace, separator, directory = spec.partition('=')
+    if not separator or not namespace or not directory:
+        raise ValueError("expected NAMESPACE=DIR")
+    if ':' in namespace:
+        raise ValueError("namespace cannot contain ':'")
+    validate_safe_name(namespace)
+    return namespace, Path(directory)
+
+
+def mount_name(namespace: str, name: str) -> str:
+    """
+    Return the name a document is served under in a mounted catalog.
+
+    Raises:
+        ValueError: If the mounted name is too long
+    """
+    mounted = f"{namespace}:{name}"
+    if len(mounted) > MAX_NAME_LENGTH:
+        raise ValueError(f"Name exceeds maximum length of {MAX_NAME_LENGTH}")
+    return mounted
+
+
+def mount_documents(
+    namespace: str,
+    documents: dict[str, tuple[ParsedDocument, str]],
+    document_type: str
+) -> dict[str, tuple[ParsedDocument, str]]:
+    """Rename freshly loaded documents into a namespace, skipping names that get too long."""
+    mounted = {}
+    for name, (parsed, path) in documents.items():
+        try:
+            parsed.name = mount_name(namespace, name)
+        except ValueError as e:
+            logger.warning(f"Skipping {document_type} '{name}' in catalog '{namespace}': {str(e)}")
+            continue
+        mounted[parsed.name] = (parsed, path)
+    return mounted
+
+
+def load_catalog(namespace: str, root: Path, **load_options) -> Catalog:
+    """
+    Load a catalog directory for mounting under namespace.
+
+    Either subdirectory may be missing; a catalog without any documents is
+    mounted empty (with a warning), so it can be filled under --watch.
+
+    Args:
+        namespace: Namespace the catalog is served under
+        root: Directory containing prompts/ and/or resources/
+        **load_options: Passed to load_markdown_prompts/load_resource_documents
+
+    Raises:
+        FileNotFoundError: If root is not a directory
+    """
+    if not root.is_dir():
+        raise FileNotFoundError(f"Catalog directory not found: {root}")
+
+    catalog = Catalog(namespace, root / "prompts", root / "resources")
+
+    if catalog.prompts_dir.is_dir():
+        try:
+            prompts = load_markdown_prompts(catalog.prompts_dir, **load_options)
+        except ValueError as e:
+            logger.warning(f"Catalog '{namespace}': {e}")
+        else:
+            catalog.prompts = mount_documents(namespace, prompts, "prompt")
+
+    if catalog.resources_dir.is_dir():
+        resources = load_resource_documents(catalog.resources_dir, **load_options)
+        catalog.resources = mount_documents(namespace, resources, "resource")
+
+    if not catalog.prompts and not catalog.resources:
+        logger.warning(f"Catalog '{namespace}' has no prompts or resources")
+    return catalog
+
+
+def merge_catalogs(catalogs: list[Catalog], document_type: str) -> dict[str, tuple[ParsedDocument, str]]:
+    """
+    Merge the prompts or resources of all catalogs into one name -> document dict.
+
+    Later catalogs win on duplicate names, like later files within one
+    catalog.
+    """
+    merged = {}
+    for catalog in catalogs:
+        documents = catalog.prompts if document_type == "prompt" else catalog.resources
+        for name, entry in documents.items():
+            if name in merged:
+                logger.warning(f"Duplicate {document_type} name '{name}' across catalogs, using catalog '{catalog.namespace}'")
+            merged[name] = entry
+    return merged
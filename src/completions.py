@@ -0,0 +1,274 @@
+"""
+Completion Module
+
+Answers MCP completion/complete requests from prefix tries built when
+documents are registered, so clients can autocomplete instead of listing
+the whole catalog and filtering it themselves:
+
+- Resource URIs: the server advertises the resource template
+  `resource://{name}`; completing its `name` argument returns the names of
+  matching resources in URI form (`prompt:template` -> `prompt/template`).
+  Reading the template with a name (also percent-encoded, as template
+  expansion produces it: `resource://prompt%2Ftemplate`) returns that
+  resource's body.
+- Prompt arguments: values declared in an argument's optional
+  `suggestions` list in the prompt's frontmatter.
+
+Registration keeps the tries current, so hot reloads and mounted catalogs
+are reflected immediately. A lookup walks the typed prefix and returns the
+first matches in sorted order; the matches below each node are cached, so
+repeated lookups cost one walk of the prefix.
+"""
+
+import threading
+from urllib.parse import unquote
+
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import Resource, ResourceTemplate
+
+from .utils import ParsedDocument
+
+# MCP caps a completion response at 100 values
+MAX_COMPLETION_VALUES = 100
+
+RESOURCE_TEMPLATE = "resource://{name}"
+RESOURCE_TEMPLATE_ARGUMENT = "name"
+
+
+class _Node:
+    __slots__ = ("label", "children", "value", "count", "top")
+
+    def __init__(self, label: str):
+        # Edge label from the parent; children are keyed by their label's first character
+        self.label = label
+        self.children: dict[str, _Node] = {}
+        self.value: str | None = None
+        self.count = 0
+        self.top: list[str] | None = None
+
+
+class PrefixTrie:
+    """
+    Radix (compressed) trie over a set of strings.
+
+    Edges carry whole substrings, so a catalog of names needs about one node
+    per name rather than one per character. Not thread-safe.
+    """
+
+    def __init__(self, values=()):
+        self._root = _Node("")
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def add(self, value: str) -> bool:
+        """Add a value; returns False if it was already present."""
+        node = self._root
+        path = [node]
+        i = 0
+        while i < len(value):
+            child = node.children.get(value[i])
+            if child is None:
+                child = node.children[value[i]] = _Node(value[i:])
+                node = child
+                path.append(node)
+                break
+
+            label = child.label
+            common = 0
+            limit = min(len(label), len(value) - i)
+            while common < limit and label[common] == value[i + common]:
+                common += 1
+
+            if common < len(label):
+                # Split the edge where the new value diverges
+                middle = _Node(label[:common])
+                middle.count = child.count
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[value[i]] = middle
+                child = middle
+
+            node = child
+            path.append(node)
+            i += common
+
+        if node.value is not None:
+            return False
+        node.value = value
+        for visited in path:
+            visited.count += 1
+            visited.top = None
+        return True
+
+    def remove(self, value: str) -> bool:
+        """Remove a value; returns False if it was not present."""
+        node = self._root
+        path = [node]
+        i = 0
+        while i < len(value):
+            child = node.children.get(value[i])
+            if child is None or not value.startswith(child.label, i):
+                return False
+            node = child
+            path.append(node)
+            i += len(child.label)
+
+        if node.value is None:
+            return False
+        node.value = None
+        for visited in path:
+            visited.count -= 1
+            visited.top = None
+
+        # Drop the emptied node and merge single-child chains back into one edge
+        if node is not self._root and not node.children:
+            parent = path[-2]
+            del parent.children[node.label[0]]
+            node = parent
+        if node is not self._root and node.value is None and len(node.children) == 1:
+            (child,) = node.children.values()
+            node.label += child.label
+            node.children = child.children
+            node.value = child.value
+        return True
+
+    def complete(self, prefix: str, limit: int = MAX_COMPLETION_VALUES) -> tuple[list[str], int]:
+        """
+        Return up to limit values starting with prefix (sorted) and the total number of matches.
+        """
+        node = self._root
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return [], 0
+            label = child.label
+            if prefix.startswith(label, i):
+                i += len(label)
+            elif label.startswith(prefix[i:]):
+                # The prefix ends inside this edge
+                i = len(prefix)
+            else:
+                return [], 0
+            node = child
+
+        if node.top is None or len(node.top) < min(limit, node.count):
+            top = []
+            self._collect(node, top, max(limit, MAX_COMPLETION_VALUES))
+            node.top = top
+        return node.top[:limit], node.count
+
+    def _collect(self, node: _Node, out: list[str], limit: int) -> None:
+        # A node's own value sorts before every value below it
+        if node.value is not None:
+            out.append(node.value)
+        for key in sorted(node.children):
+            if len(out) >= limit:
+                return
+            self._collect(node.children[key], out, limit)
+
+
+class CompletionIndex:
+    """
+    Completion data for the registered prompts and resources.
+
+    Thread-safe, so the watcher thread can update it while requests are
+    served.
+    """
+
+    def __init__(self):
+        self._resources = PrefixTrie()
+        # prompt name -> argument name -> suggested values
+        self._arguments: dict[str, dict[str, PrefixTrie]] = {}
+        self._lock = threading.Lock()
+
+    def set_prompt(self, name: str, parsed: ParsedDocument) -> None:
+        """Index the argument suggestions of a (re-)registered prompt."""
+        suggestions = {
+            arg.name: PrefixTrie(arg.suggestions)
+            for arg in parsed.arguments or []
+            if arg.suggestions
+        }
+        with self._lock:
+            if suggestions:
+                self._arguments[name] = suggestions
+            else:
+                self._arguments.pop(name, None)
+
+    def remove_prompt(self, name: str) -> None:
+        with self._lock:
+            self._arguments.pop(name, None)
+
+    def add_resource(self, name: str) -> None:
+        with self._lock:
+            self._resources.add(uri_path(name))
+
+    def remove_resource(self, name: str) -> None:
+        with self._lock:
+            self._resources.remove(uri_path(name))
+
+    def complete(
+        self,
+        ref: types.PromptReference | types.ResourceTemplateReference,
+        argument: types.CompletionArgument
+    ) -> types.Completion | None:
+        """Return completions for an argument value, or None if there are none to offer."""
+        if isinstance(ref, types.ResourceTemplateReference):
+            if ref.uri != RESOURCE_TEMPLATE or argument.name != RESOURCE_TEMPLATE_ARGUMENT:
+                return None
+            trie = self._resources
+            prefix = uri_path(argument.value)
+        else:
+            trie = self._arguments.get(ref.name, {}).get(argument.name)
+            if trie is None:
+                return None
+            prefix = argument.value
+
+        with self._lock:
+            values, total = trie.complete(prefix)
+        return types.Completion(values=values, total=total, hasMore=total > len(values))
+
+    def install(self, mcp: FastMCP) -> None:
+        """Register the completion handler and the resource template it completes."""
+
+        @mcp.completion()
+        async def complete(ref, argument, context):
+            return self.complete(ref, argument)
+
+        resources = mcp._resource_manager._resources
+
+        def resource_by_name(name: str) -> Resource | None:
+            return resources.get(RESOURCE_TEMPLATE.format(name=uri_path(unquote(name))))
+
+        mcp._resource_manager._templates[RESOURCE_TEMPLATE] = _ResourceNameTemplate.from_function(
+            resource_by_name,
+            RESOURCE_TEMPLATE,
+            name="resource",
+            description="Any catalog resource by name (complete the name argument to browse)"
+        )
+
+
+class _ResourceNameTemplate(ResourceTemplate):
+    """
+    The resource://{name} template, resolving names to registered resources.
+
+    Registered URIs are matched before templates, so the template only sees
+    percent-encoded names and unknown names. It matches only names of
+    registered resources, so unknown names get FastMCP's own "Unknown
+    resource" error.
+    """
+
+    def matches(self, uri: str) -> dict | None:
+        params = super().matches(uri)
+        if params is None or self.fn(**params) is None:
+            return None
+        return params
+
+
+def uri_path(name: str) -> str:
+    """Return the URI form of a resource name (as in resource_uri_for)."""
+    return name.replace(':', '/')
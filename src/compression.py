@@ -0,0 +1,179 @@
+"""
+Compressed Body Module
+
+Keeps document bodies compressed in memory instead of as full Python
+strings. Markdown typically compresses 4-6x, so a large catalog's resident
+size shrinks accordingly, while the bodies that are actually requested are
+served from the BodyStore's LRU of decompressed (and compiled) hot bodies.
+
+A compressed body takes the place of a document's on-disk BodyRef: it has
+the same path and length, keeps the content hash of the uncompressed text,
+and read_body() decompresses it, so everything that already handles lazily
+loaded bodies (handlers, search indexing, includes, range reads) works with
+it unchanged.
+
+Codecs: zlib from the standard library, or zstd when the `zstandard` package
+is installed (or Python's own `compression.zstd` module, from 3.14).
+"""
+
+import time
+import zlib
+import hashlib
+import threading
+from dataclasses import dataclass
+
+try:
+    from compression import zstd as _zstd_stdlib
+except ImportError:
+    _zstd_stdlib = None
+
+try:
+    import zstandard as _zstandard
+except ImportError:
+    _zstandard = None
+
+from .utils import ParsedDocument
+
+CODECS = ("auto", "zlib", "zstd")
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Digest size of the body hash (as in versions.content_hash)
+BODY_DIGEST_SIZE = 16
+
+# Bodies shorter than this are kept as strings: the compressed form would
+# barely be smaller once the record overhead is counted
+MIN_COMPRESS_BYTES = 256
+
+
+def zstd_available() -> bool:
+    """Whether a zstd implementation can be imported."""
+    return _zstd_stdlib is not None or _zstandard is not None
+
+
+class BodyCodec:
+    """
+    Compresses bodies with one codec and records compression statistics.
+
+    Args:
+        codec: "zlib", "zstd", or "auto" (zstd when available, else zlib)
+
+    Raises:
+        ValueError: If zstd is requested but not available
+    """
+
+    def __init__(self, codec: str = "auto"):
+        if codec == "auto":
+            codec = "zstd" if zstd_available() else "zlib"
+        if codec == "zstd" and not zstd_available():
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        if codec not in ("zlib", "zstd"):
+            raise ValueError(f"Unknown compression codec: {codec}")
+        self.name = codec
+
+        if codec == "zlib":
+            self._compress = lambda data: zlib.compress(data, ZLIB_LEVEL)
+            self._decompress = zlib.decompress
+        elif _zstd_stdlib is not None:
+            self._compress = lambda data: _zstd_stdlib.compress(data, level=ZSTD_LEVEL)
+            self._decompress = _zstd_stdlib.decompress
+        else:
+            # Contexts are not thread-safe, so make one per call
+            self._compress = lambda data: _zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+            self._decompress = lambda data: _zstandard.ZstdDecompressor().decompress(data)
+
+        self.documents = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.decompressions = 0
+        self.decompress_seconds = 0.0
+        self.decompress_max_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def compress_document(self, parsed: ParsedDocument, path: str) -> ParsedDocument:
+        """
+        Return the document with its body compressed.
+
+        Documents that are lazily loaded or have short bodies are returned
+        unchanged.
+        """
+        if parsed.body_ref is not None:
+            return parsed
+        raw = parsed.content.encode('utf-8')
+        if len(raw) < MIN_COMPRESS_BYTES:
+            return parsed
+
+        data = self._compress(raw)
+        # Hash the text, not the compressed bytes, so the content hash does not
+        # depend on the codec or on whether the body is compressed at all
+        digest = hashlib.blake2b(raw, digest_size=BODY_DIGEST_SIZE).hexdigest()
+        with self._lock:
+            self.documents += 1
+            self.raw_bytes += len(raw)
+            self.compressed_bytes += len(data)
+
+        return ParsedDocument(
+            name=parsed.name,
+            description=parsed.description,
+            content="",
+            arguments=parsed.arguments,
+            body_ref=CompressedBody(path=path, data=data, length=len(raw), codec=self, digest=digest)
+        )
+
+    def compress_documents(
+        self,
+        documents: dict[str, tuple[ParsedDocument, str]]
+    ) -> dict[str, tuple[ParsedDocument, str]]:
+        """Compress the bodies of a load_documents() result."""
+        return {
+            name: (self.compress_document(parsed, path), path)
+            for name, (parsed, path) in documents.items()
+        }
+
+    def decompress(self, data: bytes) -> str:
+        """Decompress a body, recording the time taken."""
+        start = time.perf_counter()
+        text = self._decompress(data).decode('utf-8')
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.decompressions += 1
+            self.decompress_seconds += elapsed
+            if elapsed > self.decompress_max_seconds:
+                self.decompress_max_seconds = elapsed
+        return text
+
+    def stats(self) -> dict:
+        """Return compression and decompression statistics."""
+        with self._lock:
+            return {
+                "documents": self.documents,
+                "raw_bytes": self.raw_bytes,
+                "compressed_bytes": self.compressed_bytes,
+                "compression_ratio": round(self.raw_bytes / self.compressed_bytes, 3) if self.compressed_bytes else 0,
+                "decompressions": self.decompressions,
+                "decompress_seconds_total": round(self.decompress_seconds, 6),
+                "decompress_seconds_max": round(self.decompress_max_seconds, 6),
+            }
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CompressedBody:
+    """
+    An in-memory compressed body, used as a document's body_ref.
+
+    path is the document's source file (so reloads discard its cached
+    decompressed body), length is the body's UTF-8 size in bytes and digest
+    is the BLAKE2b hash of the uncompressed body.
+    Compared by identity: each registration compresses its own copy, which
+    the ContentStore replaces with the stored one for a body it already
+    holds.
+    """
+    path: str
+    data: bytes
+    length: int
+    codec: BodyCodec
+    digest: str
+
+    def read(self) -> str:
+        return self.codec.decompress(self.data)
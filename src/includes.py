@@ -0,0 +1,267 @@
+"""
+Document Include Module
+
+Lets prompts and resources pull in shared resource text with an include
+directive on the resource's name:
+
+    {{include: prompt:template}}
+
+Includes are resolved when documents are loaded, not when they are served:
+each document's directives are recorded in a dependency graph, checked for
+cycles, and the fully expanded body is stored in place of the raw one. A
+request therefore renders the stored body in a single pass, and prompt
+argument placeholders inside included text work like any other placeholder.
+
+Include targets are resolved within the including document's catalog: in a
+catalog mounted as `team`, `{{include: shared}}` includes `team:shared`,
+never another catalog's `shared`.
+
+When a document changes, only it and the documents that (transitively)
+include it are expanded again.
+
+A document whose includes cannot be resolved (missing resource, cycle, or
+an expansion over the size limit) is skipped with a warning, like any other
+invalid document, and comes back once its includes resolve again.
+"""
+
+import re
+import logging
+
+from .bodies import read_body
+from .catalogs import mount_name
+from .utils import ParsedDocument, DEFAULT_MAX_FILE_SIZE_BYTES
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+INCLUDE_PATTERN = re.compile(r'\{\{\s*include:\s*([^{}\n]+?)\s*\}\}')
+
+# (kind, name) with kind "prompt" or "resource"
+DocumentKey = tuple[str, str]
+
+
+class IncludeError(ValueError):
+    """An include directive that cannot be resolved."""
+
+
+class IncludeResolver:
+    """
+    Dependency graph of include directives with pre-expanded bodies.
+
+    Args:
+        max_size: Maximum length of an expanded body (characters)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_FILE_SIZE_BYTES):
+        self.max_size = max_size
+        # Source documents as loaded (raw bodies) and the resources each includes
+        self._sources: dict[DocumentKey, ParsedDocument] = {}
+        self._bodies: dict[DocumentKey, str] = {}
+        self._includes: dict[DocumentKey, tuple[str, ...]] = {}
+        # Catalog namespace of each document (None for the server's own catalog)
+        self._namespaces: dict[DocumentKey, str | None] = {}
+        # Resource name -> documents that include it directly
+        self._dependents: dict[str, set[DocumentKey]] = {}
+        # Expanded resource bodies, reused when nested in other documents
+        self._expanded: dict[str, str] = {}
+        # Documents currently skipped because their includes do not resolve
+        self.unresolved: set[DocumentKey] = set()
+
+    def resolve_all(
+        self,
+        prompts: dict[str, tuple[ParsedDocument, str]],
+        resources: dict[str, tuple[ParsedDocument, str]],
+        namespaces: dict[DocumentKey, str | None] | None = None
+    ) -> tuple[dict[str, tuple[ParsedDocument, str]], dict[str, tuple[ParsedDocument, str]]]:
+        """
+        Build the graph for a freshly loaded catalog and expand every document.
+
+        Args:
+            prompts: Prompts in the load_documents() shape
+            resources: Resources in the load_documents() shape
+            namespaces: Catalog namespace of each mounted document, by
+                (kind, name); documents not listed belong to the server's
+                own catalog
+
+        Returns:
+            (prompts, resources) in the load_documents() shape, with
+            expanded bodies and without documents whose includes fail
+        """
+        namespaces = namespaces or {}
+        for kind, documents in (("resource", resources), ("prompt", prompts)):
+            for name, (parsed, _) in documents.items():
+                key = (kind, name)
+                self._track(key, parsed, namespaces.get(key))
+
+        results = {}
+        for kind, documents in (("resource", resources), ("prompt", prompts)):
+            resolved = {}
+            for name, (parsed, path) in documents.items():
+                expanded = self._build((kind, name))
+                if expanded is not None:
+                    resolved[name] = (expanded, path)
+            results[kind] = resolved
+
+        return results["prompt"], results["resource"]
+
+    def update(
+        self,
+        kind: str,
+        name: str,
+        parsed: ParsedDocument | None,
+        namespace: str | None = None
+    ) -> tuple[list[tuple[str, str, ParsedDocument]], list[DocumentKey]]:
+        """
+        Apply a changed (or, with parsed=None, removed) document of the
+        catalog mounted under namespace.
+
+        Returns:
+            (register, unregister): documents to (re-)register with their
+            expanded bodies, and documents to unregister, covering the
+            changed document and everything that includes it
+        """
+        key = (kind, name)
+        self._untrack(key)
+        if parsed is not None:
+            self._track(key, parsed, namespace)
+
+        affected = self._affected(key)
+        for affected_kind, affected_name in affected:
+            if affected_kind == "resource":
+                self._expanded.pop(affected_name, None)
+
+        register = []
+        unregister = []
+        for affected_key in sorted(affected):
+            if affected_key not in self._sources:
+                # The removed document itself
+                self.unresolved.discard(affected_key)
+                unregister.append(affected_key)
+                continue
+            expanded = self._build(affected_key)
+            if expanded is None:
+                unregister.append(affected_key)
+            else:
+                register.append((*affected_key, expanded))
+
+        return register, unregister
+
+    def _track(self, key: DocumentKey, parsed: ParsedDocument, namespace: str | None) -> None:
+        body = parsed.content
+        if parsed.body_ref is not None:
+            try:
+                # Lazily loaded: read the body once to find its directives
+                body = read_body(parsed.body_ref)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Cannot scan {key[0]} '{key[1]}' for includes: {str(e)}")
+                body = ""
+
+        includes = tuple(dict.fromkeys(
+            _target(namespace, match.group(1)) for match in INCLUDE_PATTERN.finditer(body)
+        ))
+        self._sources[key] = parsed
+        self._namespaces[key] = namespace
+        self._includes[key] = includes
+        if includes:
+            # Only documents with includes need their raw body kept
+            self._bodies[key] = body
+        for target in includes:
+            self._dependents.setdefault(target, set()).add(key)
+
+    def _untrack(self, key: DocumentKey) -> None:
+        self._sources.pop(key, None)
+        self._bodies.pop(key, None)
+        self._namespaces.pop(key, None)
+        for target in self._includes.pop(key, ()):
+            dependents = self._dependents.get(target)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[target]
+
+    def _affected(self, key: DocumentKey) -> set[DocumentKey]:
+        """Return key and every document that includes it, directly or not."""
+        affected = {key}
+        pending = [key]
+        while pending:
+            kind, name = pending.pop()
+            if kind != "resource":
+                continue
+            for dependent in self._dependents.get(name, ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+        return affected
+
+    def _build(self, key: DocumentKey) -> ParsedDocument | None:
+        """Return the document with includes expanded, or None if they fail."""
+        parsed = self._sources[key]
+        if not self._includes[key]:
+            self.unresolved.discard(key)
+            return parsed
+
+        try:
+            content = self._expand(key, [])
+        except IncludeError as e:
+            logger.warning(f"Skipping {key[0]} '{key[1]}': {str(e)}")
+            self.unresolved.add(key)
+            return None
+
+        self.unresolved.discard(key)
+        # The expanded body lives in memory; it no longer matches the file
+        return ParsedDocument(
+            name=parsed.name,
+            description=parsed.description,
+            content=content,
+            arguments=parsed.arguments
+        )
+
+    def _expand(self, key: DocumentKey, stack: list[DocumentKey]) -> str:
+        kind, name = key
+        if kind == "resource" and name in self._expanded:
+            return self._expanded[name]
+
+        if key in stack:
+            cycle = ' -> '.join(n for _, n in stack[stack.index(key):] + [key])
+            raise IncludeError(f"include cycle: {cycle}")
+
+        if not self._includes[key]:
+            parsed = self._sources[key]
+            if parsed.body_ref is None:
+                content = parsed.content
+            else:
+                try:
+                    content = read_body(parsed.body_ref)
+                except (OSError, ValueError) as e:
+                    # E.g. the file was removed or changed after it was indexed
+                    raise IncludeError(f"cannot read {kind} '{name}': {str(e)}")
+        else:
+            stack.append(key)
+            namespace = self._namespaces[key]
+
+            def substitute(match: re.Match) -> str:
+                target = ("resource", _target(namespace, match.group(1)))
+                if target not in self._sources:
+                    raise IncludeError(f"included resource '{target[1]}' not found")
+                return self._expand(target, stack)
+
+            content = INCLUDE_PATTERN.sub(substitute, self._bodies[key])
+            stack.pop()
+
+        if len(content) > self.max_size:
+            raise IncludeError(f"expanded body exceeds size limit ({self.max_size})")
+
+        if kind == "resource":
+            self._expanded[name] = content
+        return content
+
+
+def _target(namespace: str | None, name: str) -> str:
+    """Return the served name of the resource an include in catalog namespace refers to."""
+    if namespace is None:
+        return name
+    try:
+        return mount_name(namespace, name)
+    except ValueError:
+        # Too long to be served, so it reports as not found
+        return f"{namespace}:{name}"
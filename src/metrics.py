@@ -0,0 +1,199 @@
+"""
+Runtime Metrics Module
+
+Records per-prompt and per-resource call counts, latency histograms, bytes
+returned and error counts, so hot and slow catalog entries can be found.
+
+Latencies go into fixed buckets (the same layout Prometheus histograms use),
+so recording is O(1) with constant memory per name. Percentiles are
+estimated by interpolating within the bucket that contains them.
+
+Metrics are kept in process memory: with --workers > 1 each worker reports
+only the requests it served.
+"""
+
+import time
+import bisect
+import functools
+import threading
+from dataclasses import dataclass, field
+from typing import Callable
+
+# Upper bounds in seconds; the final +Inf bucket is implicit
+LATENCY_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+METRIC_PREFIX = "mcp_prompt_server"
+
+
+@dataclass
+class HandlerMetrics:
+    """Counters and latency histogram for one prompt or resource."""
+    calls: int = 0
+    errors: int = 0
+    bytes_returned: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def observe(self, duration: float, size: int | None) -> None:
+        """Record one call; size is None if the call failed."""
+        self.calls += 1
+        self.latency_sum += duration
+        self.latency_max = max(self.latency_max, duration)
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+        if size is None:
+            self.errors += 1
+        else:
+            self.bytes_returned += size
+
+    def percentile(self, p: float) -> float:
+        """Estimate the p-th percentile latency in seconds from the histogram."""
+        if self.calls == 0:
+            return 0.0
+        rank = p / 100 * self.calls
+        cumulative = 0
+        for index, count in enumerate(self.bucket_counts):
+            if count and cumulative + count >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index > 0 else 0.0
+                # The +Inf bucket has no upper bound; use the observed maximum
+                upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.latency_max
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(estimate, self.latency_max)
+            cumulative += count
+        return self.latency_max
+
+    def summary(self) -> dict:
+        """Summarize as plain values (latencies in milliseconds)."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "bytes_returned": self.bytes_returned,
+            "mean_bytes": self.bytes_returned / (self.calls - self.errors) if self.calls > self.errors else 0,
+            "latency_ms": {
+                "mean": self.latency_sum / self.calls * 1000 if self.calls else 0.0,
+                "p50": self.percentile(50) * 1000,
+                "p95": self.percentile(95) * 1000,
+                "p99": self.percentile(99) * 1000,
+                "max": self.latency_max * 1000,
+            },
+        }
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    """
+    Metrics for all instrumented handlers, keyed by (kind, name).
+
+    kind is "prompt" or "resource". Metrics for a name survive reloads of the
+    document, so counts cover the whole process lifetime.
+    """
+
+    def __init__(self):
+        self._metrics: dict[tuple[str, str], HandlerMetrics] = {}
+        self._stats_sources: dict[str, Callable[[], dict[str, int | float]]] = {}
+        self._lock = threading.Lock()
+
+    def add_stats(self, source: str, stats: Callable[[], dict[str, int | float]]) -> None:
+        """
+        Report another component's counters (e.g. a cache's hits and misses).
+
+        Args:
+            source: Name of the component, used as a metric name prefix
+            stats: Returns the component's current counters
+        """
+        self._stats_sources[source] = stats
+
+    def record(self, kind: str, name: str, duration: float, size: int | None) -> None:
+        """Record one call; size is None if the call failed."""
+        key = (kind, name)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = HandlerMetrics()
+            metrics.observe(duration, size)
+
+    def instrument(self, kind: str, name: str, handler: Callable[..., str]) -> Callable[..., str]:
+        """
+        Wrap a handler so each call is recorded.
+
+        The wrapper keeps the handler's signature, annotations and docstring,
+        so FastMCP introspects it exactly like the original.
+        """
+        @functools.wraps(handler)
+        def instrumented(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = handler(*args, **kwargs)
+            except Exception:
+                self.record(kind, name, time.perf_counter() - start, None)
+                raise
+            self.record(kind, name, time.perf_counter() - start, len(result.encode('utf-8')))
+            return result
+        return instrumented
+
+    def snapshot(self) -> dict:
+        """Return a summary of every instrumented prompt and resource, hottest first."""
+        with self._lock:
+            items = [(kind, name, metrics.summary()) for (kind, name), metrics in self._metrics.items()]
+
+        report = {"prompts": {}, "resources": {}}
+        for kind, name, summary in sorted(items, key=lambda item: -item[2]["calls"]):
+            report[f"{kind}s"][name] = summary
+        for source, stats in self._stats_sources.items():
+            report[source] = stats()
+        return report
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            items = sorted(
+                (kind, name, HandlerMetrics(
+                    calls=m.calls,
+                    errors=m.errors,
+                    bytes_returned=m.bytes_returned,
+                    latency_sum=m.latency_sum,
+                    latency_max=m.latency_max,
+                    bucket_counts=list(m.bucket_counts)
+                ))
+                for (kind, name), m in self._metrics.items()
+            )
+
+        lines = []
+
+        def counter(metric: str, help_text: str, value_of: Callable[[HandlerMetrics], int]) -> None:
+            lines.append(f"# HELP {METRIC_PREFIX}_{metric} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{metric} counter")
+            for kind, name, metrics in items:
+                labels = f'kind="{kind}",name="{_escape_label(name)}"'
+                lines.append(f"{METRIC_PREFIX}_{metric}{{{labels}}} {value_of(metrics)}")
+
+        counter("requests_total", "Calls per prompt or resource.", lambda m: m.calls)
+        counter("errors_total", "Failed calls per prompt or resource.", lambda m: m.errors)
+        counter("response_bytes_total", "UTF-8 bytes returned per prompt or resource.", lambda m: m.bytes_returned)
+
+        metric = f"{METRIC_PREFIX}_request_duration_seconds"
+        lines.append(f"# HELP {metric} Handler latency per prompt or resource.")
+        lines.append(f"# TYPE {metric} histogram")
+        for kind, name, metrics in items:
+            labels = f'kind="{kind}",name="{_escape_label(name)}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.bucket_counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {metrics.calls}')
+            lines.append(f"{metric}_sum{{{labels}}} {metrics.latency_sum}")
+            lines.append(f"{metric}_count{{{labels}}} {metrics.calls}")
+
+        for source, stats in self._stats_sources.items():
+            for key, value in stats().items():
+                lines.append(f"# TYPE {METRIC_PREFIX}_{source}_{key} untyped")
+                lines.append(f"{METRIC_PREFIX}_{source}_{key} {value}")
+
+        return '\n'.join(lines) + '\n'
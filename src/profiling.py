@@ -0,0 +1,173 @@
+"""
+Load Profiling Module
+
+With --profile-load, every file's trip through the loader is timed phase by
+phase, so a slow start can be traced to the files (or filesystem calls)
+responsible:
+
+    resolve    symlink check, path resolution and traversal check
+    stat       stat and size check
+    read       open and read (the frontmatter only, with --lazy-bodies)
+    cache      parse cache lookup (with --cache-file)
+    split      frontmatter split
+    yaml       YAML parsing
+    validate   field, name and argument validation
+    register   handler registration in main() (including search indexing
+               and hashing when enabled)
+
+Whole-catalog steps (directory scans, compression, include expansion) are
+timed as stages. The slowest files and the phase totals are printed to
+stderr (stdout may be the stdio transport) and the full report is written
+as JSON.
+
+The loader takes a PhaseTimer per file; outside profiling it gets
+NULL_TIMER, whose mark() does nothing.
+"""
+
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_PROFILE_REPORT = "load-profile.json"
+DEFAULT_SLOWEST_FILES = 10
+
+PHASES = ("resolve", "stat", "read", "cache", "split", "yaml", "validate", "register")
+
+
+class PhaseTimer:
+    """
+    Times the phases of loading one file.
+
+    mark(phase) attributes the time since the previous mark (or since the
+    timer was created) to phase.
+    """
+
+    __slots__ = ("path", "document_type", "name", "size", "loaded", "phases", "_last")
+
+    def __init__(self, path: str, document_type: str):
+        self.path = path
+        self.document_type = document_type
+        self.name = None
+        self.size = None
+        self.loaded = False
+        self.phases: dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def restart(self) -> None:
+        """Start timing again from now (time since the last mark is not counted)."""
+        self._last = time.perf_counter()
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+
+class _NullTimer:
+    """Stand-in for PhaseTimer when not profiling."""
+
+    __slots__ = ()
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def restart(self) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class LoadProfiler:
+    """Collects per-file phase timings and whole-catalog stage timings."""
+
+    def __init__(self):
+        self.files: list[PhaseTimer] = []
+        self.stages: dict[str, float] = {}
+        self._by_path: dict[str, PhaseTimer] = {}
+        self._lock = threading.Lock()
+
+    def file(self, path: Path | str, document_type: str) -> PhaseTimer:
+        """Start timing a file."""
+        timer = PhaseTimer(str(path), document_type)
+        with self._lock:
+            self.files.append(timer)
+            self._by_path[timer.path] = timer
+        return timer
+
+    def timer_for(self, path: Path | str, document_type: str) -> PhaseTimer:
+        """Return the timer of a loaded file (started now if it was not loaded from disk, e.g. a bundle)."""
+        timer = self._by_path.get(str(path))
+        if timer is None:
+            timer = self.file(path, document_type)
+            timer.loaded = True
+        return timer
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a whole-catalog step."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - start)
+
+    def report(self, slowest: int = DEFAULT_SLOWEST_FILES) -> dict:
+        """Return the profile: phase totals, stage times and per-file timings (slowest first)."""
+        phase_totals = {phase: 0.0 for phase in PHASES}
+        for timer in self.files:
+            for phase, seconds in timer.phases.items():
+                phase_totals[phase] = phase_totals.get(phase, 0.0) + seconds
+
+        files = sorted(self.files, key=lambda timer: timer.total, reverse=True)
+        return {
+            "files": len(files),
+            "loaded": sum(timer.loaded for timer in files),
+            "phase_totals": {phase: round(seconds, 6) for phase, seconds in phase_totals.items()},
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "slowest": [timer.path for timer in files[:slowest]],
+            "per_file": [
+                {
+                    "path": timer.path,
+                    "type": timer.document_type,
+                    "name": timer.name,
+                    "size": timer.size,
+                    "loaded": timer.loaded,
+                    "total": round(timer.total, 6),
+                    "phases": {phase: round(seconds, 6) for phase, seconds in timer.phases.items()},
+                }
+                for timer in files
+            ],
+        }
+
+    def write_report(self, output: Path, slowest: int = DEFAULT_SLOWEST_FILES) -> dict:
+        """Write the JSON report, print a summary to stderr and return the report."""
+        report = self.report(slowest)
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding='utf-8')
+
+        out = sys.stderr
+        print(f"Load profile: {report['files']} files, {report['loaded']} loaded", file=out)
+        print("Phase totals (ms):", file=out)
+        for phase, seconds in report["phase_totals"].items():
+            print(f"  {phase:<10} {seconds * 1000:10.2f}", file=out)
+        if report["stages"]:
+            print("Stages (ms):", file=out)
+            for name, seconds in report["stages"].items():
+                print(f"  {name:<18} {seconds * 1000:10.2f}", file=out)
+        print(f"Slowest {min(slowest, report['files'])} files (ms):", file=out)
+        for entry in report["per_file"][:slowest]:
+            top = max(entry["phases"].items(), key=lambda item: item[1], default=("-", 0.0))
+            status = "" if entry["loaded"] else "  [skipped]"
+            print(
+                f"  {entry['total'] * 1000:9.2f}  {entry['path']}  (most in {top[0]}: {top[1] * 1000:.2f}){status}",
+                file=out
+            )
+        print(f"Full report written to {output}", file=out)
+        return report
@@ -14,13 +14,29 @@ SECURITY:
 
 from pathlib import Path
 from .utils import load_documents, ParsedDocument
-
-
-def load_markdown_prompts(directory: Path) -> dict[str, tuple[ParsedDocument, str]]:
+from .cache import DocumentCache
+from .profiling import LoadProfiler
+
+
+def load_markdown_prompts(
+    directory: Path,
+    cache: DocumentCache | None = None,
+    workers: int = 1,
+    use_processes: bool = False,
+    header_only: bool = False,
+    recursive: bool = False,
+    profiler: LoadProfiler | None = None
+) -> dict[str, tuple[ParsedDocument, str]]:
     """
     Load all markdown files from directory.
     Returns a dict mapping prompt name to (ParsedDocument, source_path).
 
+    An optional DocumentCache skips re-parsing files that have not changed.
+    With workers > 1, files are loaded concurrently (see load_documents).
+    With header_only, bodies stay on disk and are referenced via body_ref.
+    With recursive, subdirectories are loaded as namespaces ("git/commit.md" -> "git:commit").
+    With a profiler, every file's load phases are timed (see LoadProfiler).
+
     Raises:
         FileNotFoundError: If directory doesn't exist
         NotADirectoryError: If path is not a directory
@@ -31,7 +47,13 @@ def load_markdown_prompts(directory: Path) -> dict[str, tuple[ParsedDocument, st
         file_extensions=['.md'],
         allow_slashes_in_name=False,
         document_type="prompt",
-        parse_arguments=True
+        parse_arguments=True,
+        cache=cache,
+        workers=workers,
+        use_processes=use_processes,
+        header_only=header_only,
+        recursive=recursive,
+        profiler=profiler
     )
 
     if not prompts:
@@ -0,0 +1,169 @@
+"""
+Range-Addressable Resource Module
+
+Lets clients read a large resource one line range at a time instead of
+receiving the whole document per request, and reports each resource's total
+size in resources/list so clients can decide up front whether to page.
+
+Ranges are addressed by line because the catalog is markdown: sections map
+to line ranges, and line boundaries never split a multi-byte character.
+Each resource keeps an index of line start offsets, built on the first range
+read of a given body, so a page is located directly and only the
+requested slice of the body is copied into the response. For lazily loaded
+or compressed bodies the index is cached in the BodyStore next to the
+cached text, holding (and charged for) just the offsets.
+"""
+
+from array import array
+from typing import Callable
+
+from pydantic import PrivateAttr
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import FunctionResource
+from mcp.types import Resource as MCPResource
+
+from .bodies import BodyStore
+from .utils import BodyRef
+
+DEFAULT_RANGE_LINES = 200
+MAX_RANGE_LINES = 5000
+
+
+def build_line_index(text: str) -> array:
+    """Return the start offset of every line in text."""
+    starts = array('L', [0])
+    position = text.find('\n')
+    while position != -1:
+        starts.append(position + 1)
+        position = text.find('\n', position + 1)
+    return starts
+
+
+def _index_body(text: str) -> tuple[array, int]:
+    """Return the line index of a body and its UTF-8 size."""
+    return build_line_index(text), len(text.encode('utf-8'))
+
+
+def _index_bytes(index: tuple[array, int]) -> int:
+    line_starts, _ = index
+    return len(line_starts) * line_starts.itemsize
+
+
+class DocumentResource(FunctionResource):
+    """
+    A catalog resource with a known size and line-range reads.
+
+    size is the UTF-8 size in bytes of the body as served (line endings
+    normalized), reported in resources/list and by range reads. A lazily
+    loaded body is not read at registration, so its size starts as the
+    size on disk, which differs only for CRLF files, and is corrected on
+    its first range read.
+    """
+
+    size: int | None = None
+
+    _text: Callable[[], str] | None = PrivateAttr(default=None)
+    _body_ref: BodyRef | None = PrivateAttr(default=None)
+    _body_store: BodyStore | None = PrivateAttr(default=None)
+    _indexed_text: str | None = PrivateAttr(default=None)
+    _line_index: tuple[array, int] | None = PrivateAttr(default=None)
+
+    def set_text_source(
+        self,
+        text: Callable[[], str],
+        body_ref: BodyRef | None = None,
+        body_store: BodyStore | None = None
+    ) -> None:
+        """
+        Set the function returning the body for range reads (bypasses read instrumentation).
+
+        For a body that is not held in memory (body_ref), text should read
+        it through body_store, where the line index is cached as well.
+        """
+        self._text = text
+        self._body_ref = body_ref
+        self._body_store = body_store
+
+    def _indexed_body(self) -> tuple[str, array, int]:
+        """Return the body text, its line index and its UTF-8 size."""
+        if self._body_ref is not None:
+            text = self._text()
+            if self._body_store is not None:
+                # Built from the text just read, so the body is not read or held twice
+                line_starts, size = self._body_store.get(
+                    self._body_ref, build=_index_body, kind="lines", text=text, weigh=_index_bytes
+                )
+            else:
+                # Nowhere bounded to keep it: index per read
+                line_starts, size = _index_body(text)
+            # Replace the on-disk size reported before the body was read
+            self.size = size
+            return text, line_starts, size
+
+        text = self._text() if self._text is not None else self.fn()
+
+        # The body is resident anyway; rebuild the index only when it changed
+        if text is not self._indexed_text:
+            self._line_index = _index_body(text)
+            self._indexed_text = text
+        line_starts, size = self._line_index
+        return text, line_starts, size
+
+    def read_lines(self, start_line: int = 1, max_lines: int = DEFAULT_RANGE_LINES) -> dict:
+        """
+        Read up to max_lines lines starting at start_line (1-based).
+
+        Returns:
+            Dict with the text and the range actually returned; next_start_line
+            is None when the end of the document was reached
+
+        Raises:
+            ValueError: If the range is invalid
+        """
+        if start_line < 1:
+            raise ValueError("start_line must be at least 1")
+        if not 1 <= max_lines <= MAX_RANGE_LINES:
+            raise ValueError(f"max_lines must be between 1 and {MAX_RANGE_LINES}")
+
+        text, line_starts, size = self._indexed_body()
+
+        # A trailing newline does not start another line
+        total_lines = len(line_starts)
+        if total_lines > 1 and line_starts[-1] == len(text):
+            total_lines -= 1
+
+        if start_line > total_lines:
+            raise ValueError(f"start_line {start_line} is past the end of the document ({total_lines} lines)")
+
+        end_line = min(total_lines, start_line + max_lines - 1)
+        start = line_starts[start_line - 1]
+        end = line_starts[end_line] if end_line < len(line_starts) else len(text)
+
+        return {
+            "start_line": start_line,
+            "end_line": end_line,
+            "total_lines": total_lines,
+            "size": size,
+            "next_start_line": end_line + 1 if end_line < total_lines else None,
+            "text": text[start:end],
+        }
+
+
+def install_resource_sizes(mcp: FastMCP) -> None:
+    """
+    Report DocumentResource sizes in resources/list.
+
+    FastMCP's own handler leaves size unset, so it is replaced by one that
+    fills it in. Call before any handler wrapping (e.g. SessionTracker).
+    """
+    resources = mcp._resource_manager._resources
+
+    async def list_resources() -> list[MCPResource]:
+        listed = await mcp.list_resources()
+        for item in listed:
+            resource = resources.get(str(item.uri))
+            if isinstance(resource, DocumentResource):
+                item.size = resource.size
+        return listed
+
+    mcp._mcp_server.list_resources()(list_resources)
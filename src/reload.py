@@ -0,0 +1,218 @@
+"""
+Catalog Hot Reload Module
+
+Applies file changes reported by the directory watcher to a live FastMCP
+server: only the changed files are re-parsed, and just the affected prompts
+or resources are registered, replaced or unregistered. Connected sessions
+are sent MCP list_changed notifications afterwards.
+"""
+
+import os
+import asyncio
+import logging
+import weakref
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel.server import NotificationOptions
+from .compression import BodyCodec
+from .catalogs import mount_name
+from .utils import (
+    load_document_file,
+    namespace_for_path,
+    sanitize_path_for_logging,
+    ParsedDocument,
+    DEFAULT_MAX_FILE_SIZE_BYTES
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class CatalogReloader:
+    """
+    Track which file provides which document and apply incremental changes.
+
+    Args:
+        directory: The catalog directory being watched
+        documents: The initial load_documents() result for the directory
+        register: Callback registering (or replacing) a document by name
+        unregister: Callback removing a document by name
+        document_type: Type of document (for logging)
+        allow_slashes_in_name: Whether to allow slashes in document names
+        max_file_size: Maximum file size in bytes
+        parse_arguments: Whether to parse arguments field (for prompts)
+        header_only: Index only frontmatter (lazy body loading)
+        recursive: Whether subdirectories are loaded as namespaces
+        body_codec: Compress reloaded bodies in memory with this codec
+        namespace: Mount namespace prefixed to document names (see catalogs)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        documents: dict[str, tuple[ParsedDocument, str]],
+        register: Callable[[str, ParsedDocument], None],
+        unregister: Callable[[str], None],
+        document_type: str = "document",
+        allow_slashes_in_name: bool = False,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+        parse_arguments: bool = False,
+        header_only: bool = False,
+        recursive: bool = False,
+        body_codec: BodyCodec | None = None,
+        namespace: str | None = None
+    ):
+        self.dir_path = directory.resolve()
+        self.register = register
+        self.unregister = unregister
+        self.document_type = document_type
+        self.allow_slashes_in_name = allow_slashes_in_name
+        self.max_file_size = max_file_size
+        self.parse_arguments = parse_arguments
+        self.header_only = header_only
+        self.recursive = recursive
+        self.body_codec = body_codec
+        self.namespace = namespace
+
+        self.paths_by_name = {name: Path(path) for name, (_, path) in documents.items()}
+        self.names_by_path = {path: name for name, path in self.paths_by_name.items()}
+
+    def owns(self, path: Path) -> bool:
+        """Whether a changed path belongs to this catalog directory."""
+        if self.recursive:
+            return path.is_relative_to(self.dir_path)
+        return path.parent == self.dir_path
+
+    def apply(self, paths: set[Path]) -> bool:
+        """
+        Re-parse the given files and update the registered documents.
+
+        Args:
+            paths: Changed file paths (created, modified or deleted)
+
+        Returns:
+            True if any document was registered, replaced or unregistered
+        """
+        changed = False
+
+        for path in sorted(paths):
+            old_name = self.names_by_path.pop(path, None)
+
+            sanitized_path = sanitize_path_for_logging(path, self.dir_path)
+
+            parsed = None
+            if os.path.lexists(path):
+                try:
+                    namespace = namespace_for_path(path, self.dir_path) if self.recursive else None
+                except ValueError as e:
+                    logger.warning(f"Skipping {sanitized_path}: {str(e)}")
+                else:
+                    parsed = load_document_file(
+                        path,
+                        self.dir_path,
+                        allow_slashes_in_name=self.allow_slashes_in_name,
+                        max_file_size=self.max_file_size,
+                        parse_arguments=self.parse_arguments,
+                        header_only=self.header_only,
+                        namespace=namespace
+                    )
+
+            if parsed is not None and self.namespace is not None:
+                try:
+                    parsed.name = mount_name(self.namespace, parsed.name)
+                except ValueError as e:
+                    logger.warning(f"Skipping {sanitized_path}: {str(e)}")
+                    parsed = None
+
+            # Drop the old registration if the file is gone, invalid or renamed
+            if old_name is not None and (parsed is None or parsed.name != old_name):
+                if self.paths_by_name.get(old_name) == path:
+                    del self.paths_by_name[old_name]
+                    self.unregister(old_name)
+                    logger.info(f"Unregistered {self.document_type}: {old_name} ({sanitized_path})")
+                    changed = True
+
+            if parsed is None:
+                continue
+
+            if self.body_codec is not None:
+                parsed = self.body_codec.compress_document(parsed, str(path))
+
+            # Same precedence as load_documents: the last file loaded wins
+            previous_path = self.paths_by_name.get(parsed.name)
+            if previous_path is not None and previous_path != path:
+                self.names_by_path.pop(previous_path, None)
+                logger.warning(f"Duplicate {self.document_type} name '{parsed.name}', using {sanitized_path}")
+
+            self.register(parsed.name, parsed)
+            self.paths_by_name[parsed.name] = path
+            self.names_by_path[path] = parsed.name
+            logger.info(f"Reloaded {self.document_type}: {parsed.name} ({sanitized_path})")
+            changed = True
+
+        return changed
+
+
+class SessionTracker:
+    """
+    Remember connected sessions so list_changed notifications can be sent.
+
+    FastMCP does not expose its sessions, so every request handler is wrapped
+    to record the calling session and its event loop. The server's
+    initialization options are also patched to advertise listChanged support
+    for prompts and resources.
+    """
+
+    def __init__(self):
+        self._sessions = weakref.WeakKeyDictionary()
+
+    def install(self, mcp: FastMCP) -> None:
+        """Wrap the server's request handlers. Call after all handlers are registered."""
+        server = mcp._mcp_server
+
+        for request_type, handler in list(server.request_handlers.items()):
+            server.request_handlers[request_type] = self._wrap(server, handler)
+
+        server.create_initialization_options = partial(
+            server.create_initialization_options,
+            NotificationOptions(prompts_changed=True, resources_changed=True)
+        )
+
+    def _wrap(self, server, handler):
+        async def tracked_handler(request):
+            try:
+                session = server.request_context.session
+                self._sessions[session] = asyncio.get_running_loop()
+            except LookupError:
+                pass
+            return await handler(request)
+        return tracked_handler
+
+    def notify(self, prompts: bool = False, resources: bool = False) -> None:
+        """
+        Send list_changed notifications to every known session.
+
+        Safe to call from any thread; sends are scheduled on each session's loop.
+        """
+        for session, loop in list(self._sessions.items()):
+            if loop.is_closed():
+                self._sessions.pop(session, None)
+                continue
+            if prompts:
+                self._schedule(session, loop, session.send_prompt_list_changed)
+            if resources:
+                self._schedule(session, loop, session.send_resource_list_changed)
+
+    def _schedule(self, session, loop, send) -> None:
+        def done(future):
+            if future.cancelled() or future.exception() is not None:
+                # Session has disconnected; stop notifying it
+                self._sessions.pop(session, None)
+
+        try:
+            asyncio.run_coroutine_threadsafe(send(), loop).add_done_callback(done)
+        except RuntimeError:
+            self._sessions.pop(session, None)
@@ -14,15 +14,31 @@ SECURITY:
 
 from pathlib import Path
 from .utils import load_documents, ParsedDocument
-
-
-def load_resource_documents(directory: Path) -> dict[str, tuple[ParsedDocument, str]]:
+from .cache import DocumentCache
+from .profiling import LoadProfiler
+
+
+def load_resource_documents(
+    directory: Path,
+    cache: DocumentCache | None = None,
+    workers: int = 1,
+    use_processes: bool = False,
+    header_only: bool = False,
+    recursive: bool = False,
+    profiler: LoadProfiler | None = None
+) -> dict[str, tuple[ParsedDocument, str]]:
     """
     Load all resource documents from directory.
     Returns a dict mapping resource name to (ParsedDocument, source_path).
 
     Resources can have slashes in their names for URI-style paths (e.g., "docs/api").
 
+    An optional DocumentCache skips re-parsing files that have not changed.
+    With workers > 1, files are loaded concurrently (see load_documents).
+    With header_only, bodies stay on disk and are referenced via body_ref.
+    With recursive, subdirectories are loaded as namespaces ("git/commit.md" -> "git:commit").
+    With a profiler, every file's load phases are timed (see LoadProfiler).
+
     Raises:
         FileNotFoundError: If directory doesn't exist
         NotADirectoryError: If path is not a directory
@@ -31,7 +47,13 @@ def load_resource_documents(directory: Path) -> dict[str, tuple[ParsedDocument,
         directory=directory,
         file_extensions=['.md'],
         allow_slashes_in_name=True,
-        document_type="resource"
+        document_type="resource",
+        cache=cache,
+        workers=workers,
+        use_processes=use_processes,
+        header_only=header_only,
+        recursive=recursive,
+        profiler=profiler
     )
 
     return resources
\ No newline at end of file
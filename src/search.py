@@ -0,0 +1,226 @@
+"""
+Full-Text Search Module
+
+Inverted index over prompt and resource names, descriptions and bodies,
+ranked with BM25 so clients can find the right document without listing
+the catalog and fetching every body.
+
+Terms from the name and description are weighted above body terms (a
+simple BM25F), since they are written to describe the document. Postings
+map each term to the documents containing it with their weighted term
+frequency, so a query only touches the documents that share a term with it.
+
+The index is updated one document at a time when documents are registered,
+replaced or unregistered, so hot reload keeps it current without rebuilds.
+"""
+
+import re
+import heapq
+import logging
+import math
+import threading
+from dataclasses import dataclass
+
+from .bodies import BodyStore, read_body
+from .utils import ParsedDocument
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term frequency multipliers per field
+NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 2
+CONTENT_WEIGHT = 1
+
+# Too common to help ranking; skipping them keeps postings lists short
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if", "in",
+    "is", "it", "of", "on", "or", "that", "the", "this", "to", "was", "with",
+})
+
+MAX_QUERY_TERMS = 32
+SNIPPET_CHARS = 160
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms, dropping stopwords."""
+    return [term for term in TOKEN_PATTERN.findall(text.lower()) if term not in STOPWORDS]
+
+
+@dataclass
+class _IndexedDocument:
+    kind: str
+    name: str
+    document: ParsedDocument
+    length: int
+    terms: tuple[str, ...]
+
+
+class SearchIndex:
+    """
+    BM25-ranked inverted index of documents keyed by (kind, name).
+
+    kind is "prompt" or "resource". All methods are thread-safe, so the
+    watcher thread can update the index while queries are served.
+
+    Args:
+        body_store: BodyStore used to fetch lazily loaded bodies for snippets
+    """
+
+    def __init__(self, body_store: BodyStore | None = None):
+        self.body_store = body_store
+        self._postings: dict[str, dict[int, int]] = {}
+        self._documents: dict[int, _IndexedDocument] = {}
+        self._lengths: dict[int, int] = {}
+        self._ids: dict[tuple[str, str], int] = {}
+        self._next_id = 0
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _content(self, document: ParsedDocument, indexing: bool = False) -> str:
+        if document.body_ref is None:
+            return document.content
+        if indexing or self.body_store is None:
+            # Read once to index it, without filling the hot body cache
+            return read_body(document.body_ref)
+        return self.body_store.get(document.body_ref)
+
+    def add(self, kind: str, name: str, document: ParsedDocument) -> None:
+        """Index a document, replacing any document with the same kind and name."""
+        try:
+            content = self._content(document, indexing=True)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Indexing {kind} '{name}' without its body: {str(e)}")
+            content = ""
+
+        frequencies: dict[str, int] = {}
+        for text, weight in (
+            (name, NAME_WEIGHT),
+            (document.description, DESCRIPTION_WEIGHT),
+            (content, CONTENT_WEIGHT)
+        ):
+            for term in tokenize(text):
+                frequencies[term] = frequencies.get(term, 0) + weight
+        length = sum(frequencies.values())
+
+        with self._lock:
+            self._remove((kind, name))
+
+            doc_id = self._next_id
+            self._next_id += 1
+            self._ids[(kind, name)] = doc_id
+            self._documents[doc_id] = _IndexedDocument(kind, name, document, length, tuple(frequencies))
+            self._lengths[doc_id] = length
+            self._total_length += length
+
+            for term, frequency in frequencies.items():
+                self._postings.setdefault(term, {})[doc_id] = frequency
+
+    def remove(self, kind: str, name: str) -> None:
+        """Remove a document from the index (no-op if it is not indexed)."""
+        with self._lock:
+            self._remove((kind, name))
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        doc_id = self._ids.pop(key, None)
+        if doc_id is None:
+            return
+        indexed = self._documents.pop(doc_id)
+        del self._lengths[doc_id]
+        self._total_length -= indexed.length
+        for term in indexed.terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str, limit: int = 10, kind: str | None = None) -> list[dict]:
+        """
+        Find the documents best matching query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            kind: Restrict results to "prompt" or "resource"
+
+        Returns:
+            Results ordered by descending score, each with kind, name,
+            description, score and a snippet of the matching text
+        """
+        terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+        if not terms or limit < 1:
+            return []
+
+        with self._lock:
+            count = len(self._documents)
+            if count == 0:
+                return []
+            average_length = self._total_length / count
+
+            lengths = self._lengths
+            k1_plus_1 = BM25_K1 + 1
+            base = BM25_K1 * (1 - BM25_B)
+            scale = BM25_K1 * BM25_B / average_length
+
+            scores: dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                weight = idf * k1_plus_1
+                get_score = scores.get
+                for doc_id, frequency in postings.items():
+                    norm = base + scale * lengths[doc_id]
+                    scores[doc_id] = get_score(doc_id, 0.0) + weight * frequency / (frequency + norm)
+
+            if kind is not None:
+                documents = self._documents
+                candidates = ((score, doc_id) for doc_id, score in scores.items() if documents[doc_id].kind == kind)
+            else:
+                candidates = ((score, doc_id) for doc_id, score in scores.items())
+            top = heapq.nlargest(limit, candidates)
+            matches = [(score, self._documents[doc_id]) for score, doc_id in top]
+
+        # Snippets are built outside the lock (lazy bodies may hit the disk)
+        pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, terms)) + r')', re.IGNORECASE)
+        return [
+            {
+                "kind": indexed.kind,
+                "name": indexed.name,
+                "description": indexed.document.description,
+                "score": round(score, 4),
+                "snippet": self._snippet(indexed.document, pattern),
+            }
+            for score, indexed in matches
+        ]
+
+    def _snippet(self, document: ParsedDocument, pattern: re.Pattern) -> str:
+        """Return about SNIPPET_CHARS characters of the body around the first match."""
+        try:
+            content = self._content(document)
+        except (OSError, ValueError):
+            return document.description
+
+        match = pattern.search(content)
+        if match is None:
+            start = 0
+        else:
+            start = max(0, match.start() - SNIPPET_CHARS // 4)
+        end = min(len(content), start + SNIPPET_CHARS)
+
+        snippet = ' '.join(content[start:end].split())
+        if start > 0:
+            snippet = '…' + snippet
+        if end < len(content):
+            snippet = snippet + '…'
+        return snippet
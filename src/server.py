@@ -5,20 +5,46 @@ MCP Prompt Server - Python Implementation
 Loads markdown files from the prompts directory and exposes them as MCP prompts.
 """
 
+import json
+import asyncio
+import argparse
 import inspect
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 from importlib.resources import files
-from typing import Annotated
+from typing import Annotated, Literal
 
+from pydantic import BaseModel, Field
 from mcp.server.fastmcp import FastMCP
 from .prompts import load_markdown_prompts
 from .resources import load_resource_documents
+from .templates import compile_template, CompiledTemplate, RenderCache, DEFAULT_RENDER_CACHE_ENTRIES, DEFAULT_RENDER_CACHE_BYTES
+from .utils import ParsedDocument, BodyRef
+from .bodies import BodyStore, DEFAULT_BODY_CACHE_BYTES
+from .cache import DocumentCache
+from .reload import CatalogReloader, SessionTracker
+from .watcher import DirectoryWatcher, DEFAULT_POLL_INTERVAL
+from .transport import run_workers, TRANSPORTS, DEFAULT_HOST, DEFAULT_PORT
+from .metrics import MetricsRegistry
+from .search import SearchIndex
+from .bundle import compile_bundle, load_bundle
+from .ranges import DocumentResource, install_resource_sizes, DEFAULT_RANGE_LINES, MAX_RANGE_LINES
+from .includes import IncludeResolver
+from .versions import ContentVersions
+from .completions import CompletionIndex
+from .compression import BodyCodec, CODECS
+from .profiling import LoadProfiler, NULL_TIMER, DEFAULT_PROFILE_REPORT
+from .catalogs import Catalog, parse_catalog_spec, load_catalog, merge_catalogs
+from .store import ContentStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+MAX_SEARCH_RESULTS = 50
+MAX_BATCH_ITEMS = 100
+
 # Directory paths - prioritize local development directory
 # Check for local development directory first (relative to src/server.py)
 local_prompts = Path(__file__).parent.parent / "prompts"
@@ -63,7 +89,20 @@ else:
         logger.info(f"Using fallback resources path: {RESOURCES_DIR}")
 
 
-def create_prompt_handler(content: str, description: str, arguments: list | None = None):
+class BatchPromptRequest(BaseModel):
+    """One prompt to render in a get_batch call."""
+    name: str = Field(description="Prompt name")
+    arguments: dict[str, str] | None = Field(default=None, description="Prompt arguments")
+
+
+def create_prompt_handler(
+    content: str,
+    description: str,
+    arguments: list | None = None,
+    body_ref: BodyRef | None = None,
+    body_store: BodyStore | None = None,
+    template: CompiledTemplate | None = None
+):
     """
     Create a prompt handler function with the appropriate signature.
 
@@ -72,32 +111,56 @@ def create_prompt_handler(content: str, description: str, arguments: list | None
 
     For prompts without arguments, returns a simple function.
     For prompts with arguments, creates a function with expected parameters
-    and signature that FastMCP can introspect.
+    and signature that FastMCP can introspect. The content is compiled once
+    here so each call renders in a single pass.
+
+    With body_ref, the content is not held by the handler: the body is fetched
+    (and compiled) through body_store on first use and cached while hot.
 
     Args:
         content: The prompt template content
         description: The prompt description (becomes the function docstring)
         arguments: Optional list of PromptArgument objects
+        body_ref: Optional on-disk body location for lazy loading
+        body_store: BodyStore used to fetch body_ref (required with body_ref)
+        template: Already compiled content (e.g. shared by identical bodies)
 
     Returns:
         A callable handler function with proper signature and annotations
     """
     if not arguments:
         # Simple handler for prompts without arguments
-        def handler() -> str:
-            return content
+        if body_ref is not None:
+            def handler() -> str:
+                return body_store.get(body_ref)
+        else:
+            def handler() -> str:
+                return content
         handler.__doc__ = description
         return handler
 
+    argument_names = [arg.name for arg in arguments]
+
+    if body_ref is not None:
+        # Compile on first use; the compiled template is cached with the body
+        def get_template():
+            return body_store.get(
+                body_ref,
+                build=lambda text: compile_template(text, argument_names),
+                kind="template"
+            )
+    else:
+        # Compile the template once at registration time
+        if template is None:
+            template = compile_template(content, argument_names)
+
+        def get_template():
+            return template
+
     # Create handler that will be called with validated args
     def handler(**kwargs) -> str:
         """Template handler with dynamic parameters."""
-        
-        # Perform substitution
-        result = content
-        for arg_name, arg_value in kwargs.items():
-            result = result.replace(f'{{{arg_name}}}', str(arg_value))
-        return result
+        return get_template().render(kwargs)
 
     # Build parameters with proper annotations for introspection
     parameters = []
@@ -135,50 +198,709 @@ def create_prompt_handler(content: str, description: str, arguments: list | None
     return handler
 
 
-def main() -> int:
-    """Main entry point for the MCP server."""
+def create_resource_handler(
+    resource_content: str,
+    resource_desc: str,
+    body_ref: BodyRef | None = None,
+    body_store: BodyStore | None = None
+):
+    """
+    Create a resource handler function returning the document content.
+
+    Args:
+        resource_content: The resource document content
+        resource_desc: The resource description (becomes the function docstring)
+        body_ref: Optional on-disk body location for lazy loading
+        body_store: BodyStore used to fetch body_ref (required with body_ref)
+
+    Returns:
+        A callable handler function
+    """
+    if body_ref is not None:
+        def handler() -> str:
+            return body_store.get(body_ref)
+    else:
+        def handler() -> str:
+            return resource_content
+    handler.__doc__ = resource_desc
+    return handler
+
+
+def resource_uri_for(name: str) -> str:
+    """Build the resource URI for a resource name."""
+    # Convert colon to slash for URI compatibility (resource://prompt:template -> resource://prompt/template)
+    return f"resource://{name.replace(':', '/')}"
+
+
+def resolve_resource_uri(name_or_uri: str) -> str:
+    """Return the resource URI for a resource name, or the URI itself."""
+    return name_or_uri if "://" in name_or_uri else resource_uri_for(name_or_uri)
+
+
+def register_prompt(
+    mcp: FastMCP,
+    name: str,
+    parsed_doc: ParsedDocument,
+    body_store: BodyStore | None = None,
+    metrics: MetricsRegistry | None = None,
+    search_index: SearchIndex | None = None,
+    render_cache: RenderCache | None = None,
+    versions: ContentVersions | None = None,
+    content_store: ContentStore | None = None,
+    completions: CompletionIndex | None = None
+) -> None:
+    """Register a prompt on the server, replacing any prompt with the same name."""
+    template = None
+    if content_store is not None:
+        # Identical bodies (and their compiled templates) are stored once
+        content_store.share("prompt", name, parsed_doc)
+        if parsed_doc.arguments and parsed_doc.body_ref is None:
+            template = content_store.template(
+                "prompt", name, parsed_doc.content, [arg.name for arg in parsed_doc.arguments]
+            )
+
+    handler = create_prompt_handler(
+        content=parsed_doc.content,
+        description=parsed_doc.description,
+        arguments=parsed_doc.arguments,
+        body_ref=parsed_doc.body_ref,
+        body_store=body_store,
+        template=template
+    )
+    if render_cache is not None:
+        # Renders of the previous version of this prompt are stale
+        render_cache.invalidate(name)
+        if parsed_doc.arguments:
+            handler = render_cache.wrap(name, handler)
+    if metrics is not None:
+        handler = metrics.instrument("prompt", name, handler)
+
+    # FastMCP keeps the first registration, so drop the old one to replace it
+    mcp._prompt_manager._prompts.pop(name, None)
+    mcp.prompt(name)(handler)
+
+    if search_index is not None:
+        search_index.add("prompt", name, parsed_doc)
+    if versions is not None:
+        versions.set_prompt(name, parsed_doc)
+    if completions is not None:
+        completions.set_prompt(name, parsed_doc)
+
+
+def unregister_prompt(
+    mcp: FastMCP,
+    name: str,
+    search_index: SearchIndex | None = None,
+    render_cache: RenderCache | None = None,
+    versions: ContentVersions | None = None,
+    content_store: ContentStore | None = None,
+    completions: CompletionIndex | None = None
+) -> None:
+    """Remove a prompt from the server."""
+    mcp._prompt_manager._prompts.pop(name, None)
+    if render_cache is not None:
+        render_cache.invalidate(name)
+    if search_index is not None:
+        search_index.remove("prompt", name)
+    if versions is not None:
+        versions.remove_prompt(name)
+    if content_store is not None:
+        content_store.release("prompt", name)
+    if completions is not None:
+        completions.remove_prompt(name)
+
+
+def register_resource(
+    mcp: FastMCP,
+    name: str,
+    parsed_doc: ParsedDocument,
+    body_store: BodyStore | None = None,
+    metrics: MetricsRegistry | None = None,
+    search_index: SearchIndex | None = None,
+    versions: ContentVersions | None = None,
+    content_store: ContentStore | None = None,
+    completions: CompletionIndex | None = None
+) -> None:
+    """Register a resource on the server, replacing any resource with the same name."""
+    if content_store is not None:
+        content_store.share("resource", name, parsed_doc)
+
+    resource_handler = create_resource_handler(
+        parsed_doc.content,
+        parsed_doc.description,
+        body_ref=parsed_doc.body_ref,
+        body_store=body_store
+    )
+    text_source = resource_handler
+    if metrics is not None:
+        resource_handler = metrics.instrument("resource", name, resource_handler)
+    resource_uri = resource_uri_for(name)
 
-    # Load prompts from directory
+    resource = DocumentResource.from_function(resource_handler, uri=resource_uri, name=name)
+    if parsed_doc.body_ref is not None:
+        resource.size = parsed_doc.body_ref.length
+    else:
+        resource.size = len(parsed_doc.content.encode('utf-8'))
+    # Range reads fetch the body directly rather than counting as full reads
+    resource.set_text_source(text_source, body_ref=parsed_doc.body_ref, body_store=body_store)
+
+    # FastMCP keeps the first registration, so drop the old one to replace it
+    mcp._resource_manager._resources.pop(resource_uri, None)
+    mcp._resource_manager.add_resource(resource)
+
+    if search_index is not None:
+        search_index.add("resource", name, parsed_doc)
+    if versions is not None:
+        versions.set_resource(resource_uri, parsed_doc)
+    if completions is not None:
+        completions.add_resource(name)
+
+
+def unregister_resource(
+    mcp: FastMCP,
+    name: str,
+    search_index: SearchIndex | None = None,
+    versions: ContentVersions | None = None,
+    content_store: ContentStore | None = None,
+    completions: CompletionIndex | None = None
+) -> None:
+    """Remove a resource from the server."""
+    resource_uri = resource_uri_for(name)
+    mcp._resource_manager._resources.pop(resource_uri, None)
+    if search_index is not None:
+        search_index.remove("resource", name)
+    if versions is not None:
+        versions.remove_resource(resource_uri)
+    if content_store is not None:
+        content_store.release("resource", name)
+    if completions is not None:
+        completions.remove_resource(name)
+
+
+def catalog_spec(value: str) -> tuple[str, Path]:
+    """argparse type for --catalog NAMESPACE=DIR."""
     try:
-        prompts_data = load_markdown_prompts(PROMPTS_DIR)
-    except Exception as e:
-        logger.error(f"Failed to load prompts: {e}")
+        return parse_catalog_spec(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid catalog '{value}': {e}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="mcp-prompt-server",
+        description="MCP server that exposes markdown files as prompts"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Reload changed prompts and resources without restarting"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll file mtime/size instead of using inotify"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Seconds between polling scans (default: {DEFAULT_POLL_INTERVAL})"
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Load subdirectories of prompts/ and resources/ as namespaces (git/commit.md -> git:commit)"
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        help="Persist parsed frontmatter here so unchanged files skip parsing on the next start"
+    )
+    parser.add_argument(
+        "--load-workers",
+        type=int,
+        default=1,
+        help="Number of concurrent workers for loading documents (default: 1, serial)"
+    )
+    parser.add_argument(
+        "--load-processes",
+        action="store_true",
+        help="With --load-workers, parse frontmatter in a process pool instead of threads"
+    )
+    parser.add_argument(
+        "--lazy-bodies",
+        action="store_true",
+        help="Index only frontmatter at startup and read bodies from disk on first use"
+    )
+    parser.add_argument(
+        "--body-cache-bytes",
+        type=int,
+        default=DEFAULT_BODY_CACHE_BYTES,
+        help=f"With --lazy-bodies or --compress-bodies, byte budget for hot bodies kept in memory (default: {DEFAULT_BODY_CACHE_BYTES})"
+    )
+    parser.add_argument(
+        "--compress-bodies",
+        nargs="?",
+        const="auto",
+        choices=CODECS,
+        help="Keep bodies compressed in memory (zlib, or zstd when installed); "
+             "hot bodies are cached decompressed within --body-cache-bytes"
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default="stdio",
+        help="Transport to serve on (default: stdio)"
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help=f"Host to bind for HTTP transports (default: {DEFAULT_HOST})"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Port to bind for HTTP transports (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for streamable-http; the catalog is loaded once before forking (default: 1)"
+    )
+    parser.add_argument(
+        "--stateless",
+        action="store_true",
+        help="Serve streamable-http without per-session state (implied by --workers > 1)"
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Record per-prompt/resource call counts, latency and bytes, served by the 'metrics' tool"
+    )
+    parser.add_argument(
+        "--search",
+        action="store_true",
+        help="Index names, descriptions and bodies for the BM25-ranked 'search' tool"
+    )
+    parser.add_argument(
+        "--render-cache",
+        action="store_true",
+        help="Memoize rendered prompts per (name, argument values) in an LRU cache"
+    )
+    parser.add_argument(
+        "--render-cache-entries",
+        type=int,
+        default=DEFAULT_RENDER_CACHE_ENTRIES,
+        help=f"With --render-cache, maximum cached renders (default: {DEFAULT_RENDER_CACHE_ENTRIES})"
+    )
+    parser.add_argument(
+        "--render-cache-bytes",
+        type=int,
+        default=DEFAULT_RENDER_CACHE_BYTES,
+        help=f"With --render-cache, byte budget for cached renders (default: {DEFAULT_RENDER_CACHE_BYTES})"
+    )
+    parser.add_argument(
+        "--bundle",
+        type=Path,
+        help="Load the catalog from a bundle written by the compile command instead of parsing files"
+    )
+    parser.add_argument(
+        "--catalog",
+        action="append",
+        default=[],
+        type=catalog_spec,
+        metavar="NAMESPACE=DIR",
+        help="Also serve the prompts/ and resources/ of DIR under NAMESPACE (repeatable); "
+             "identical bodies across catalogs are stored once"
+    )
+    parser.add_argument(
+        "--profile-load",
+        nargs="?",
+        const=Path(DEFAULT_PROFILE_REPORT),
+        type=Path,
+        metavar="REPORT",
+        help="Time every load phase of every file, print the slowest files and phase totals, "
+             f"and write a JSON report (default: {DEFAULT_PROFILE_REPORT})"
+    )
+    parser.add_argument(
+        "--includes",
+        action="store_true",
+        help="Expand {{include: resource-name}} directives in prompt and resource bodies at load time"
+    )
+
+    subcommands = parser.add_subparsers(dest="command")
+    compile_parser = subcommands.add_parser(
+        "compile",
+        help="Validate the catalog and write it to a bundle for zero-parse startup"
+    )
+    compile_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=Path("catalog.bundle"),
+        help="Bundle file to write (default: catalog.bundle)"
+    )
+    compile_parser.add_argument(
+        "--prompts-dir",
+        type=Path,
+        default=PROMPTS_DIR,
+        help="Prompts directory to compile (default: the server's prompts directory)"
+    )
+    compile_parser.add_argument(
+        "--resources-dir",
+        type=Path,
+        default=RESOURCES_DIR,
+        help="Resources directory to compile (default: the server's resources directory)"
+    )
+    compile_parser.add_argument(
+        "--recursive",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Compile subdirectories as namespaces"
+    )
+    compile_parser.add_argument(
+        "--includes",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Store bodies with include directives expanded"
+    )
+    return parser.parse_args(argv)
+
+
+def start_watcher(
+    mcp: FastMCP,
+    catalogs: list[Catalog],
+    args: argparse.Namespace,
+    body_store: BodyStore | None = None,
+    metrics: MetricsRegistry | None = None,
+    search_index: SearchIndex | None = None,
+    render_cache: RenderCache | None = None,
+    include_resolver: IncludeResolver | None = None,
+    versions: ContentVersions | None = None,
+    body_codec: BodyCodec | None = None,
+    content_store: ContentStore | None = None,
+    completions: CompletionIndex | None = None
+) -> DirectoryWatcher:
+    """
+    Watch the prompt and resource directories of every catalog and hot reload changed files.
+
+    Each catalog holds its documents as loaded (before include expansion).
+    Must be called after all handlers are registered on the server.
+    """
+    sessions = SessionTracker()
+    sessions.install(mcp)
+
+    registrars = {
+        "prompt": (
+            lambda name, doc: register_prompt(
+                mcp, name, doc,
+                body_store=body_store, metrics=metrics, search_index=search_index, render_cache=render_cache,
+                versions=versions, content_store=content_store, completions=completions
+            ),
+            lambda name: unregister_prompt(
+                mcp, name,
+                search_index=search_index, render_cache=render_cache, versions=versions, content_store=content_store,
+                completions=completions
+            )
+        ),
+        "resource": (
+            lambda name, doc: register_resource(
+                mcp, name, doc,
+                body_store=body_store, metrics=metrics, search_index=search_index, versions=versions,
+                content_store=content_store, completions=completions
+            ),
+            lambda name: unregister_resource(
+                mcp, name,
+                search_index=search_index, versions=versions, content_store=content_store, completions=completions
+            )
+        ),
+    }
+
+    # Kinds re-registered because a document they include changed
+    dependents_changed = set()
+
+    def callbacks(kind: str, namespace: str | None) -> tuple:
+        if include_resolver is None:
+            return registrars[kind]
+
+        def apply(changes: tuple) -> None:
+            register, unregister = changes
+            for changed_kind, name in unregister:
+                registrars[changed_kind][1](name)
+                dependents_changed.add(changed_kind)
+            for changed_kind, name, doc in register:
+                registrars[changed_kind][0](name, doc)
+                dependents_changed.add(changed_kind)
+
+        return (
+            lambda name, doc: apply(include_resolver.update(kind, name, doc, namespace)),
+            lambda name: apply(include_resolver.update(kind, name, None, namespace))
+        )
+
+    reloaders = []
+    directories = []
+    for catalog in catalogs:
+        register, unregister = callbacks("prompt", catalog.namespace)
+        reloaders.append(("prompt", CatalogReloader(
+            catalog.prompts_dir,
+            catalog.prompts,
+            register=register,
+            unregister=unregister,
+            document_type="prompt",
+            parse_arguments=True,
+            header_only=args.lazy_bodies,
+            recursive=args.recursive,
+            body_codec=body_codec,
+            namespace=catalog.namespace
+        )))
+        register, unregister = callbacks("resource", catalog.namespace)
+        reloaders.append(("resource", CatalogReloader(
+            catalog.resources_dir,
+            catalog.resources,
+            register=register,
+            unregister=unregister,
+            document_type="resource",
+            allow_slashes_in_name=True,
+            header_only=args.lazy_bodies,
+            recursive=args.recursive,
+            body_codec=body_codec,
+            namespace=catalog.namespace
+        )))
+        directories.extend(d for d in (catalog.prompts_dir, catalog.resources_dir) if d.is_dir())
+
+    def on_change(paths: set) -> None:
+        if body_store is not None:
+            for path in paths:
+                body_store.discard(str(path))
+        dependents_changed.clear()
+        changed = set()
+        for kind, reloader in reloaders:
+            if reloader.apply({p for p in paths if reloader.owns(p)}):
+                changed.add(kind)
+        sessions.notify(
+            prompts="prompt" in changed or "prompt" in dependents_changed,
+            resources="resource" in changed or "resource" in dependents_changed
+        )
+
+    watcher = DirectoryWatcher(
+        directories,
+        file_extensions=['.md'],
+        on_change=on_change,
+        poll_interval=args.poll_interval,
+        use_inotify=not args.poll,
+        recursive=args.recursive
+    )
+    watcher.start()
+    return watcher
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for the MCP server."""
+    args = parse_args(argv)
+
+    if args.workers > 1 and args.transport != "streamable-http":
+        logger.error("--workers > 1 requires --transport streamable-http")
         return 1
 
-    # Load resources from directory
-    try:
-        resources_data = load_resource_documents(RESOURCES_DIR)
-    except Exception as e:
-        logger.warning(f"Failed to load resources: {e}")
-        resources_data = {}
+    if args.command == "compile":
+        problems = compile_bundle(
+            args.prompts_dir,
+            args.resources_dir,
+            args.output,
+            recursive=args.recursive,
+            includes=args.includes
+        )
+        return 1 if problems else 0
+
+    if args.bundle and args.watch:
+        logger.error("--watch cannot be used with --bundle (rebuild the bundle instead)")
+        return 1
+
+    profiler = LoadProfiler() if args.profile_load else None
+
+    # Optional parse cache shared by prompts and resources of every catalog
+    cache = None
+    if args.cache_file and not (args.bundle and not args.catalog):
+        cache = DocumentCache(args.cache_file)
+        cache.load()
+
+    if args.bundle:
+        # Precompiled catalog: no directory scan or YAML parsing
+        try:
+            with profiler.stage("bundle") if profiler is not None else nullcontext():
+                prompts_data, resources_data = load_bundle(args.bundle, header_only=args.lazy_bodies)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load bundle: {e}")
+            return 1
+        if not prompts_data:
+            logger.error("Failed to load prompts: bundle contains no prompts")
+            return 1
+    else:
+        # Load prompts from directory
+        try:
+            prompts_data = load_markdown_prompts(
+                PROMPTS_DIR,
+                cache=cache,
+                workers=args.load_workers,
+                use_processes=args.load_processes,
+                header_only=args.lazy_bodies,
+                recursive=args.recursive,
+                profiler=profiler
+            )
+        except Exception as e:
+            logger.error(f"Failed to load prompts: {e}")
+            return 1
+
+        # Load resources from directory
+        try:
+            resources_data = load_resource_documents(
+                RESOURCES_DIR,
+                cache=cache,
+                workers=args.load_workers,
+                use_processes=args.load_processes,
+                header_only=args.lazy_bodies,
+                recursive=args.recursive,
+                profiler=profiler
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load resources: {e}")
+            resources_data = {}
+
+    # The server's own catalog, then any mounted ones
+    catalogs = [Catalog(None, PROMPTS_DIR, RESOURCES_DIR, prompts_data, resources_data)]
+    for namespace, root in args.catalog:
+        if any(catalog.namespace == namespace for catalog in catalogs):
+            logger.error(f"Catalog namespace '{namespace}' is mounted twice")
+            return 1
+        try:
+            catalogs.append(load_catalog(
+                namespace,
+                root,
+                cache=cache,
+                workers=args.load_workers,
+                use_processes=args.load_processes,
+                header_only=args.lazy_bodies,
+                recursive=args.recursive,
+                profiler=profiler
+            ))
+        except OSError as e:
+            logger.error(f"Failed to mount catalog '{namespace}': {e}")
+            return 1
+        logger.info(f"Mounted catalog '{namespace}' from {root}")
+
+    if cache is not None:
+        cache.save()
+
+    # Compress bodies before anything else holds on to the loaded strings
+    body_codec = None
+    if args.compress_bodies:
+        try:
+            body_codec = BodyCodec(args.compress_bodies)
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+        with profiler.stage("compress") if profiler is not None else nullcontext():
+            for catalog in catalogs:
+                catalog.prompts = body_codec.compress_documents(catalog.prompts)
+                catalog.resources = body_codec.compress_documents(catalog.resources)
+        logger.info(f"Compressed bodies with {body_codec.name}: {body_codec.stats()['compression_ratio']}x")
+
+    prompts_data = merge_catalogs(catalogs, "prompt")
+    resources_data = merge_catalogs(catalogs, "resource")
+
+    # Expand includes once, so requests serve the stored bodies as before
+    include_resolver = None
+    registered_prompts, registered_resources = prompts_data, resources_data
+    if args.includes:
+        include_resolver = IncludeResolver()
+        # Includes resolve within each document's own catalog
+        namespaces = {
+            (kind, name): catalog.namespace
+            for catalog in catalogs
+            for kind, documents in (("prompt", catalog.prompts), ("resource", catalog.resources))
+            for name in documents
+        }
+        with profiler.stage("includes") if profiler is not None else nullcontext():
+            registered_prompts, registered_resources = include_resolver.resolve_all(
+                prompts_data, resources_data, namespaces
+            )
+
+    # Bodies are read (or decompressed) on first use and cached while hot
+    body_store = None
+    if args.lazy_bodies or body_codec is not None:
+        body_store = BodyStore(max_bytes=args.body_cache_bytes)
+
+    metrics = MetricsRegistry() if args.metrics else None
+    search_index = SearchIndex(body_store=body_store) if args.search else None
+
+    render_cache = None
+    if args.render_cache:
+        render_cache = RenderCache(max_entries=args.render_cache_entries, max_bytes=args.render_cache_bytes)
+        if metrics is not None:
+            metrics.add_stats("render_cache", render_cache.stats)
+    if metrics is not None and body_codec is not None:
+        metrics.add_stats("body_compression", body_codec.stats)
+
+    # Mounted catalogs share identical bodies through one content-addressed store
+    content_store = None
+    if len(catalogs) > 1:
+        content_store = ContentStore()
+        if metrics is not None:
+            metrics.add_stats("content_store", content_store.stats)
+
+    # Content hashes, so clients can skip fetching unchanged documents
+    versions = ContentVersions(
+        roots=[directory for catalog in catalogs for directory in (catalog.prompts_dir, catalog.resources_dir)]
+    )
+
+    # Prefix tries for completion/complete, kept current by registration
+    completions = CompletionIndex()
 
     # Create FastMCP server
-    mcp = FastMCP("file-prompts")
+    mcp = FastMCP(
+        "file-prompts",
+        host=args.host,
+        port=args.port,
+        stateless_http=args.stateless or args.workers > 1
+    )
 
     # Dynamically register each markdown file as a prompt
-    for name, (parsed_doc, _) in prompts_data.items():
+    for name, (parsed_doc, source_path) in registered_prompts.items():
         logger.info(f"Registering prompt: {name}")
-
-        handler = create_prompt_handler(
-            content=parsed_doc.content,
-            description=parsed_doc.description,
-            arguments=parsed_doc.arguments
+        timer = profiler.timer_for(source_path, "prompt") if profiler is not None else NULL_TIMER
+        timer.restart()
+        register_prompt(
+            mcp, name, parsed_doc,
+            body_store=body_store, metrics=metrics, search_index=search_index, render_cache=render_cache,
+            versions=versions, content_store=content_store, completions=completions
         )
-
-        mcp.prompt(name)(handler)
+        timer.mark("register")
 
     # Dynamically register each resource document
-    for name, (parsed_doc, _) in resources_data.items():
-        def create_resource_handler(resource_content: str, resource_desc: str):
-            def handler() -> str:
-                return resource_content
-            handler.__doc__ = resource_desc
-            return handler
+    for name, (parsed_doc, source_path) in registered_resources.items():
+        timer = profiler.timer_for(source_path, "resource") if profiler is not None else NULL_TIMER
+        timer.restart()
+        register_resource(
+            mcp, name, parsed_doc,
+            body_store=body_store, metrics=metrics, search_index=search_index, versions=versions,
+            content_store=content_store, completions=completions
+        )
+        timer.mark("register")
+
+    if content_store is not None:
+        stats = content_store.stats()
+        logger.info(
+            f"Content store: {stats['unique_bodies']} unique bodies for {stats['documents']} documents "
+            f"({stats['saved_bytes']} bytes saved)"
+        )
 
-        resource_handler = create_resource_handler(parsed_doc.content, parsed_doc.description)
-        # Convert colon to slash for URI compatibility (resource://prompt:template -> resource://prompt/template)
-        resource_uri = name.replace(':', '/')
-        mcp.resource(f"resource://{resource_uri}", name=name)(resource_handler)
+    if profiler is not None:
+        try:
+            profiler.write_report(args.profile_load)
+        except OSError as e:
+            logger.warning(f"Failed to write load profile: {e}")
 
     # Register ping tool
     @mcp.tool()
@@ -186,5 +908,151 @@ def main() -> int:
         """Simple ping tool that returns pong"""
         return "pong"
 
+    # Report resource sizes and allow paging through large resources
+    install_resource_sizes(mcp)
+
+    @mcp.tool()
+    def read_resource_range(
+        uri: Annotated[str, "Resource URI (e.g. resource://prompt/template)"],
+        start_line: Annotated[int, "First line to return (1-based)"] = 1,
+        max_lines: Annotated[int, f"Maximum number of lines to return (1-{MAX_RANGE_LINES})"] = DEFAULT_RANGE_LINES
+    ) -> str:
+        """Read a line range of a resource; use next_start_line to page through large documents"""
+        resource = mcp._resource_manager._resources.get(uri)
+        if not isinstance(resource, DocumentResource):
+            raise ValueError(f"Unknown resource: {uri}")
+        result = {"uri": uri, **resource.read_lines(start_line, max_lines)}
+        return json.dumps(result, ensure_ascii=False)
+
+    # Report content hashes in list/get/read results
+    versions.install(mcp)
+
+    # Complete resource names and suggested prompt argument values
+    completions.install(mcp)
+
+    async def render_prompt(name: str, arguments: dict[str, str] | None) -> list[dict]:
+        prompt = await mcp.get_prompt(name, arguments)
+        return [message.model_dump(mode="json", exclude_none=True) for message in prompt.messages]
+
+    async def read_resource_text(uri: str) -> str:
+        contents = await mcp.read_resource(uri)
+        return "".join(item.content for item in contents if isinstance(item.content, str))
+
+    @mcp.tool()
+    async def get_if_changed(
+        name: Annotated[str, "Prompt name, or resource name or URI"],
+        hash: Annotated[str, "The contentHash the client already has"],
+        kind: Annotated[Literal["prompt", "resource"], "Whether name refers to a prompt or a resource"] = "prompt",
+        arguments: Annotated[dict[str, str] | None, "Prompt arguments, used if the prompt changed"] = None
+    ) -> str:
+        """Fetch a prompt or resource only if its content hash differs from the one given"""
+        result = {"kind": kind, "name": name}
+        if kind == "prompt":
+            current = versions.prompt(name)
+        else:
+            uri = result["uri"] = resolve_resource_uri(name)
+            current = versions.resource(uri)
+        if current is None:
+            raise ValueError(f"Unknown {kind}: {name}")
+
+        result["contentHash"] = current
+        result["modified"] = current != hash
+        if not result["modified"]:
+            return json.dumps(result)
+
+        if kind == "prompt":
+            result["messages"] = await render_prompt(name, arguments)
+        else:
+            result["content"] = await read_resource_text(uri)
+        return json.dumps(result, ensure_ascii=False)
+
+    @mcp.tool()
+    async def get_batch(
+        prompts: Annotated[list[BatchPromptRequest] | None, "Prompts to render, each with its arguments"] = None,
+        resources: Annotated[list[str] | None, "Resource names or URIs to read"] = None
+    ) -> str:
+        """Render many prompts and read many resources in one call; failures are reported per item"""
+        prompts = prompts or []
+        resources = resources or []
+        if len(prompts) + len(resources) > MAX_BATCH_ITEMS:
+            raise ValueError(f"A batch can request at most {MAX_BATCH_ITEMS} items")
+
+        async def fetch_prompt(request: BatchPromptRequest) -> dict:
+            item = {"name": request.name}
+            try:
+                item["messages"] = await render_prompt(request.name, request.arguments)
+                item["contentHash"] = versions.prompt(request.name)
+            except Exception as e:
+                item["error"] = str(e)
+            return item
+
+        async def fetch_resource(name: str) -> dict:
+            uri = resolve_resource_uri(name)
+            item = {"name": name, "uri": uri}
+            try:
+                item["content"] = await read_resource_text(uri)
+                item["contentHash"] = versions.resource(uri)
+            except Exception as e:
+                item["error"] = str(e)
+            return item
+
+        prompt_items, resource_items = await asyncio.gather(
+            asyncio.gather(*(fetch_prompt(request) for request in prompts)),
+            asyncio.gather(*(fetch_resource(name) for name in resources))
+        )
+        result = {
+            "prompts": prompt_items,
+            "resources": resource_items,
+            "errors": sum("error" in item for item in prompt_items + resource_items)
+        }
+        return json.dumps(result, ensure_ascii=False)
+
+    if metrics is not None:
+        @mcp.tool(name="metrics")
+        def get_metrics(
+            format: Annotated[
+                Literal["json", "prometheus"],
+                "Output format: JSON summary with p50/p95/p99 in milliseconds, or Prometheus text"
+            ] = "json"
+        ) -> str:
+            """Per-prompt and per-resource call counts, latency percentiles, bytes returned and errors"""
+            if format == "prometheus":
+                return metrics.to_prometheus()
+            return json.dumps(metrics.snapshot(), indent=2)
+
+    if search_index is not None:
+        @mcp.tool()
+        def search(
+            query: Annotated[str, "Free-text query matched against names, descriptions and bodies"],
+            limit: Annotated[int, "Maximum number of results (1-50)"] = 10,
+            kind: Annotated[Literal["all", "prompt", "resource"], "Restrict results to prompts or resources"] = "all"
+        ) -> str:
+            """Search prompts and resources, ranked by relevance (BM25) with snippets"""
+            results = search_index.search(
+                query,
+                limit=max(1, min(limit, MAX_SEARCH_RESULTS)),
+                kind=None if kind == "all" else kind
+            )
+            for result in results:
+                if result["kind"] == "resource":
+                    result["uri"] = resource_uri_for(result["name"])
+            return json.dumps(results, indent=2, ensure_ascii=False)
+
+    def start_background_tasks() -> None:
+        # Watch for catalog changes (after all handlers are registered)
+        if args.watch:
+            start_watcher(
+                mcp, catalogs, args,
+                body_store=body_store, metrics=metrics, search_index=search_index, render_cache=render_cache,
+                include_resolver=include_resolver, versions=versions, body_codec=body_codec,
+                content_store=content_store, completions=completions
+            )
+
+    # Pre-forked workers share the catalog loaded above
+    if args.workers > 1:
+        return run_workers(mcp, args.workers, on_worker_start=start_background_tasks)
+
+    start_background_tasks()
+
     # Run the server
-    mcp.run(transport="stdio")
\ No newline at end of file
+    mcp.run(transport=args.transport)
\ No newline at end of file
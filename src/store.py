@@ -0,0 +1,141 @@
+"""
+Content-Addressed Body Store
+
+When several catalogs are mounted, most of their documents tend to be
+copies of each other. The store keeps one copy of each distinct body, keyed
+by its BLAKE2b digest, and points every document with that body at the
+shared copy, so memory grows with unique content rather than with the
+number of catalogs. Compiled prompt templates are shared the same way.
+
+Bodies are reference counted per (kind, name): replacing or unregistering a
+document releases its body, and a body nobody refers to is dropped.
+Compressed bodies (--compress-bodies) are shared by their compressed bytes:
+documents with the same body get the same CompressedBody, so its
+decompressed (and compiled) form is also cached once in the BodyStore.
+Lazily loaded bodies live on disk and are not stored.
+"""
+
+import hashlib
+import threading
+
+from .compression import CompressedBody
+from .templates import compile_template, CompiledTemplate
+from .utils import ParsedDocument
+
+DIGEST_SIZE = 16
+
+
+class _StoredBody:
+    __slots__ = ("value", "size", "refs", "templates")
+
+    def __init__(self, value: str | CompressedBody, size: int):
+        self.value = value
+        self.size = size
+        self.refs = 0
+        self.templates: dict[tuple[str, ...], CompiledTemplate] = {}
+
+
+class ContentStore:
+    """
+    Deduplicating store of document bodies, shared across catalogs.
+
+    Thread-safe, so the watcher thread can share and release bodies while
+    requests are served.
+    """
+
+    def __init__(self):
+        self._bodies: dict[bytes, _StoredBody] = {}
+        self._owners: dict[tuple[str, str], bytes] = {}
+        self.logical_bytes = 0
+        self.stored_bytes = 0
+        self._lock = threading.Lock()
+
+    def share(self, kind: str, name: str, parsed: ParsedDocument) -> None:
+        """
+        Point a document at the stored copy of its body, storing it if new.
+
+        The document is updated in place (content, or body_ref for a
+        compressed body), so every holder of the loaded document shares the
+        copy.
+        Any body previously stored for (kind, name) is released.
+        """
+        ref = parsed.body_ref
+        if ref is None:
+            data = parsed.content.encode('utf-8')
+            value = parsed.content
+            tag = b"t"
+        elif isinstance(ref, CompressedBody):
+            data = ref.data
+            value = ref
+            tag = b"z:" + ref.codec.name.encode('ascii')
+        else:
+            # Lazily loaded from disk: nothing resident to share
+            self.release(kind, name)
+            return
+
+        digest = hashlib.blake2b(data, digest_size=DIGEST_SIZE, person=tag.ljust(16, b"\0")[:16]).digest()
+        key = (kind, name)
+
+        with self._lock:
+            stored = self._bodies.get(digest)
+            if stored is None:
+                stored = self._bodies[digest] = _StoredBody(value, len(data))
+                self.stored_bytes += stored.size
+
+            previous = self._owners.get(key)
+            if previous != digest:
+                stored.refs += 1
+                self.logical_bytes += stored.size
+                self._owners[key] = digest
+                if previous is not None:
+                    self._release(previous)
+            shared = stored.value
+
+        if ref is None:
+            parsed.content = shared
+        else:
+            # Same bytes and codec, so the same text, length and digest; the
+            # path stays that of the first document (it only drives discard())
+            parsed.body_ref = shared
+
+    def template(self, kind: str, name: str, content: str, argument_names: list[str]) -> CompiledTemplate:
+        """Return the compiled template for a shared body, compiling it once per distinct body."""
+        signature = tuple(argument_names)
+        with self._lock:
+            digest = self._owners.get((kind, name))
+            stored = self._bodies.get(digest) if digest is not None else None
+            if stored is not None and signature in stored.templates:
+                return stored.templates[signature]
+
+        template = compile_template(content, argument_names)
+        if stored is not None:
+            with self._lock:
+                template = stored.templates.setdefault(signature, template)
+        return template
+
+    def release(self, kind: str, name: str) -> None:
+        """Release the body stored for a document (no-op if none)."""
+        with self._lock:
+            digest = self._owners.pop((kind, name), None)
+            if digest is not None:
+                self._release(digest)
+
+    def _release(self, digest: bytes) -> None:
+        stored = self._bodies[digest]
+        stored.refs -= 1
+        self.logical_bytes -= stored.size
+        if stored.refs == 0:
+            del self._bodies[digest]
+            self.stored_bytes -= stored.size
+
+    def stats(self) -> dict:
+        """Return deduplication statistics."""
+        with self._lock:
+            return {
+                "documents": len(self._owners),
+                "unique_bodies": len(self._bodies),
+                "logical_bytes": self.logical_bytes,
+                "stored_bytes": self.stored_bytes,
+                "saved_bytes": self.logical_bytes - self.stored_bytes,
+                "dedup_ratio": round(self.logical_bytes / self.stored_bytes, 3) if self.stored_bytes else 0,
+            }
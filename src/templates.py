@@ -0,0 +1,180 @@
+"""
+Prompt Template Compilation Module
+
+Compiles prompt bodies into a list of literal segments and argument slots so
+rendering is a single join instead of one full-body str.replace per argument.
+
+Only `{argument_name}` placeholders for declared arguments become slots; any
+other braces are kept verbatim. Substituted values are never re-scanned, so a
+value containing `{other_arg}` is returned literally.
+
+RenderCache optionally memoizes rendered output per (prompt name, argument
+values), so repeated calls with the same values skip rendering entirely.
+"""
+
+import re
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+DEFAULT_RENDER_CACHE_ENTRIES = 1024
+DEFAULT_RENDER_CACHE_BYTES = 16 * 1024 * 1024  # 16MB of rendered prompts
+
+# Same character set as argument names accepted by parse_frontmatter
+PLACEHOLDER_PATTERN = re.compile(r'\{([a-zA-Z0-9_]+)\}')
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A prompt body split into literal text and argument slots.
+
+    `literals` always has exactly one more element than `slots`; rendering
+    interleaves them as literals[0], slots[0], literals[1], ...
+    """
+    literals: tuple[str, ...]
+    slots: tuple[str, ...]
+
+    def render(self, values: dict[str, object]) -> str:
+        """
+        Render the template in a single pass.
+
+        Slots without a value are emitted as the original `{name}` placeholder.
+
+        Args:
+            values: Mapping of argument name to value (converted with str())
+
+        Returns:
+            The rendered prompt text
+        """
+        if not self.slots:
+            return self.literals[0]
+
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            if slot in values:
+                parts.append(str(values[slot]))
+            else:
+                parts.append(f'{{{slot}}}')
+            parts.append(literal)
+        return ''.join(parts)
+
+
+def compile_template(content: str, argument_names: list[str] | None = None) -> CompiledTemplate:
+    """
+    Compile prompt content into a CompiledTemplate.
+
+    Args:
+        content: The prompt body
+        argument_names: Declared argument names; placeholders for any other
+            name are treated as literal text
+
+    Returns:
+        CompiledTemplate ready for repeated rendering
+    """
+    if not argument_names:
+        return CompiledTemplate(literals=(content,), slots=())
+
+    names = set(argument_names)
+    literals = []
+    slots = []
+    start = 0
+
+    for match in PLACEHOLDER_PATTERN.finditer(content):
+        if match.group(1) not in names:
+            continue
+        literals.append(content[start:match.start()])
+        slots.append(match.group(1))
+        start = match.end()
+
+    literals.append(content[start:])
+
+    return CompiledTemplate(literals=tuple(literals), slots=tuple(slots))
+
+
+class RenderCache:
+    """
+    LRU cache of rendered prompts keyed by (name, argument values).
+
+    Bounded by both entry count and total size of the cached output
+    (UTF-8 bytes). Entries for a prompt are dropped with invalidate() when
+    its document is reloaded or removed.
+
+    Args:
+        max_entries: Maximum number of cached renders
+        max_bytes: Budget for cached rendered output
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RENDER_CACHE_ENTRIES, max_bytes: int = DEFAULT_RENDER_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[str, int]] = OrderedDict()
+        self._keys_by_name: dict[str, set[tuple]] = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, name: str, handler: Callable[..., str]) -> Callable[..., str]:
+        """
+        Memoize a prompt handler's output per argument values.
+
+        The wrapper keeps the handler's signature, annotations and docstring,
+        so FastMCP introspects it exactly like the original.
+        """
+        @functools.wraps(handler)
+        def cached(**kwargs):
+            key = (name, tuple(sorted((arg, str(value)) for arg, value in kwargs.items())))
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self.misses += 1
+
+            rendered = handler(**kwargs)
+            self._put(name, key, rendered)
+            return rendered
+        return cached
+
+    def _put(self, name: str, key: tuple, rendered: str) -> None:
+        size = len(rendered.encode('utf-8'))
+        if size > self.max_bytes or self.max_entries < 1:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (rendered, size)
+            self._keys_by_name.setdefault(name, set()).add(key)
+            self.current_bytes += size
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self._forget(evicted_key, evicted_size)
+
+    def _forget(self, key: tuple, size: int) -> None:
+        self.current_bytes -= size
+        keys = self._keys_by_name.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_name[key[0]]
+
+    def invalidate(self, name: str) -> None:
+        """Drop every cached render of the named prompt."""
+        with self._lock:
+            for key in self._keys_by_name.pop(name, ()):
+                _, size = self._entries.pop(key)
+                self.current_bytes -= size
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current usage."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+            }
@@ -0,0 +1,115 @@
+"""
+Network Transport Module
+
+Serves the MCP server over streamable HTTP from several pre-forked worker
+processes that share one listening socket.
+
+The catalog is loaded and every handler registered in the parent before
+forking, so workers share the loaded documents copy-on-write instead of
+each parsing the catalog again.
+
+Multi-worker serving requires stateless streamable HTTP: consecutive
+requests from one client may land on different workers, so no per-session
+state can live in a worker. SSE keeps a long-lived stream per session in one
+process and is therefore single-worker only.
+"""
+
+import os
+import signal
+import socket
+import logging
+from typing import Callable
+
+from mcp.server.fastmcp import FastMCP
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ["stdio", "streamable-http", "sse"]
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+
+def create_listening_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """
+    Bind and listen on host:port before forking so all workers accept from it.
+
+    Raises:
+        OSError: If the address cannot be bound
+    """
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.create_server((host, port), family=family, backlog=backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_workers(
+    mcp: FastMCP,
+    workers: int,
+    on_worker_start: Callable[[], None] | None = None
+) -> int:
+    """
+    Serve mcp over streamable HTTP from pre-forked worker processes.
+
+    The parent process only supervises: SIGTERM is forwarded to the workers,
+    and SIGINT is left to reach them through the terminal's process group.
+
+    Args:
+        mcp: The fully registered server (must use stateless_http)
+        workers: Number of worker processes to fork
+        on_worker_start: Optional callback run in each worker after fork
+            (e.g. to start threads, which do not survive fork)
+
+    Returns:
+        0 if every worker exited cleanly, 1 otherwise
+    """
+    import uvicorn
+
+    if not hasattr(os, 'fork'):
+        raise RuntimeError("Multiple workers require os.fork (not available on this platform)")
+
+    if not mcp.settings.stateless_http:
+        raise ValueError("Multiple workers require stateless streamable HTTP")
+
+    sock = create_listening_socket(mcp.settings.host, mcp.settings.port)
+    logger.info(f"Serving streamable HTTP on {mcp.settings.host}:{mcp.settings.port} with {workers} workers")
+
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                if on_worker_start is not None:
+                    on_worker_start()
+                config = uvicorn.Config(
+                    mcp.streamable_http_app(),
+                    log_level=mcp.settings.log_level.lower()
+                )
+                uvicorn.Server(config).run(sockets=[sock])
+            except BaseException as e:
+                logger.error(f"Worker {os.getpid()} failed: {e}")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        pids.append(pid)
+
+    sock.close()
+
+    def forward(signum, frame):
+        for pid in pids:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    exit_code = 0
+    for pid in pids:
+        _, status = os.waitpid(pid, 0)
+        if os.waitstatus_to_exitcode(status) != 0:
+            exit_code = 1
+
+    return exit_code
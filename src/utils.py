@@ -12,12 +12,22 @@ SECURITY:
 - Symlinks are resolved and validated to prevent directory escape.
 """
 
+import io
 import os
 import re
+import sys
 import logging
 import yaml
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
+from contextlib import nullcontext
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .profiling import LoadProfiler, PhaseTimer, NULL_TIMER
+
+if TYPE_CHECKING:
+    from .cache import DocumentCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,26 +35,75 @@ logger = logging.getLogger(__name__)
 # Security constants - these are hard limits that cannot be overridden
 MAX_NAME_LENGTH = 100  # Maximum length for names
 MAX_DESCRIPTION_LENGTH = 200  # Maximum length for descriptions
+MAX_ARGUMENT_SUGGESTIONS = 1000  # Maximum suggested values per prompt argument
 
 # Default file size limit (can be overridden per document type)
 DEFAULT_MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB default limit
 
+# Frontmatter must close within this many lines (DoS prevention)
+MAX_FRONTMATTER_LINES = 100
+
+# Use libyaml's C loader when PyYAML was built with it (same safe subset)
+YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-@dataclass
+# Compiled once; validation runs for every document and argument
+# Note: colon is always allowed to support namespace:name format
+SAFE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\s:]+$')
+SAFE_NAME_WITH_SLASHES_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\s/:]+$')
+ARGUMENT_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+
+
+@dataclass(slots=True)
 class PromptArgument:
     """Represents a prompt argument definition compatible with MCP spec."""
     name: str
     description: str | None = None
     required: bool = False
+    # Values offered for completion/complete (not enforced when rendering)
+    suggestions: tuple[str, ...] | None = None
+
 
+@dataclass(frozen=True, slots=True)
+class BodyRef:
+    """Location of a document body on disk, used for lazy body loading."""
+    path: str
+    offset: int
+    length: int
+    file_size: int
+    mtime_ns: int
 
-@dataclass
+
+@dataclass(slots=True)
 class ParsedDocument:
-    """Result of parsing a document's frontmatter."""
+    """Result of parsing a document's frontmatter.
+
+    When loaded with header_only, body_ref points at the body on disk and
+    content is empty; the body is fetched on demand through a BodyStore.
+    With in-memory compression, body_ref is a compression.CompressedBody
+    instead, read the same way.
+
+    Records are slotted (no per-instance __dict__), and loaded documents
+    have their name and argument names interned (see _finish_document).
+    """
     name: str
     description: str
     content: str
     arguments: list[PromptArgument] | None = None
+    body_ref: BodyRef | None = None
+
+
+@dataclass(slots=True)
+class DocumentFile:
+    """A document file that passed the security checks and has been read.
+
+    For header-only reads, content holds just the frontmatter and
+    body_offset is the byte offset where the body starts.
+    """
+    path: Path
+    resolved_path: Path
+    stat: os.stat_result
+    content: str
+    body_offset: int | None = None
 
 
 def transform_name_to_namespaced(name: str) -> str:
@@ -87,19 +146,96 @@ def validate_safe_name(name: str, allow_slashes: bool = False) -> None:
     if '..' in name or '\\' in name:
         raise ValueError("Name contains invalid path characters")
 
-    # Build regex pattern based on whether slashes are allowed
-    # Note: colon is always allowed to support namespace:name format
-    if allow_slashes:
-        pattern = r'^[a-zA-Z0-9_\-\s/:]+$'
-    else:
-        pattern = r'^[a-zA-Z0-9_\-\s:]+$'
+    # Pick the pattern based on whether slashes are allowed
+    pattern = SAFE_NAME_WITH_SLASHES_PATTERN if allow_slashes else SAFE_NAME_PATTERN
 
-    if not re.match(pattern, name):
+    if not pattern.match(name):
         allowed = "alphanumeric, dash, underscore, colon, slash, and spaces" if allow_slashes else "alphanumeric, dash, underscore, colon, and spaces"
         raise ValueError(f"Name contains invalid characters (only {allowed} allowed)")
 
 
-def parse_frontmatter(content: str, allow_slashes_in_name: bool = False, parse_arguments: bool = False) -> ParsedDocument:
+def split_frontmatter(content: str) -> tuple[str, str]:
+    """
+    Split content into frontmatter text and body.
+
+    Args:
+        content: The file content with frontmatter
+
+    Returns:
+        Tuple of (frontmatter_text, body)
+
+    Raises:
+        ValueError: If the frontmatter delimiters are missing
+    """
+    # Scan line by line from the start so only the header is examined;
+    # the body is returned as a single slice of content
+    first_end = content.find('\n')
+    first_line = content if first_end == -1 else content[:first_end]
+
+    if first_line.strip() != '---':
+        raise ValueError("No valid frontmatter found")
+
+    if first_end != -1:
+        header_start = first_end + 1
+        line_start = header_start
+
+        # Find closing delimiter (limit to first 100 lines to prevent DoS)
+        for _ in range(1, MAX_FRONTMATTER_LINES):
+            line_end = content.find('\n', line_start)
+            line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+
+            if line.strip() == '---':
+                frontmatter_text = content[header_start:max(header_start, line_start - 1)]
+                body = '' if line_end == -1 else content[line_end + 1:]
+                return frontmatter_text, body
+
+            if line_end == -1:
+                break
+            line_start = line_end + 1
+
+    raise ValueError("No closing frontmatter delimiter found")
+
+
+def read_frontmatter_header(f) -> tuple[str, int]:
+    """
+    Read only the frontmatter lines from a binary file object.
+
+    Reading stops after the closing delimiter (or MAX_FRONTMATTER_LINES), so
+    the body is never read. Line endings are normalized like text mode.
+
+    Args:
+        f: A file object opened in binary mode, positioned at the start
+
+    Returns:
+        Tuple of (header_text, body_offset) where body_offset is the byte
+        offset of the first body byte
+    """
+    lines = []
+    offset = 0
+
+    for i in range(MAX_FRONTMATTER_LINES):
+        raw = f.readline()
+        if not raw:
+            break
+        offset += len(raw)
+        line = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        lines.append(line)
+
+        # Stop at a missing opening delimiter or at the closing one
+        is_delimiter = line.strip() == '---'
+        if (i == 0 and not is_delimiter) or (i > 0 and is_delimiter):
+            break
+
+    return ''.join(lines), offset
+
+
+def parse_frontmatter(
+    content: str,
+    allow_slashes_in_name: bool = False,
+    parse_arguments: bool = False,
+    namespace: str | None = None,
+    timer: PhaseTimer = NULL_TIMER
+) -> ParsedDocument:
     """
     Parse YAML frontmatter from content.
 
@@ -107,6 +243,10 @@ def parse_frontmatter(content: str, allow_slashes_in_name: bool = False, parse_a
         content: The file content with frontmatter
         allow_slashes_in_name: Whether to allow slashes in the name field
         parse_arguments: Whether to parse the arguments field (for prompts)
+        namespace: Namespace from the file's subdirectory (e.g. "git" or
+            "team:git"); when given it is prefixed to the name instead of
+            converting the first hyphen
+        timer: Times the split, yaml and validate phases (--profile-load)
 
     Returns:
         ParsedDocument with extracted metadata and content
@@ -114,29 +254,46 @@ def parse_frontmatter(content: str, allow_slashes_in_name: bool = False, parse_a
     Raises:
         ValueError: If frontmatter is missing or invalid
     """
-    lines = content.split('\n')
+    frontmatter_text, body = split_frontmatter(content)
+    timer.mark("split")
+
+    parsed = parse_frontmatter_text(
+        frontmatter_text,
+        allow_slashes_in_name=allow_slashes_in_name,
+        parse_arguments=parse_arguments,
+        namespace=namespace,
+        timer=timer
+    )
+    parsed.content = body
+    return parsed
 
-    if not lines or lines[0].strip() != '---':
-        raise ValueError("No valid frontmatter found")
 
-    # Find closing delimiter (limit to first 100 lines to prevent DoS)
-    closing_index = None
-    for i in range(1, min(len(lines), 100)):
-        if lines[i].strip() == '---':
-            closing_index = i
-            break
+def parse_frontmatter_text(
+    frontmatter_text: str,
+    allow_slashes_in_name: bool = False,
+    parse_arguments: bool = False,
+    namespace: str | None = None,
+    timer: PhaseTimer = NULL_TIMER
+) -> ParsedDocument:
+    """
+    Parse and validate the YAML between the frontmatter delimiters.
 
-    if closing_index is None:
-        raise ValueError("No closing frontmatter delimiter found")
+    Takes only the header (see split_frontmatter), so the process pool
+    loader ships just the header to its workers. Arguments are as for
+    parse_frontmatter.
 
-    frontmatter_text = '\n'.join(lines[1:closing_index])
-    body = '\n'.join(lines[closing_index + 1:])
+    Returns:
+        ParsedDocument with an empty content (the caller adds the body)
 
+    Raises:
+        ValueError: If the frontmatter is invalid
+    """
     # Parse YAML frontmatter using PyYAML
     try:
-        fields = yaml.safe_load(frontmatter_text) or {}
+        fields = yaml.load(frontmatter_text, Loader=YAML_SAFE_LOADER) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in frontmatter: {e}")
+    timer.mark("yaml")
 
     # Extract required fields
     name = fields.get('name')
@@ -158,50 +315,94 @@ def parse_frontmatter(content: str, allow_slashes_in_name: bool = False, parse_a
     # Validate name is safe (before transformation)
     validate_safe_name(name, allow_slashes=allow_slashes_in_name)
 
-    # Transform name to namespaced format (first hyphen becomes colon)
-    name = transform_name_to_namespaced(name)
+    if namespace:
+        # Subdirectories provide the namespace: "git/commit.md" -> "git:commit"
+        name = f"{namespace}:{name}"
+        if len(name) > MAX_NAME_LENGTH:
+            raise ValueError(f"Name exceeds maximum length of {MAX_NAME_LENGTH}")
+    else:
+        # Transform name to namespaced format (first hyphen becomes colon)
+        name = transform_name_to_namespaced(name)
 
     # Parse arguments if requested (for prompts)
     arguments = None
     if parse_arguments:
         arguments_raw = fields.get('arguments')
         if arguments_raw is not None:
-            if not isinstance(arguments_raw, list):
-                raise ValueError("arguments must be a list")
+            arguments = parse_prompt_arguments(arguments_raw)
 
-            arguments = []
-            for arg in arguments_raw:
-                if not isinstance(arg, dict):
-                    raise ValueError("Each argument must be an object with 'name' field")
+    timer.mark("validate")
+    return ParsedDocument(
+        name=name,
+        description=description,
+        content="",
+        arguments=arguments
+    )
 
-                arg_name = arg.get('name')
-                if not arg_name or not isinstance(arg_name, str):
-                    raise ValueError("Argument must have a 'name' field (string)")
 
-                if not re.match(r'^[a-zA-Z0-9_]+$', arg_name):
-                    raise ValueError(f"Invalid argument name '{arg_name}' (only alphanumeric and underscore allowed)")
+def parse_prompt_arguments(arguments_raw) -> list[PromptArgument]:
+    """
+    Validate a prompt's 'arguments' list and build its PromptArguments.
 
-                # Optional fields with SDK defaults
-                arg_description = arg.get('description')  # Default: None
-                if arg_description is not None and not isinstance(arg_description, str):
-                    raise ValueError(f"Argument description must be a string for '{arg_name}'")
+    Shared by frontmatter parsing and the parse cache, so cached arguments
+    pass exactly the same checks as freshly parsed ones.
 
-                arg_required = arg.get('required', False)  # SDK default: False
-                if not isinstance(arg_required, bool):
-                    raise ValueError(f"Argument 'required' must be a boolean for '{arg_name}'")
+    Raises:
+        ValueError: If the list or any argument is invalid
+    """
+    if not isinstance(arguments_raw, list):
+        raise ValueError("arguments must be a list")
 
-                arguments.append(PromptArgument(
-                    name=arg_name,
-                    description=arg_description,
-                    required=arg_required
-                ))
+    arguments = []
+    for arg in arguments_raw:
+        if not isinstance(arg, dict):
+            raise ValueError("Each argument must be an object with 'name' field")
 
-    return ParsedDocument(
-        name=name,
-        description=description,
-        content=body,
-        arguments=arguments
-    )
+        arg_name = arg.get('name')
+        if not arg_name or not isinstance(arg_name, str):
+            raise ValueError("Argument must have a 'name' field (string)")
+
+        if not ARGUMENT_NAME_PATTERN.match(arg_name):
+            raise ValueError(f"Invalid argument name '{arg_name}' (only alphanumeric and underscore allowed)")
+
+        # Optional fields with SDK defaults
+        arg_description = arg.get('description')  # Default: None
+        if arg_description is not None and not isinstance(arg_description, str):
+            raise ValueError(f"Argument description must be a string for '{arg_name}'")
+
+        arg_required = arg.get('required', False)  # SDK default: False
+        if not isinstance(arg_required, bool):
+            raise ValueError(f"Argument 'required' must be a boolean for '{arg_name}'")
+
+        arguments.append(PromptArgument(
+            name=arg_name,
+            description=arg_description,
+            required=arg_required,
+            suggestions=parse_argument_suggestions(arg.get('suggestions'), arg_name)
+        ))
+    return arguments
+
+
+def parse_argument_suggestions(value, arg_name: str) -> tuple[str, ...] | None:
+    """
+    Validate an argument's optional 'suggestions' list.
+
+    Raises:
+        ValueError: If suggestions is not a list of single-line strings or is too long
+    """
+    if value is None:
+        return None
+    if not isinstance(value, list):
+        raise ValueError(f"Argument 'suggestions' must be a list for '{arg_name}'")
+    if len(value) > MAX_ARGUMENT_SUGGESTIONS:
+        raise ValueError(f"Argument '{arg_name}' has more than {MAX_ARGUMENT_SUGGESTIONS} suggestions")
+    for suggestion in value:
+        if not isinstance(suggestion, str) or not suggestion:
+            raise ValueError(f"Argument suggestions must be non-empty strings for '{arg_name}'")
+        if len(suggestion) > MAX_DESCRIPTION_LENGTH or '\n' in suggestion or '\r' in suggestion:
+            raise ValueError(f"Argument suggestion too long or not single-line for '{arg_name}'")
+    # Duplicates are dropped, order is kept
+    return tuple(dict.fromkeys(value)) or None
 
 
 def sanitize_path_for_logging(path: Path, base_dir: Path) -> str:
@@ -221,17 +422,414 @@ def sanitize_path_for_logging(path: Path, base_dir: Path) -> str:
         return "<file outside base directory>"
 
 
+def scan_document_files(
+    dir_path: Path,
+    file_extensions: list[str],
+    recursive: bool = False
+) -> list[tuple[Path, os.stat_result, str | None]]:
+    """
+    List candidate document files with os.scandir.
+
+    The file type and lstat data come from each DirEntry, so no separate
+    is_symlink()/resolve()/stat() calls are needed per file. Symlinks (files
+    or directories) are skipped and never followed, so every returned path
+    is inside dir_path by construction.
+
+    With recursive=True, subdirectories are walked and map to namespaces:
+    "git/commit.md" gets namespace "git", "team/git/commit.md" gets
+    "team:git". Hidden directories (starting with ".") are skipped.
+
+    Args:
+        dir_path: The resolved base directory
+        file_extensions: List of allowed file extensions
+        recursive: Whether to descend into subdirectories
+
+    Returns:
+        List of (file_path, lstat_result, namespace) in directory listing order
+    """
+    found = []
+    pending = [(dir_path, None)]
+
+    while pending:
+        current_dir, namespace = pending.pop(0)
+
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    entry_path = Path(entry.path)
+
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not recursive or entry.name.startswith('.'):
+                                continue
+                            try:
+                                validate_safe_name(entry.name)
+                            except ValueError as e:
+                                sanitized_path = sanitize_path_for_logging(entry_path, dir_path)
+                                logger.warning(f"Skipping {sanitized_path}: {str(e)}")
+                                continue
+                            child_namespace = f"{namespace}:{entry.name}" if namespace else entry.name
+                            pending.append((entry_path, child_namespace))
+                            continue
+
+                        # Check file extension
+                        if not any(entry.name.endswith(ext) for ext in file_extensions):
+                            continue
+
+                        # Skip symlinks for security (file type comes from the
+                        # directory listing, checked before anything is opened)
+                        if entry.is_symlink():
+                            sanitized_path = sanitize_path_for_logging(entry_path, dir_path)
+                            logger.warning(f"Skipping {sanitized_path}: symlinks not allowed")
+                            continue
+
+                        found.append((entry_path, entry.stat(follow_symlinks=False), namespace))
+
+                    except OSError as e:
+                        sanitized_path = sanitize_path_for_logging(entry_path, dir_path)
+                        logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
+
+        except OSError as e:
+            if current_dir == dir_path:
+                raise
+            sanitized_path = sanitize_path_for_logging(current_dir, dir_path)
+            logger.warning(f"Skipping {sanitized_path}: {str(e)}")
+
+    return found
+
+
+def namespace_for_path(doc_file: Path, dir_path: Path) -> str | None:
+    """
+    Return the subdirectory namespace for a file (None at the top level).
+
+    Applies the same directory rules as scan_document_files.
+
+    Raises:
+        ValueError: If the file is in a hidden or invalidly named directory
+    """
+    parts = doc_file.relative_to(dir_path).parent.parts
+    for part in parts:
+        if part.startswith('.'):
+            raise ValueError("hidden directories are not loaded")
+        validate_safe_name(part)
+    return ':'.join(parts) if parts else None
+
+
+def _open_nofollow(doc_file: Path):
+    """Open a file for binary reading without following a final symlink."""
+    fd = os.open(doc_file, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    return os.fdopen(fd, 'rb')
+
+
+def read_document_file(
+    doc_file: Path,
+    dir_path: Path,
+    max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+    header_only: bool = False,
+    file_stat: os.stat_result | None = None,
+    timer: PhaseTimer = NULL_TIMER
+) -> DocumentFile | None:
+    """
+    Run the security checks for a single document file and read it.
+
+    Skipped and unreadable files are logged as warnings and return None.
+
+    Args:
+        doc_file: The file to read (must be inside dir_path)
+        dir_path: The resolved base directory the file must stay within
+        max_file_size: Maximum file size in bytes (default: 10MB)
+        header_only: Read only the frontmatter and record the body offset
+        file_stat: lstat result from scan_document_files; the file is then
+            already known to be a regular, non-symlink file inside dir_path,
+            so the symlink, resolve and stat calls are skipped
+        timer: Times the resolve, stat and read phases (--profile-load)
+
+    Returns:
+        DocumentFile with the file content, or None if the file was skipped
+    """
+    try:
+        if file_stat is None:
+            # Check if it's a symlink (skip symlinks for security)
+            # IMPORTANT: Check BEFORE resolving to prevent TOCTOU attacks
+            if doc_file.is_symlink():
+                sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
+                logger.warning(f"Skipping {sanitized_path}: symlinks not allowed")
+                return None
+
+            # Resolve the file path and validate it's within the base directory
+            resolved_file = doc_file.resolve()
+            timer.mark("resolve")
+            file_stat = doc_file.stat()
+            timer.mark("stat")
+        else:
+            # Scanned without following symlinks from a resolved base directory
+            resolved_file = doc_file
+
+        # Security check: ensure resolved path is still within base directory
+        if not resolved_file.is_relative_to(dir_path):
+            sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
+            logger.warning(f"Skipping {sanitized_path}: path traversal detected")
+            return None
+        timer.mark("resolve")
+
+        # Check file size before reading
+        file_size = file_stat.st_size
+        if file_size > max_file_size:
+            sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
+            logger.warning(f"Skipping {sanitized_path}: file exceeds size limit ({file_size} > {max_file_size} bytes)")
+            return None
+        timer.mark("stat")
+
+        # O_NOFOLLOW: a file swapped for a symlink after the check is not followed
+        body_offset = None
+        with _open_nofollow(doc_file) as f:
+            if header_only:
+                content, body_offset = read_frontmatter_header(f)
+            else:
+                # Text mode decoding, same as Path.read_text() (universal newlines)
+                with io.TextIOWrapper(f, encoding='utf-8') as text:
+                    content = text.read()
+        timer.mark("read")
+
+    except (ValueError, OSError) as e:
+        sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
+        logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
+        return None
+    except Exception as e:
+        sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
+        logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
+        return None
+
+    return DocumentFile(
+        path=doc_file,
+        resolved_path=resolved_file,
+        stat=file_stat,
+        content=content,
+        body_offset=body_offset
+    )
+
+
+def intern_path(path: Path | str) -> str:
+    """
+    Return the shared string for a source path.
+
+    Paths go through the interpreter's string table, so the source path
+    returned by load_documents and the path in a document's BodyRef are one
+    object instead of a copy per reference.
+    """
+    return sys.intern(str(path))
+
+
+def _finish_document(parsed: ParsedDocument, document_file: DocumentFile) -> ParsedDocument:
+    """
+    Compact a freshly loaded document and point header-only documents at their body.
+
+    Names and argument names are interned: they repeat across the registry,
+    handlers, caches and indexes, which then share one string each.
+    """
+    parsed.name = sys.intern(parsed.name)
+    if parsed.arguments:
+        for arg in parsed.arguments:
+            arg.name = sys.intern(arg.name)
+
+    if document_file.body_offset is not None:
+        parsed.body_ref = BodyRef(
+            path=intern_path(document_file.resolved_path),
+            offset=document_file.body_offset,
+            length=document_file.stat.st_size - document_file.body_offset,
+            file_size=document_file.stat.st_size,
+            mtime_ns=document_file.stat.st_mtime_ns
+        )
+    return parsed
+
+
+def load_document_file(
+    doc_file: Path,
+    dir_path: Path,
+    allow_slashes_in_name: bool = False,
+    max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+    parse_arguments: bool = False,
+    cache: "DocumentCache | None" = None,
+    header_only: bool = False,
+    namespace: str | None = None,
+    file_stat: os.stat_result | None = None,
+    timer: PhaseTimer = NULL_TIMER
+) -> ParsedDocument | None:
+    """
+    Load and parse a single document file with security checks.
+
+    Skipped and invalid files are logged as warnings and return None.
+
+    Args:
+        doc_file: The file to load (must be inside dir_path)
+        dir_path: The resolved base directory the file must stay within
+        allow_slashes_in_name: Whether to allow slashes in document names
+        max_file_size: Maximum file size in bytes (default: 10MB)
+        parse_arguments: Whether to parse arguments field (for prompts)
+        cache: Optional parse cache consulted before parsing frontmatter
+        header_only: Read only the frontmatter; the body is left on disk
+            and referenced through ParsedDocument.body_ref
+        namespace: Subdirectory namespace prefixed to the document name
+        file_stat: lstat result from scan_document_files (see read_document_file)
+        timer: Times each load phase of this file (--profile-load)
+
+    Returns:
+        ParsedDocument, or None if the file was skipped
+    """
+    document_file = read_document_file(
+        doc_file,
+        dir_path,
+        max_file_size=max_file_size,
+        header_only=header_only,
+        file_stat=file_stat,
+        timer=timer
+    )
+    if document_file is None:
+        return None
+
+    try:
+        # Reuse cached metadata when the file content is unchanged
+        cache_options = [allow_slashes_in_name, parse_arguments, namespace, header_only]
+        if cache is not None:
+            parsed = cache.lookup(document_file.resolved_path, document_file.stat, document_file.content, cache_options)
+            timer.mark("cache")
+            if parsed is not None:
+                return _finish_document(parsed, document_file)
+
+        # Parse frontmatter
+        parsed = parse_frontmatter(
+            document_file.content,
+            allow_slashes_in_name=allow_slashes_in_name,
+            parse_arguments=parse_arguments,
+            namespace=namespace,
+            timer=timer
+        )
+
+        if cache is not None:
+            cache.store(document_file.resolved_path, document_file.stat, document_file.content, cache_options, parsed)
+            timer.mark("cache")
+
+        return _finish_document(parsed, document_file)
+
+    except (ValueError, OSError) as e:
+        sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
+        logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
+        return None
+    except Exception as e:
+        sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
+        logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
+        return None
+
+
+def _parse_in_processes(
+    scanned: list[tuple[Path, os.stat_result, str | None]],
+    dir_path: Path,
+    allow_slashes_in_name: bool,
+    max_file_size: int,
+    parse_arguments: bool,
+    cache: "DocumentCache | None",
+    workers: int,
+    header_only: bool
+) -> list[ParsedDocument | None]:
+    """
+    Read files in a thread pool and parse frontmatter in a process pool.
+
+    Files are split here and only the frontmatter text goes to the workers;
+    bodies never cross the process boundary.
+
+    Results are returned in the same order as scanned.
+    """
+    pending = []
+
+    with ProcessPoolExecutor(max_workers=workers) as parse_pool:
+        # Start the workers before any reader thread exists: forking while
+        # another thread holds a lock (e.g. logging's) can deadlock the
+        # child. With fork, the first submit launches every worker.
+        parse_pool.submit(os.getpid).result()
+        with ThreadPoolExecutor(max_workers=workers) as io_pool:
+            # map() yields reads in order as they finish, so parsing starts
+            # while later files are still being read
+            reads = io_pool.map(
+                lambda item: read_document_file(
+                    item[0], dir_path, max_file_size=max_file_size, header_only=header_only, file_stat=item[1]
+                ),
+                scanned
+            )
+
+            for (_, _, namespace), document_file in zip(scanned, reads):
+                if document_file is None:
+                    pending.append((None, None, None))
+                    continue
+
+                cache_options = [allow_slashes_in_name, parse_arguments, namespace, header_only]
+                if cache is not None:
+                    parsed = cache.lookup(document_file.resolved_path, document_file.stat, document_file.content, cache_options)
+                    if parsed is not None:
+                        pending.append((document_file, _finish_document(parsed, document_file), cache_options))
+                        continue
+
+                try:
+                    frontmatter_text, body = split_frontmatter(document_file.content)
+                except ValueError as e:
+                    sanitized_path = sanitize_path_for_logging(document_file.path, dir_path)
+                    logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
+                    pending.append((None, None, None))
+                    continue
+
+                future = parse_pool.submit(
+                    parse_frontmatter_text,
+                    frontmatter_text,
+                    allow_slashes_in_name,
+                    parse_arguments,
+                    namespace
+                )
+                pending.append((document_file, (future, body), cache_options))
+
+            results = []
+            for document_file, outcome, cache_options in pending:
+                if document_file is None or isinstance(outcome, ParsedDocument):
+                    results.append(outcome)
+                    continue
+
+                future, body = outcome
+                try:
+                    parsed = future.result()
+                except Exception as e:
+                    sanitized_path = sanitize_path_for_logging(document_file.path, dir_path)
+                    logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
+                    results.append(None)
+                    continue
+                parsed.content = body
+
+                if cache is not None:
+                    cache.store(document_file.resolved_path, document_file.stat, document_file.content, cache_options, parsed)
+                results.append(_finish_document(parsed, document_file))
+
+    return results
+
+
 def load_documents(
     directory: Path,
     file_extensions: list[str],
     allow_slashes_in_name: bool = False,
     document_type: str = "document",
     max_file_size: int = DEFAULT_MAX_FILE_SIZE_BYTES,
-    parse_arguments: bool = False
+    parse_arguments: bool = False,
+    cache: "DocumentCache | None" = None,
+    workers: int = 1,
+    use_processes: bool = False,
+    header_only: bool = False,
+    recursive: bool = False,
+    profiler: LoadProfiler | None = None
 ) -> dict[str, tuple[ParsedDocument, str]]:
     """
     Generic document loader that handles validation and security checks.
 
+    With workers > 1, files are loaded concurrently: reads overlap in a
+    thread pool and, with use_processes, frontmatter parsing fans out to a
+    process pool. Results (including which duplicate name wins) are
+    identical to serial loading.
+
     Args:
         directory: The directory to load documents from
         file_extensions: List of allowed file extensions (e.g., ['.md', '.txt'])
@@ -239,6 +837,15 @@ def load_documents(
         document_type: Type of document being loaded (for logging)
         max_file_size: Maximum file size in bytes (default: 10MB)
         parse_arguments: Whether to parse arguments field (for prompts)
+        cache: Optional parse cache; unchanged files skip frontmatter parsing
+        workers: Number of concurrent loader workers (default: 1, serial)
+        use_processes: Parse frontmatter in a process pool (requires workers > 1)
+        header_only: Index only the frontmatter; bodies stay on disk and are
+            referenced through ParsedDocument.body_ref (see BodyStore)
+        recursive: Also load subdirectories, which map to name namespaces
+            (see scan_document_files)
+        profiler: Time each file's load phases and the directory scan;
+            parsing then stays in this process (use_processes is ignored)
 
     Returns:
         Dict mapping document name to (ParsedDocument, source_path)
@@ -256,61 +863,56 @@ def load_documents(
     if not dir_path.is_dir():
         raise NotADirectoryError(f"{document_type.capitalize()} path is not a directory")
 
-    documents = {}
-
-    # Only load from top-level directory (no recursive traversal)
-    for filename in os.listdir(dir_path):
-        # Check file extension
-        if not any(filename.endswith(ext) for ext in file_extensions):
-            continue
-
-        doc_file = dir_path / filename
-
-        try:
-            # Check if it's a symlink (skip symlinks for security)
-            # IMPORTANT: Check BEFORE resolving to prevent TOCTOU attacks
-            if doc_file.is_symlink():
-                sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
-                logger.warning(f"Skipping {sanitized_path}: symlinks not allowed")
-                continue
-
-            # Resolve the file path and validate it's within the base directory
-            resolved_file = doc_file.resolve()
-
-            # Security check: ensure resolved path is still within base directory
-            if not resolved_file.is_relative_to(dir_path):
-                sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
-                logger.warning(f"Skipping {sanitized_path}: path traversal detected")
-                continue
-
-            # Check file size before reading
-            file_size = doc_file.stat().st_size
-            if file_size > max_file_size:
-                sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
-                logger.warning(f"Skipping {sanitized_path}: file exceeds size limit ({file_size} > {max_file_size} bytes)")
-                continue
-
-            content = doc_file.read_text(encoding='utf-8')
-
-            # Parse frontmatter
-            parsed = parse_frontmatter(
-                content,
-                allow_slashes_in_name=allow_slashes_in_name,
-                parse_arguments=parse_arguments
-            )
-
-            documents[parsed.name] = (parsed, str(doc_file))
+    # Top-level directory only unless recursive (symlinks are never followed)
+    with profiler.stage(f"scan:{document_type}") if profiler is not None else nullcontext():
+        scanned = scan_document_files(dir_path, file_extensions, recursive=recursive)
+
+    if profiler is not None:
+        # Phase timings cannot be collected from a process pool
+        use_processes = False
+
+    def load(item: tuple[Path, os.stat_result, str | None]) -> ParsedDocument | None:
+        doc_file, file_stat, namespace = item
+        timer = NULL_TIMER
+        if profiler is not None:
+            timer = profiler.file(doc_file, document_type)
+            timer.size = file_stat.st_size
+
+        parsed = load_document_file(
+            doc_file,
+            dir_path,
+            allow_slashes_in_name=allow_slashes_in_name,
+            max_file_size=max_file_size,
+            parse_arguments=parse_arguments,
+            cache=cache,
+            header_only=header_only,
+            namespace=namespace,
+            file_stat=file_stat,
+            timer=timer
+        )
+
+        if parsed is not None and timer is not NULL_TIMER:
+            timer.name = parsed.name
+            timer.loaded = True
+        return parsed
+
+    if workers <= 1 or len(scanned) <= 1:
+        results = [load(item) for item in scanned]
+    elif use_processes:
+        results = _parse_in_processes(
+            scanned, dir_path, allow_slashes_in_name, max_file_size, parse_arguments, cache, workers, header_only
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(load, scanned))
 
-        except (ValueError, OSError) as e:
-            sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
-            logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
-            continue
-        except Exception as e:
-            sanitized_path = sanitize_path_for_logging(doc_file, dir_path)
-            logger.warning(f"Failed to load {sanitized_path}: {str(e)}")
-            continue
+    # Insert in listing order so the last duplicate wins, as with serial loading
+    documents = {}
+    for (doc_file, _, _), parsed in zip(scanned, results):
+        if parsed is not None:
+            documents[parsed.name] = (parsed, intern_path(doc_file))
 
     if not documents:
         logger.info(f"No valid {document_type} files found in {sanitize_path_for_logging(dir_path, dir_path.parent)}")
 
-    return documents
\ No newline at end of file
+    return documents
@@ -0,0 +1,168 @@
+"""
+Content Version Module
+
+Gives every prompt and resource a content hash so clients can tell whether
+a document changed without downloading it again.
+
+The hash is computed once when a document is registered (so it follows hot
+reloads and include expansion) and is reported as `_meta.contentHash` in
+prompts/list, resources/list, prompts/get and resources/read. A client that
+kept the hash from an earlier session can then ask the server to send the
+body only if it no longer matches (see the get_if_changed tool).
+
+Eagerly loaded bodies get a strong hash of their text. Lazily loaded bodies
+are not read at startup, so they get a weak hash (prefixed "W/", as for HTTP
+ETags) of their location, size and modification time instead; it changes
+whenever the file does, but may also change when the text did not. The
+location is taken relative to the catalog directory, so the same file
+hashes the same from another checkout or mount point. Bodies
+compressed in memory keep the strong hash of their text, computed before
+compression.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from urllib.parse import unquote
+
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+
+from .utils import ParsedDocument
+from .compression import CompressedBody, BODY_DIGEST_SIZE
+from .completions import uri_path
+
+META_KEY = "contentHash"
+
+# 128-bit digests: plenty to tell versions of a document apart
+HASH_DIGEST_SIZE = BODY_DIGEST_SIZE
+
+
+def content_hash(parsed: ParsedDocument, roots: tuple[Path, ...] = ()) -> str:
+    """
+    Return the content hash (ETag) of a document's body.
+
+    Args:
+        parsed: The document as registered
+        roots: Resolved catalog directories; a lazily loaded body's file is
+            hashed by its path relative to the one containing it
+    """
+    ref = parsed.body_ref
+    if ref is None:
+        return hashlib.blake2b(parsed.content.encode('utf-8'), digest_size=HASH_DIGEST_SIZE).hexdigest()
+    if isinstance(ref, CompressedBody):
+        # Hashed from the text when it was compressed
+        return ref.digest
+    location = f"{_catalog_path(ref.path, roots)}\0{ref.offset}\0{ref.length}\0{ref.file_size}\0{ref.mtime_ns}"
+    return "W/" + hashlib.blake2b(location.encode('utf-8'), digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+
+def _catalog_path(path: str, roots: tuple[Path, ...]) -> str:
+    """Return path relative to the catalog directory containing it (just the file name if none does)."""
+    file_path = Path(path)
+    for root in roots:
+        if file_path.is_relative_to(root):
+            return file_path.relative_to(root).as_posix()
+    # E.g. a compiled bundle
+    return file_path.name
+
+
+def _registered_uri(uri: str) -> str:
+    """Return the URI a resource is registered under, for one read through the resource://{name} template."""
+    prefix = "resource://"
+    if not uri.startswith(prefix):
+        return uri
+    return prefix + uri_path(unquote(uri[len(prefix):]))
+
+
+class ContentVersions:
+    """
+    Content hashes of the registered prompts (by name) and resources (by URI).
+
+    Thread-safe, so the watcher thread can update hashes while requests are
+    served.
+
+    Args:
+        roots: Catalog directories, so weak hashes do not depend on where
+            the catalog is checked out
+    """
+
+    def __init__(self, roots: list[Path] | None = None):
+        # Deepest first, in case one catalog directory contains another
+        self.roots = tuple(sorted((root.resolve() for root in roots or ()), key=lambda root: len(root.parts), reverse=True))
+        self._prompts: dict[str, str] = {}
+        self._resources: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def set_prompt(self, name: str, parsed: ParsedDocument) -> str:
+        """Record the hash of a (re-)registered prompt and return it."""
+        digest = content_hash(parsed, self.roots)
+        with self._lock:
+            self._prompts[name] = digest
+        return digest
+
+    def set_resource(self, uri: str, parsed: ParsedDocument) -> str:
+        """Record the hash of a (re-)registered resource and return it."""
+        digest = content_hash(parsed, self.roots)
+        with self._lock:
+            self._resources[uri] = digest
+        return digest
+
+    def remove_prompt(self, name: str) -> None:
+        with self._lock:
+            self._prompts.pop(name, None)
+
+    def remove_resource(self, uri: str) -> None:
+        with self._lock:
+            self._resources.pop(uri, None)
+
+    def prompt(self, name: str) -> str | None:
+        """Return the hash of a registered prompt, or None."""
+        return self._prompts.get(name)
+
+    def resource(self, uri: str) -> str | None:
+        """Return the hash of a registered resource, or None."""
+        return self._resources.get(uri)
+
+    def install(self, mcp: FastMCP) -> None:
+        """
+        Add content hashes to list, get and read results.
+
+        Wraps the server's request handlers, so call it after any handler is
+        replaced (e.g. install_resource_sizes) and before SessionTracker.
+        """
+        handlers = mcp._mcp_server.request_handlers
+
+        def wrap(request_type, annotate):
+            handler = handlers[request_type]
+
+            async def versioned_handler(request):
+                result = await handler(request)
+                annotate(request, result.root)
+                return result
+
+            handlers[request_type] = versioned_handler
+
+        def annotate_prompts(request, result: types.ListPromptsResult) -> None:
+            for prompt in result.prompts:
+                _set_meta(prompt, self.prompt(prompt.name))
+
+        def annotate_resources(request, result: types.ListResourcesResult) -> None:
+            for resource in result.resources:
+                _set_meta(resource, self.resource(str(resource.uri)))
+
+        def annotate_get(request, result: types.GetPromptResult) -> None:
+            _set_meta(result, self.prompt(request.params.name))
+
+        def annotate_read(request, result: types.ReadResourceResult) -> None:
+            _set_meta(result, self.resource(_registered_uri(str(request.params.uri))))
+
+        wrap(types.ListPromptsRequest, annotate_prompts)
+        wrap(types.ListResourcesRequest, annotate_resources)
+        wrap(types.GetPromptRequest, annotate_get)
+        wrap(types.ReadResourceRequest, annotate_read)
+
+
+def _set_meta(item, digest: str | None) -> None:
+    if digest is not None:
+        item.meta = {**(item.meta or {}), META_KEY: digest}
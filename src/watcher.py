@@ -0,0 +1,326 @@
+"""
+Directory Watching Module
+
+Watches catalog directories for added, modified and removed documents and
+reports the changed file paths in debounced batches.
+
+Uses Linux inotify (via ctypes, no extra dependencies) when available and
+falls back to polling file mtime/size snapshots everywhere else.
+"""
+
+import os
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 1.0  # Seconds between polling snapshots
+DEFAULT_DEBOUNCE = 0.2  # Seconds to coalesce bursts of events (e.g. editor saves)
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _subdirectories(directory: Path) -> list[Path]:
+    """List non-hidden, non-symlink subdirectories (same rules as the loader)."""
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(Path(entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirectories
+
+
+def snapshot_directory(
+    directory: Path,
+    file_extensions: list[str],
+    recursive: bool = False
+) -> dict[Path, tuple[int, int]]:
+    """
+    Take a (mtime_ns, size) snapshot of matching files in a directory.
+
+    Symlinks are included (using lstat) so the loader can report them.
+
+    Args:
+        directory: The directory to scan
+        file_extensions: List of file extensions to include
+        recursive: Whether to include non-hidden subdirectories
+
+    Returns:
+        Dict mapping file path to (mtime_ns, size)
+    """
+    snapshot = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not any(entry.name.endswith(ext) for ext in file_extensions):
+                    continue
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        pass
+
+    if recursive:
+        for subdirectory in _subdirectories(directory):
+            snapshot.update(snapshot_directory(subdirectory, file_extensions, recursive=True))
+
+    return snapshot
+
+
+def diff_snapshots(
+    old: dict[Path, tuple[int, int]],
+    new: dict[Path, tuple[int, int]]
+) -> set[Path]:
+    """Return paths that were added, removed or changed between two snapshots."""
+    changed = {path for path, sig in new.items() if old.get(path) != sig}
+    changed.update(path for path in old if path not in new)
+    return changed
+
+
+class _Inotify:
+    """Minimal ctypes wrapper around the Linux inotify API."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+
+        self.fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self.watches: dict[int, Path] = {}
+
+    def add_watch(self, directory: Path) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches[wd] = directory
+
+    def read_events(self, timeout: float) -> list[tuple[Path, int, str]]:
+        """Wait up to timeout seconds and return (directory, mask, name) events."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+            events.append((self.watches.get(wd), mask, name))
+            if mask & IN_IGNORED:
+                # The kernel removed this watch (directory deleted or moved)
+                self.watches.pop(wd, None)
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class DirectoryWatcher:
+    """
+    Watch directories and report changed document paths.
+
+    The callback receives the set of file paths (matching file_extensions)
+    that were created, modified, moved or deleted since the last batch.
+    It runs on the watcher's background thread.
+
+    With recursive=True, non-hidden subdirectories are watched as well,
+    including ones created while watching.
+    """
+
+    def __init__(
+        self,
+        directories: list[Path],
+        file_extensions: list[str],
+        on_change: Callable[[set[Path]], None],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        use_inotify: bool = True,
+        recursive: bool = False
+    ):
+        self.directories = [d.resolve() for d in directories]
+        self.file_extensions = file_extensions
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.recursive = recursive
+        self.mode: str | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start watching on a daemon thread."""
+        inotify = None
+        if self.use_inotify:
+            try:
+                inotify = _Inotify()
+                for directory in self.directories:
+                    self._add_watches(inotify, directory)
+            except (OSError, AttributeError) as e:
+                logger.info(f"inotify unavailable ({e}), falling back to polling")
+                if inotify is not None:
+                    inotify.close()
+                inotify = None
+
+        if inotify is not None:
+            self.mode = "inotify"
+            target, args = self._run_inotify, (inotify,)
+        else:
+            self.mode = "polling"
+            target, args = self._run_polling, ()
+
+        self._thread = threading.Thread(target=target, args=args, name="catalog-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {len(self.directories)} directories for changes ({self.mode})")
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _emit(self, changed: set[Path]) -> None:
+        if not changed:
+            return
+        try:
+            self.on_change(changed)
+        except Exception as e:
+            logger.warning(f"Failed to apply catalog changes: {e}")
+
+    def _add_watches(self, inotify: _Inotify, directory: Path) -> None:
+        inotify.add_watch(directory)
+        if self.recursive:
+            for subdirectory in _subdirectories(directory):
+                self._add_watches(inotify, subdirectory)
+
+    def _matches(self, name: str) -> bool:
+        return any(name.endswith(ext) for ext in self.file_extensions)
+
+    def _snapshot_all(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for directory in self.directories:
+            snapshot.update(snapshot_directory(directory, self.file_extensions, recursive=self.recursive))
+        return snapshot
+
+    def _run_polling(self) -> None:
+        previous = self._snapshot_all()
+        while not self._stop.wait(self.poll_interval):
+            current = self._snapshot_all()
+            self._emit(diff_snapshots(previous, current))
+            previous = current
+
+    def _run_inotify(self, inotify: _Inotify) -> None:
+        # Files seen so far, so a rescan can also report deletions
+        known = set(self._snapshot_all())
+        try:
+            while not self._stop.is_set():
+                events = inotify.read_events(timeout=0.5)
+                if not events:
+                    continue
+
+                # Coalesce bursts (write + close + attrib) into one batch
+                deadline = time.monotonic() + self.debounce
+                while (remaining := deadline - time.monotonic()) > 0:
+                    events.extend(inotify.read_events(timeout=remaining))
+
+                changed = set()
+                rescan = False
+                for directory, mask, name in events:
+                    if mask & IN_Q_OVERFLOW:
+                        rescan = True
+                        continue
+                    if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                        # Subdirectories are handled via their parent's events
+                        if directory in self.directories:
+                            rescan = True
+                        continue
+                    if directory is None:
+                        continue
+
+                    path = directory / name
+                    if mask & IN_ISDIR:
+                        if not self.recursive or name.startswith('.'):
+                            continue
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            # Watch the new subdirectory and pick up files already in it
+                            try:
+                                self._add_watches(inotify, path)
+                            except OSError as e:
+                                logger.warning(f"Failed to watch new directory: {e}")
+                            changed.update(snapshot_directory(path, self.file_extensions, recursive=True))
+                        elif mask & (IN_DELETE | IN_MOVED_FROM):
+                            changed.update(p for p in known if p.is_relative_to(path))
+                        continue
+
+                    if self._matches(name):
+                        changed.add(path)
+
+                if rescan:
+                    # Event queue overflowed or a watched directory moved;
+                    # report every known file so the caller re-validates
+                    logger.warning("Watch queue overflow or directory moved, rescanning catalog")
+                    current = set(self._snapshot_all())
+                    changed.update(known | current)
+                    known = current
+                else:
+                    for path in changed:
+                        if os.path.lexists(path):
+                            known.add(path)
+                        else:
+                            known.discard(path)
+
+                self._emit(changed)
+        finally:
+            inotify.close()
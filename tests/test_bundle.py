@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from src.bundle import compile_bundle, load_bundle
+
+
+def write_prompt(prompts_dir: Path) -> None:
+    prompts_dir.mkdir(parents=True)
+    (prompts_dir / "greet.md").write_text(
+        "---\n"
+        "name: greet\n"
+        "description: Greets someone\n"
+        "arguments:\n"
+        "  - name: who_is\n"
+        "    suggestions: [world, team]\n"
+        "---\n"
+        "Hello {who_is}\n",
+        encoding="utf-8"
+    )
+
+
+def test_bundle_round_trip(tmp_path):
+    write_prompt(tmp_path / "prompts")
+    bundle = tmp_path / "catalog.bundle"
+    assert compile_bundle(tmp_path / "prompts", tmp_path / "resources", bundle) == 0
+
+    prompts, resources = load_bundle(bundle)
+    parsed, _ = prompts["greet"]
+    assert parsed.content == "Hello {who_is}\n"
+    assert [(arg.name, arg.suggestions) for arg in parsed.arguments] == [("who_is", ("world", "team"))]
+    assert resources == {}
+
+
+def test_bundle_with_invalid_argument_name_is_rejected(tmp_path):
+    write_prompt(tmp_path / "prompts")
+    bundle = tmp_path / "catalog.bundle"
+    assert compile_bundle(tmp_path / "prompts", tmp_path / "resources", bundle) == 0
+
+    # Same length, so every offset stays valid; only the name is bad
+    data = bundle.read_bytes()
+    assert data.count(b"who_is") == 2  # argument name and body placeholder
+    bundle.write_bytes(data.replace(b"who_is", b"who-is", 1))
+
+    with pytest.raises(ValueError, match="Bundle is corrupt"):
+        load_bundle(bundle)
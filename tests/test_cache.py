@@ -0,0 +1,58 @@
+from src.bodies import read_body
+from src.cache import DocumentCache
+from src.prompts import load_markdown_prompts
+
+
+def body_of(parsed) -> str:
+    return parsed.content if parsed.body_ref is None else read_body(parsed.body_ref)
+
+
+def test_cache_survives_toggling_lazy_bodies(tmp_path):
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    (prompts_dir / "greet.md").write_text(
+        "---\nname: greet\ndescription: Greets someone\n---\nHello there\nsecond line\n",
+        encoding="utf-8"
+    )
+    cache_file = tmp_path / "cache.json"
+
+    for header_only in (False, True, False, True):
+        cache = DocumentCache(cache_file)
+        cache.load()
+        prompts = load_markdown_prompts(prompts_dir, cache=cache, header_only=header_only)
+        cache.save()
+
+        parsed, _ = prompts["greet"]
+        assert parsed.description == "Greets someone"
+        assert (parsed.body_ref is not None) == header_only
+        assert body_of(parsed) == "Hello there\nsecond line\n"
+
+    # Repeating the last mode hits the cache
+    cache = DocumentCache(cache_file)
+    cache.load()
+    prompts = load_markdown_prompts(prompts_dir, cache=cache, header_only=True)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert body_of(prompts["greet"][0]) == "Hello there\nsecond line\n"
+
+
+def test_cache_entry_with_bad_body_offset_is_a_miss(tmp_path):
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    (prompts_dir / "greet.md").write_text(
+        "---\nname: greet\ndescription: Greets someone\n---\nHello\n",
+        encoding="utf-8"
+    )
+    cache_file = tmp_path / "cache.json"
+    cache = DocumentCache(cache_file)
+    load_markdown_prompts(prompts_dir, cache=cache)
+    cache.save()
+
+    for body_offset in (-3, 10_000, "4", True):
+        cache = DocumentCache(cache_file)
+        cache.load()
+        (entry,) = cache.entries.values()
+        entry['body_offset'] = body_offset
+
+        prompts = load_markdown_prompts(prompts_dir, cache=cache)
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert prompts["greet"][0].content == "Hello\n"
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from src.catalogs import Catalog, load_catalog, merge_catalogs
+from src.includes import IncludeResolver
+from src.prompts import load_markdown_prompts
+from src.resources import load_resource_documents
+from src.utils import ParsedDocument
+
+
+def write_document(path: Path, name: str, body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nname: {name}\ndescription: Test document\n---\n{body}", encoding="utf-8")
+
+
+def resolve(catalogs: list[Catalog]) -> tuple[IncludeResolver, dict, dict]:
+    namespaces = {
+        (kind, name): catalog.namespace
+        for catalog in catalogs
+        for kind, documents in (("prompt", catalog.prompts), ("resource", catalog.resources))
+        for name in documents
+    }
+    resolver = IncludeResolver()
+    prompts, resources = resolver.resolve_all(
+        merge_catalogs(catalogs, "prompt"), merge_catalogs(catalogs, "resource"), namespaces
+    )
+    return resolver, prompts, resources
+
+
+def test_includes_resolve_within_each_catalog(tmp_path):
+    write_document(tmp_path / "root" / "prompts" / "use.md", "use", "root uses {{include: shared}}")
+    write_document(tmp_path / "root" / "resources" / "shared.md", "shared", "ROOT SHARED")
+    write_document(tmp_path / "team" / "prompts" / "use.md", "use", "team uses {{include: shared}}")
+    write_document(tmp_path / "team" / "resources" / "shared.md", "shared", "TEAM SHARED")
+
+    root = Catalog(
+        None, tmp_path / "root" / "prompts", tmp_path / "root" / "resources",
+        load_markdown_prompts(tmp_path / "root" / "prompts"),
+        load_resource_documents(tmp_path / "root" / "resources")
+    )
+    team = load_catalog("team", tmp_path / "team")
+    resolver, prompts, resources = resolve([root, team])
+
+    assert prompts["use"][0].content == "root uses ROOT SHARED"
+    assert prompts["team:use"][0].content == "team uses TEAM SHARED"
+
+    # Changing or removing the root resource leaves the team prompt alone
+    register, unregister = resolver.update(
+        "resource", "shared", ParsedDocument(name="shared", description="d", content="NEW ROOT")
+    )
+    assert [(kind, name) for kind, name, _ in register] == [("prompt", "use"), ("resource", "shared")]
+    assert unregister == []
+
+    register, unregister = resolver.update("resource", "shared", None)
+    assert register == []
+    assert sorted(unregister) == [("prompt", "use"), ("resource", "shared")]
+
+
+def test_mounted_include_does_not_fall_back_to_root_catalog(tmp_path):
+    write_document(tmp_path / "root" / "resources" / "shared.md", "shared", "ROOT SHARED")
+    write_document(tmp_path / "team" / "prompts" / "use.md", "use", "team uses {{include: shared}}")
+
+    root = Catalog(
+        None, tmp_path / "root" / "prompts", tmp_path / "root" / "resources",
+        {}, load_resource_documents(tmp_path / "root" / "resources")
+    )
+    team = load_catalog("team", tmp_path / "team")
+    resolver, prompts, resources = resolve([root, team])
+
+    assert "team:use" not in prompts
+    assert ("prompt", "team:use") in resolver.unresolved
+
+    # The team's own shared resource resolves it
+    register, unregister = resolver.update(
+        "resource", "team:shared", ParsedDocument(name="team:shared", description="d", content="TEAM"),
+        namespace="team"
+    )
+    assert dict(((kind, name), doc.content) for kind, name, doc in register)[("prompt", "team:use")] == "team uses TEAM"
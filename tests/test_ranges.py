@@ -0,0 +1,43 @@
+from src.bodies import BodyStore
+from src.ranges import DocumentResource
+from src.utils import BodyRef
+
+
+def lazy_resource(tmp_path, body: bytes, store: BodyStore) -> DocumentResource:
+    header = b"---\nname: doc\ndescription: A document\n---\n"
+    path = tmp_path / "doc.md"
+    path.write_bytes(header + body)
+    stat = path.stat()
+    ref = BodyRef(
+        path=str(path), offset=len(header), length=len(body), file_size=stat.st_size, mtime_ns=stat.st_mtime_ns
+    )
+    resource = DocumentResource.from_function(lambda: store.get(ref), uri="resource://doc", name="doc")
+    resource.size = ref.length
+    resource.set_text_source(lambda: store.get(ref), body_ref=ref, body_store=store)
+    return resource
+
+
+def test_line_index_is_cached_without_a_second_copy_of_the_body(tmp_path):
+    store = BodyStore()
+    body = b"".join(b"line %d\n" % i for i in range(1, 101))
+    resource = lazy_resource(tmp_path, body, store)
+
+    page = resource.read_lines(10, 5)
+    assert page["text"] == "line 10\nline 11\nline 12\nline 13\nline 14\n"
+    assert page["next_start_line"] == 15
+
+    entries = {kind: value for (_, kind), (value, _) in store._entries.items()}
+    assert isinstance(entries["text"], str)
+    # The line index holds only offsets and is charged for them, not the body again
+    line_starts, _ = entries["lines"]
+    assert store.current_bytes == len(body) + len(line_starts) * line_starts.itemsize
+
+
+def test_size_is_the_served_size_with_and_without_lazy_bodies(tmp_path):
+    store = BodyStore()
+    resource = lazy_resource(tmp_path, b"first\r\nsecond\r\n", store)
+    eager = DocumentResource.from_function(lambda: "first\nsecond\n", uri="resource://eager", name="eager")
+    eager.size = len("first\nsecond\n".encode('utf-8'))
+
+    assert resource.read_lines()["size"] == eager.read_lines()["size"] == 13
+    assert resource.size == eager.size == 13
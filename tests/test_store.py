@@ -0,0 +1,19 @@
+from src.compression import BodyCodec
+from src.store import ContentStore
+from src.utils import ParsedDocument
+
+
+def test_documents_with_the_same_compressed_body_share_one_body_ref():
+    codec = BodyCodec("zlib")
+    body = "Shared boilerplate line.\n" * 40
+    first = codec.compress_document(ParsedDocument(name="a", description="d", content=body), "/one/a.md")
+    second = codec.compress_document(ParsedDocument(name="team:a", description="d", content=body), "/two/a.md")
+    assert first.body_ref is not second.body_ref
+
+    store = ContentStore()
+    store.share("resource", "a", first)
+    store.share("resource", "team:a", second)
+
+    assert second.body_ref is first.body_ref
+    assert second.body_ref.read() == body
+    assert store.stats()["unique_bodies"] == 1
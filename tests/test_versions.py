@@ -0,0 +1,34 @@
+import os
+import shutil
+
+from src.utils import BodyRef, ParsedDocument
+from src.versions import ContentVersions, _registered_uri
+
+
+def lazy_document(path) -> ParsedDocument:
+    stat = path.stat()
+    ref = BodyRef(
+        path=str(path.resolve()), offset=4, length=stat.st_size - 4, file_size=stat.st_size, mtime_ns=stat.st_mtime_ns
+    )
+    return ParsedDocument(name="doc", description="d", content="", body_ref=ref)
+
+
+def test_weak_hash_does_not_depend_on_the_checkout_location(tmp_path):
+    first = tmp_path / "one" / "resources"
+    first.mkdir(parents=True)
+    (first / "doc.md").write_text("---\nbody\n", encoding="utf-8")
+    second = tmp_path / "two" / "resources"
+    shutil.copytree(first, second)
+    stat = (first / "doc.md").stat()
+    os.utime(second / "doc.md", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    one = ContentVersions(roots=[first]).set_resource("resource://doc", lazy_document(first / "doc.md"))
+    two = ContentVersions(roots=[second]).set_resource("resource://doc", lazy_document(second / "doc.md"))
+    assert one.startswith("W/")
+    assert one == two
+
+
+def test_template_reads_are_annotated_with_the_registered_hash():
+    assert _registered_uri("resource://prompt%2Ftemplate") == "resource://prompt/template"
+    assert _registered_uri("resource://prompt%3Atemplate") == "resource://prompt/template"
+    assert _registered_uri("resource://prompt/template") == "resource://prompt/template"